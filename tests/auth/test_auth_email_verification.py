@@ -1,15 +1,15 @@
 import datetime
 import pytest
-import requests
+from tests.utils import http_client
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from tests.utils.auth_flows import make_unique_username, fill_and_submit_signup, login, logout, assert_logged_in, assert_no_verify_error, new_chrome_like_fixture
 from tests.utils.email_verification import fetch_verify_url_from_mailhog
 from tests.utils.mailhog_client import wait_for_email, extract_plain_html
+from tests.pages.auth import RESEND_BTN
 
 SUBJECT = "NORI Email Verification"
-RESEND_BTN = (By.CSS_SELECTOR, "[data-testid='resend-verification-btn']")
 
 @pytest.mark.tcid("TC-AUTH-011")
 @pytest.mark.auth
@@ -47,7 +47,7 @@ def test_verification_link_expired(driver, base_url, test1_email, test1_password
 
     verify_url = fetch_verify_url_from_mailhog(test1_email, SUBJECT, timeout_s=10)
 
-    r = requests.post(
+    r = http_client.post(
         f"{base_url}/api/auth/verify/expiry",
         json={"email": test1_email, "minutesOffset": -5},
         timeout=5,
@@ -62,7 +62,7 @@ def test_verification_link_expired(driver, base_url, test1_email, test1_password
         message="Expected an expired verification message but none appeared."
     )
 
-    r = requests.get(f"{base_url}/api/auth/verify", params={"email": test1_email}, timeout=5)
+    r = http_client.get(f"{base_url}/api/auth/verify", params={"email": test1_email}, timeout=5)
     r.raise_for_status()
     assert r.json().get("isVerified") is False, "Account should remain unverified for expired token"
 
@@ -152,7 +152,7 @@ def test_account_activation_via_email_link(driver, base_url, test1_email, test1_
     )
     
     # Assert DB state
-    r = requests.get(f"{base_url}/api/auth/verify", params={"email": test1_email}, timeout=5)
+    r = http_client.get(f"{base_url}/api/auth/verify", params={"email": test1_email}, timeout=5)
     r.raise_for_status()
     assert r.json().get("isVerified") is True, "Account is not verified in DB"
 
@@ -185,7 +185,7 @@ def test_verification_link_is_one_time_use(driver, base_url, test1_email, test1_
 
 @pytest.mark.tcid("TC-AUTH-018")
 @pytest.mark.auth
-def test_account_activation_status_persists(driver, base_url, admin_email, admin_password):
+def test_account_activation_status_persists(driver, base_url, admin_email, admin_password, chromedriver_path):
     """Verify that verified status persists across logout/login and a fresh browser session."""
 
     # Login (session A)
@@ -200,7 +200,7 @@ def test_account_activation_status_persists(driver, base_url, admin_email, admin
     assert_no_verify_error(driver)
     
     # Open a fresh browser - activation status should persist
-    fresh_browser = new_chrome_like_fixture()
+    fresh_browser = new_chrome_like_fixture(chromedriver_path)
     try:
         login(fresh_browser, base_url, admin_email, admin_password)
         assert_logged_in(driver, base_url)
@@ -1,15 +1,11 @@
 import datetime
 import pytest
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from tests.utils.auth_flows import login, fill_and_submit_signup, make_unique_username, assert_no_sensitive_data_in_storage
 from tests.utils.mailhog_client import wait_for_email
+from tests.pages.auth import LOGIN_ERR, LOGIN_SUBMIT, NAV_HELLO, RESEND_BTN
 
-LOGIN_BTN = (By.XPATH, '//button[text()="Log In"]')
-LOGIN_ERR = (By.CSS_SELECTOR, "[data-testid='credentials-error']")
-NAV_HELLO = (By.CSS_SELECTOR, "[data-testid='nav-hello']")
-RESEND_BTN = (By.CSS_SELECTOR, "[data-testid='resend-verification-btn']")
 SUBJECT = "NORI Email Verification"
     
 @pytest.mark.tcid("TC-AUTH-020")
@@ -95,7 +91,7 @@ def test_lockout_msg(driver, base_url):
 
         else:
             # 5th failed attempt - lockout & login button disabled
-            login_btn = driver.find_element(*LOGIN_BTN)
+            login_btn = driver.find_element(*LOGIN_SUBMIT)
             assert login_btn.is_enabled() is False, "Login button should be disabled after 5 failed attempts"
             assert "Please try again later" in error_msg.text, "Missing 'Please try again later' on 5th failure."
             assert "Remaining lockout time" in error_msg.text, "Missing 'Remaining lockout time' on 5th failure."
@@ -3,15 +3,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from tests.utils.auth_flows import fill_signup_form, fill_and_submit_signup, make_unique_username
+from tests.pages.auth import CONFIRM_PW, CONFIRM_PW_ERR, EMAIL, EMAIL_ERR, PASSWORD, SIGNUP_BTN, USERNAME, USERNAME_FB
 
-SIGNUP_BTN = (By.XPATH, '//button[text()="Sign Up"]')
-USERNAME = (By.XPATH, "//input[@placeholder='Username']")
-USERNAME_FB = (By.CSS_SELECTOR, "[data-testid='username-feedback']")
-EMAIL = (By.XPATH, "//input[@placeholder='Email']")
-PASSWORD = (By.XPATH, "//input[@placeholder='Password']")
-CONFIRM_PW = (By.XPATH, "//input[@placeholder='Confirm Password']")
-CONFIRM_PW_ERR = (By.CSS_SELECTOR, "[data-testid='confirm-pw-error']")
-EMAIL_ERR = (By.CSS_SELECTOR, "[data-testid='email-feedback']")
 
 @pytest.mark.tcid("TC-AUTH-001")
 @pytest.mark.auth
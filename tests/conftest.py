@@ -1,10 +1,29 @@
+import json
 import uuid
+from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.safari.webdriver import WebDriver as SafariDriver
 from dotenv import load_dotenv
+from tests.utils import http_client
+from tests.utils.api_bench import load_baseline, merge_baseline
+from tests.utils.auth_flows import enable_fast_login
+from tests.utils.browser_profile import PAGE_LOAD_STRATEGIES, PROFILES, apply_profile, chrome_options
+from tests.utils.driver_cache import resolve_chromedriver
+from tests.utils.driver_pool import DriverPool
+from tests.utils import mailhog_client
+from tests.utils.network_observer import enable_network_observer, network_observer_enabled, reset_observer
+from tests.utils.mailhog_stream import start_local_feed, start_mail_feed, stop_mail_feed
+from tests.standin.mailhog import start_local_mailhog
+from tests.standin.server import start_local_server
+from tests.utils.perf_trace import enable_tracing, tracing_enabled
+from tests.utils.polling import polling_summary
+from tests.utils.scheduler import group_by_state
+from tests.utils.study_state import StudyStateTracker, set_active_tracker
+from tests.utils.step_timing import enable_step_timing, recorded_steps, set_current_test, write_report
+from tests.utils.word_catalog import catalog_for
+from tests.utils.worker_accounts import current_worker_id, ensure_verified_account, worker_credentials
 import pytest
 import os
 
@@ -17,34 +36,319 @@ def pytest_addoption(parser):
         default="chrome",
         help="Browser to run tests on (chrome or safari)"
     )
-    
-@pytest.fixture
-def driver(request):
-    browser = request.config.getoption("--browser")
+    parser.addoption(
+        "--browser-profile",
+        action="store",
+        default="default",
+        choices=PROFILES,
+        help="default: visible, fully rendered browser; lean: headless with images, fonts and analytics blocked"
+    )
+    parser.addoption(
+        "--page-load-strategy",
+        action="store",
+        default=None,
+        choices=PAGE_LOAD_STRATEGIES,
+        help="WebDriver page load strategy (default: normal, or eager for the lean profile)"
+    )
+    parser.addoption(
+        "--reuse-browser",
+        action="store_true",
+        default=False,
+        help="Keep browsers alive for the session (per worker) and reset them between tests"
+    )
+    parser.addoption(
+        "--driver-cache-dir",
+        action="store",
+        default=None,
+        help="Directory holding the cached chromedriver binary and its manifest"
+    )
+    parser.addoption(
+        "--offline-driver",
+        action="store_true",
+        default=os.getenv("CHROMEDRIVER_OFFLINE") == "1",
+        help="Never download chromedriver; load it from the pre-seeded driver cache directory"
+    )
+    parser.addoption(
+        "--fast-login",
+        action="store_true",
+        default=False,
+        help="Log in through the API and inject the token cookie, except in tests covering the login form"
+    )
+    parser.addoption(
+        "--mailhog-stream",
+        action="store_true",
+        default=False,
+        help="Receive MailHog messages through its live websocket feed instead of polling the search API"
+    )
+    parser.addoption(
+        "--step-timing",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Record per-step durations of the flow helpers and write them, ranked, to a JSON report"
+    )
+    parser.addoption(
+        "--perf-trace",
+        action="store",
+        default=None,
+        metavar="DIR",
+        help="Save a Chrome performance trace of level selection, card advances and review-mode entry per test under DIR"
+    )
+    parser.addoption(
+        "--perf-runs",
+        action="store",
+        type=int,
+        default=5,
+        help="How many times nfr tests repeat each measurement before computing percentiles"
+    )
+    parser.addoption(
+        "--perf-budgets",
+        action="store",
+        default=str(Path(__file__).parent / "nfr" / "page_budgets.json"),
+        help="JSON file with p95 page-load budgets in milliseconds"
+    )
+    parser.addoption(
+        "--api-bench-runs",
+        action="store",
+        type=int,
+        default=50,
+        help="Timed requests per endpoint in the API latency benchmark"
+    )
+    parser.addoption(
+        "--api-baseline",
+        action="store",
+        default=str(Path(__file__).parent / "nfr" / "api_latency_baseline.json"),
+        help="JSON file with the stored API latency baseline"
+    )
+    parser.addoption(
+        "--api-latency-tolerance",
+        action="store",
+        type=float,
+        default=0.25,
+        help="Allowed relative p50/p95 regression against the baseline (0.25 = 25%%)"
+    )
+    parser.addoption(
+        "--api-latency-slack-ms",
+        action="store",
+        type=float,
+        default=10.0,
+        help="Absolute milliseconds allowed on top of the relative tolerance"
+    )
+    parser.addoption(
+        "--run-api-bench",
+        action="store_true",
+        default=False,
+        help="Run the API latency benchmarks (TC-NFR-007..011); skipped otherwise"
+    )
+    parser.addoption(
+        "--update-api-baseline",
+        action="store_true",
+        default=False,
+        help="Overwrite the API latency baseline with this run's measurements instead of comparing"
+    )
+    parser.addoption(
+        "--run-load",
+        action="store_true",
+        default=False,
+        help="Run the load test (TC-NFR-012) with the LOAD_ACCOUNTS pool; skipped otherwise"
+    )
+    parser.addoption(
+        "--load-stages",
+        action="store",
+        default="5:10",
+        help="Virtual-user ramp schedule for the load test, target_users:ramp_seconds,..."
+    )
+    parser.addoption(
+        "--load-hold",
+        action="store",
+        type=float,
+        default=20,
+        help="Seconds the load test holds its last stage"
+    )
+    parser.addoption(
+        "--load-max-error-rate",
+        action="store",
+        type=float,
+        default=0.01,
+        help="Highest error rate the load test accepts"
+    )
+    parser.addoption(
+        "--nfr-report",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="Write the percentiles measured by nfr tests to a JSON file"
+    )
+    parser.addoption(
+        "--local-server",
+        action="store_true",
+        default=False,
+        help="Run against an in-process stand-in of NORI (tests/standin) instead of NORI_BASE_URL"
+    )
+    parser.addoption(
+        "--local-mailhog",
+        action="store_true",
+        default=False,
+        help="Capture mail with an in-process MailHog stand-in (SMTP + /api/v2) instead of MAILHOG_API"
+    )
+    parser.addoption(
+        "--track-study-state",
+        action="store_true",
+        default=False,
+        help="Reset only the study progress tests dirtied, in one batch at teardown, instead of before every *_with_level_reset flow"
+    )
+    parser.addoption(
+        "--group-by-state",
+        action="store_true",
+        default=False,
+        help="Run tests that share an account, study type and level back to back (and on one worker with --dist loadgroup)"
+    )
+    parser.addoption(
+        "--network-observer",
+        action="store_true",
+        default=False,
+        help="Wait on the browser's own study-progress writes (Chrome performance log) before polling the API"
+    )
+    parser.addoption(
+        "--harness-stats",
+        action="store_true",
+        default=False,
+        help="Print per-endpoint API latency counters of the test harness at the end of the session"
+    )
 
-    if browser == "chrome":
-        options = ChromeOptions()
-        #options.add_argument("--headless=new")
-        options.add_argument("--window-size=1366,900")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
+def pytest_configure(config):
+    enable_fast_login(config.getoption("--fast-login"))
+    config._harness_stats = {}
+    config._step_records = []
+    config._api_baseline_updates = {}
+    enable_step_timing(bool(config.getoption("--step-timing")))
+    enable_network_observer(config.getoption("--network-observer"))
+    enable_tracing(config.getoption("--perf-trace"))
 
-        driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=options
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--group-by-state"):
+        group_by_state(items, xdist_groups=config.pluginmanager.hasplugin("xdist"))
+
+def pytest_sessionfinish(session):
+    # xdist workers hand their counters to the controller, which prints them in the summary
+    stats = {"http": http_client.latency_summary(), "polling": polling_summary()}
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["harness_stats"] = stats
+        workeroutput["step_records"] = recorded_steps()
+        workeroutput["api_baseline_updates"] = session.config._api_baseline_updates
+        return
+
+    session.config._harness_stats[current_worker_id()] = stats
+    report_path = session.config.getoption("--step-timing")
+    if report_path:
+        write_report(report_path, session.config._step_records + recorded_steps())
+    if session.config._api_baseline_updates:
+        merge_baseline(session.config.getoption("--api-baseline"), session.config._api_baseline_updates)
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    workeroutput = getattr(node, "workeroutput", {})
+    if workeroutput.get("harness_stats"):
+        node.config._harness_stats[node.gateway.id] = workeroutput["harness_stats"]
+    node.config._step_records.extend(workeroutput.get("step_records", []))
+    node.config._api_baseline_updates.update(workeroutput.get("api_baseline_updates", {}))
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not config.getoption("--harness-stats"):
+        return
+
+    terminalreporter.section("harness API latency")
+    for worker_id, stats in sorted(config._harness_stats.items()):
+        for endpoint, s in sorted(stats["http"].items(), key=lambda item: -item[1]["total_s"]):
+            terminalreporter.write_line(
+                f"{worker_id:<7} {endpoint:<48} n={s['count']:<5} total={s['total_s']:>7.2f}s "
+                f"mean={s['mean_ms']:>7.1f}ms p50={s['p50_ms']:>7.1f}ms p95={s['p95_ms']:>7.1f}ms max={s['max_ms']:>7.1f}ms"
+            )
+
+    terminalreporter.section("harness polling")
+    for worker_id, stats in sorted(config._harness_stats.items()):
+        for site, s in sorted(stats["polling"].items()):
+            terminalreporter.write_line(
+                f"{worker_id:<7} {site:<48} calls={s['calls']:<5} timeouts={s['timeouts']:<3} "
+                f"attempts={s['mean_attempts']:>4} (max {s['max_attempts']}) "
+                f"to_success={s['mean_ms']}ms (max {s['max_ms']}ms)"
+            )
+
+def _create_driver(browser, driver_path=None, profile="default", page_load_strategy=None):
+    if browser == "chrome":
+        return webdriver.Chrome(
+            service=Service(driver_path),
+            options=chrome_options(
+                profile, page_load_strategy, network_log=network_observer_enabled(), trace=tracing_enabled()
+            )
         )
 
     elif browser == "safari":
-        driver = SafariDriver()
+        return SafariDriver()
 
     else:
         raise ValueError(f"Unsupported browser: {browser}")
 
+def _driver_path_for(request, browser):
+    return request.getfixturevalue("chromedriver_path") if browser == "chrome" else None
+
+def _profile_for(request):
+    """Tests marked full_render always get the default, fully rendered profile."""
+
+    if request.node.get_closest_marker("full_render"):
+        return "default"
+    return request.config.getoption("--browser-profile")
+
+@pytest.fixture(scope="session")
+def chromedriver_path(request):
+    return resolve_chromedriver(
+        cache_dir=request.config.getoption("--driver-cache-dir"),
+        offline=request.config.getoption("--offline-driver"),
+    )
+
+@pytest.fixture(scope="session")
+def driver_pools(request, base_url):
+    """One browser pool per profile, created on first use."""
+
+    browser = request.config.getoption("--browser")
+    page_load_strategy = request.config.getoption("--page-load-strategy")
+    pools = {}
+
+    def pool_for(profile):
+        if profile not in pools:
+            driver_path = _driver_path_for(request, browser)
+            pools[profile] = DriverPool(
+                lambda: _create_driver(browser, driver_path, profile, page_load_strategy), base_url
+            )
+        return pools[profile]
+
+    yield pool_for
+    for pool in pools.values():
+        pool.close()
+
+@pytest.fixture
+def driver(request):
+    profile = _profile_for(request)
+    if request.config.getoption("--reuse-browser"):
+        pool = request.getfixturevalue("driver_pools")(profile)
+        driver = pool.acquire()
+        apply_profile(driver, profile)
+        reset_observer(driver)
+        yield driver
+        pool.release(driver)
+        return
+
+    browser = request.config.getoption("--browser")
+    driver = _create_driver(
+        browser, _driver_path_for(request, browser), profile, request.config.getoption("--page-load-strategy")
+    )
+    apply_profile(driver, profile)
     yield driver
     driver.quit()
 
 @pytest.fixture
-def driver_factory():
+def driver_factory(chromedriver_path):
     def _create_driver():
         options = ChromeOptions()
         options.add_argument("--headless=new")
@@ -52,24 +356,182 @@ def driver_factory():
         options.add_argument("--disable-gpu")
         options.add_argument("--no-sandbox")
         driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
+            service=Service(chromedriver_path),
             options=options
         )
         driver.implicitly_wait(2)
         return driver
     yield _create_driver
 
+def _local_server_accounts():
+    """Verified accounts the stand-in starts with: the admin, this worker's account and the 'Test1' user."""
+
+    worker_id = current_worker_id()
+    worker_email, worker_password, _ = worker_credentials(worker_id)
+    accounts = [
+        ("Admin", os.getenv("ADMIN_EMAIL"), os.getenv("ADMIN_PASSWORD")),
+        (f"Worker{worker_id}", worker_email, worker_password),
+        # The duplicate-username tests expect an existing 'Test1'
+        ("Test1", "test1@nori.local", os.getenv("TEST1_PASSWORD") or "Test1pass!"),
+    ]
+    return [account for account in accounts if account[1] and account[2]]
+
 @pytest.fixture(scope="session")
-def base_url():
+def local_mailhog(request):
+    """In-process mail sink with --local-mailhog; the mail helpers point at its API for the session."""
+
+    if not request.config.getoption("--local-mailhog"):
+        yield None
+        return
+    mailhog = start_local_mailhog()
+    previous_api = mailhog_client.MAILHOG_API
+    mailhog_client.set_mailhog_api(mailhog.api_url)
+    yield mailhog
+    mailhog_client.set_mailhog_api(previous_api)
+    mailhog.stop()
+
+@pytest.fixture(scope="session")
+def local_server(request, local_mailhog):
+    """Stand-in NORI server for this session (one per xdist worker) with --local-server; None otherwise.
+
+    With --local-mailhog its verification mail goes to the in-process sink.
+    """
+
+    if not request.config.getoption("--local-server"):
+        yield None
+        return
+    kwargs = {"smtp": local_mailhog.smtp_address} if local_mailhog is not None else {}
+    server = start_local_server(accounts=_local_server_accounts(), **kwargs)
+    yield server
+    server.stop()
+
+@pytest.fixture(scope="session")
+def base_url(local_server):
+    if local_server is not None:
+        return local_server.base_url
     return os.getenv("NORI_BASE_URL")
 
 @pytest.fixture(scope="session")
-def admin_email():
-    return os.getenv("ADMIN_EMAIL")
+def study_state_tracker(request, base_url):
+    """Session tracker of dirtied study scopes; the flow helpers consult it only with --track-study-state."""
+
+    tracker = StudyStateTracker(base_url)
+    if not request.config.getoption("--track-study-state"):
+        yield tracker
+        return
+    set_active_tracker(tracker)
+    yield tracker
+    set_active_tracker(None)
+
+@pytest.fixture
+def study_state(study_state_tracker):
+    """Study progress tracker for a test (e.g. `snapshot`/`restore`); every scope it dirtied is reset at teardown."""
+
+    yield study_state_tracker
+    study_state_tracker.reset_dirty()
+
+@pytest.fixture(autouse=True)
+def _reset_dirty_study_state(request):
+    if request.config.getoption("--track-study-state"):
+        request.getfixturevalue("study_state")
+
+@pytest.fixture(autouse=True)
+def _step_timing_context(request):
+    marker = request.node.get_closest_marker("tcid")
+    set_current_test(request.node.nodeid, marker.args[0] if marker and marker.args else None)
+
+@pytest.fixture(scope="session")
+def perf_runs(request):
+    return request.config.getoption("--perf-runs")
+
+@pytest.fixture(scope="session")
+def page_budgets(request):
+    return json.loads(Path(request.config.getoption("--perf-budgets")).read_text())
+
+@pytest.fixture(scope="session")
+def api_bench(request):
+    """Settings and baseline for the API latency benchmark.
+
+    With --update-api-baseline, the measured endpoints are merged into the
+    baseline file once at session end; under xdist the controller merges
+    what every worker measured.
+    """
+
+    path = request.config.getoption("--api-baseline")
+    settings = {
+        "runs": request.config.getoption("--api-bench-runs"),
+        "tolerance": request.config.getoption("--api-latency-tolerance"),
+        "slack_ms": request.config.getoption("--api-latency-slack-ms"),
+        "update": request.config.getoption("--update-api-baseline"),
+        "baseline": load_baseline(path),
+        "measured": {},
+    }
+    yield settings
+    if settings["update"]:
+        request.config._api_baseline_updates.update(settings["measured"])
+
+@pytest.fixture(scope="session")
+def nfr_report(request):
+    """Measurements collected by nfr tests, written to --nfr-report (one file per xdist worker) at session end."""
+
+    report = {}
+    yield report
+    path = request.config.getoption("--nfr-report")
+    if path and report:
+        path = Path(path)
+        worker_id = current_worker_id()
+        if worker_id != "master":
+            path = path.with_name(f"{path.stem}.{worker_id}{path.suffix}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2))
+
+@pytest.fixture(scope="session", autouse=True)
+def mail_feed(request, local_mailhog):
+    """Live MailHog feed for the session when --mailhog-stream is on; None otherwise or if unreachable.
+
+    The local MailHog always feeds waiters directly, with or without --mailhog-stream.
+    """
+
+    if local_mailhog is not None:
+        feed = start_local_feed()
+        local_mailhog.subscribe(feed.publish)
+        yield feed
+        stop_mail_feed()
+        return
+    if not request.config.getoption("--mailhog-stream"):
+        yield None
+        return
+    yield start_mail_feed(mailhog_client.MAILHOG_API)
+    stop_mail_feed()
+
+@pytest.fixture(scope="session")
+def word_catalog(base_url):
+    """Words indexed by id, bulk-loaded per level on first lookup."""
+
+    return catalog_for(base_url)
+
+@pytest.fixture(scope="session")
+def worker_account(request, base_url):
+    """Credentials reserved for this xdist worker; the serial run uses the admin account."""
+
+    email, password, needs_provisioning = worker_credentials(current_worker_id())
+    if needs_provisioning:
+        from tests.utils.auth_flows import new_chrome_like_fixture
+
+        provisioning_driver = new_chrome_like_fixture(request.getfixturevalue("chromedriver_path"))
+        try:
+            ensure_verified_account(provisioning_driver, base_url, email, password)
+        finally:
+            provisioning_driver.quit()
+    return email, password
+
+@pytest.fixture(scope="session")
+def admin_email(worker_account):
+    return worker_account[0]
 
 @pytest.fixture(scope="session")
-def admin_password():
-    return os.getenv("ADMIN_PASSWORD")
+def admin_password(worker_account):
+    return worker_account[1]
 
 @pytest.fixture(scope="function")
 def test1_email():
@@ -1,24 +1,16 @@
 import time
-import requests
+from tests.utils import http_client
 import pytest
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from tests.auth.test_auth_email_verification import _dismiss_alert_if_present
-from tests.utils.auth_flows import fill_and_submit_signup, get_auth_cookies, login, make_unique_username
+from tests.utils.auth_flows import fill_and_submit_signup, get_auth_cookies, make_unique_username, sign_in
 from tests.utils.email_verification import fetch_verify_url_from_mailhog
-from tests.utils.dashboard_flows import compute_expected_progress, fetch_progress_data, fetch_words_summary, get_current_username, get_percentage_from_element, open_account_page_from_header, open_account_settings_tab, LEVELS
-
-STUDY_PROGRESS_TAB = (By.CSS_SELECTOR, "[data-testid='study-progress-tab']")
-PROGRESS_TOTAL_LABEL = (By.CSS_SELECTOR, "[data-testid='progress-total']")
-USERNAME_FIELD = (By.CSS_SELECTOR, "[data-testid='username-field']")
-USERNAME_CHECK = (By.CSS_SELECTOR, "[data-testid='username-check']")
-PW_FIELD = (By.CSS_SELECTOR, "[data-testid='pw-field']")
-PW_CHECK = (By.CSS_SELECTOR, "[data-testid='pw-check']")
-SAVE_BTN = (By.CSS_SELECTOR, "[data-testid='save-btn']")
-SUCCESS_MSG = (By.CSS_SELECTOR, "[data-testid='success-msg']")
-DELETE_BTN = (By.CSS_SELECTOR, "[data-testid='delete-btn']")
-LOGIN_BTN = (By.CSS_SELECTOR, "[data-testid='login-btn']")
+from tests.utils.dashboard_flows import compute_expected_progress_all, fetch_all_progress_data, fetch_words_summary, get_current_username, get_percentage_from_element, open_account_page_from_header, open_account_settings_tab, LEVELS
+from tests.pages.account import DELETE_BTN, PROGRESS_TOTAL_LABEL, PW_CHECK, PW_FIELD, SAVE_BTN, SUCCESS_MSG, USERNAME_CHECK, USERNAME_FIELD
+from tests.pages.auth import NAV_LOGIN_BTN
+
 SUBJECT = "NORI Email Verification"
 PROGRESS_KEYS = [
     "flashcards",
@@ -32,18 +24,20 @@ PROGRESS_KEYS = [
 def test_dashboard_progress_calculations_accurate(driver, base_url, admin_email, admin_password):
     """Verify dashboard progress percentages match API data for all study types."""
 
-    login(driver, base_url, admin_email, admin_password)
+    sign_in(driver, base_url, admin_email, admin_password)
     open_account_page_from_header(driver, base_url)
 
     cookies = get_auth_cookies(driver)
     words_summary = fetch_words_summary(base_url, cookies)
+    expected_by_key = compute_expected_progress_all(
+        fetch_all_progress_data(base_url, cookies, PROGRESS_KEYS), words_summary
+    )
 
     for key in PROGRESS_KEYS:
         container_locator = (By.CSS_SELECTOR, f"[data-testid='progress-chart-container-{key}']")
         container = WebDriverWait(driver, 10).until(EC.presence_of_element_located(container_locator))
 
-        progress = fetch_progress_data(base_url, cookies, key)
-        expected_overall, expected_levels = compute_expected_progress(progress, words_summary)
+        expected_overall, expected_levels = expected_by_key[key]
 
         total_label = container.find_element(*PROGRESS_TOTAL_LABEL)
         total_wrapper = total_label.find_element(By.XPATH, "..")
@@ -66,7 +60,7 @@ def test_dashboard_progress_calculations_accurate(driver, base_url, admin_email,
 def test_dashboard_username_validation_feedback(driver, base_url, admin_email, admin_password):
     """Verify real-time username validation for invalid, valid, and duplicate input."""
 
-    login(driver, base_url, admin_email, admin_password)
+    sign_in(driver, base_url, admin_email, admin_password)
     open_account_page_from_header(driver, base_url)
     open_account_settings_tab(driver)
 
@@ -117,7 +111,7 @@ def test_dashboard_username_validation_feedback(driver, base_url, admin_email, a
 def test_dashboard_password_validation_feedback(driver, base_url, admin_email, admin_password):
     """Verify real-time password validation feedback for unmet and met requirements."""
 
-    login(driver, base_url, admin_email, admin_password)
+    sign_in(driver, base_url, admin_email, admin_password)
     open_account_page_from_header(driver, base_url)
     open_account_settings_tab(driver)
 
@@ -147,7 +141,7 @@ def test_dashboard_password_validation_feedback(driver, base_url, admin_email, a
 def test_dashboard_save_changes_processes_correctly(driver, base_url, admin_email, admin_password):
     """Verify Save Changes behavior for empty/invalid input and successful updates."""
 
-    login(driver, base_url, admin_email, admin_password)
+    sign_in(driver, base_url, admin_email, admin_password)
     open_account_page_from_header(driver, base_url)
     open_account_settings_tab(driver)
 
@@ -203,7 +197,7 @@ def test_dashboard_save_changes_processes_correctly(driver, base_url, admin_emai
 def test_dashboard_delete_account_warning_modal(driver, base_url, admin_email, admin_password):
     """Verify warning modal appears and requires explicit dismissal on delete account."""
 
-    login(driver, base_url, admin_email, admin_password)
+    sign_in(driver, base_url, admin_email, admin_password)
     open_account_page_from_header(driver, base_url)
     open_account_settings_tab(driver)
 
@@ -233,7 +227,7 @@ def test_dashboard_account_deletion_completes(driver, base_url, test1_email, tes
         EC.presence_of_element_located((By.XPATH, "//*[contains(., 'successfully verified')]"))
     )
 
-    login(driver, base_url, test1_email, test1_password)
+    sign_in(driver, base_url, test1_email, test1_password)
     open_account_page_from_header(driver, base_url)
     open_account_settings_tab(driver)
 
@@ -249,12 +243,12 @@ def test_dashboard_account_deletion_completes(driver, base_url, test1_email, tes
     deleted.accept()
 
     WebDriverWait(driver, 5).until(EC.url_to_be(f"{base_url}/"))
-    WebDriverWait(driver, 5).until(EC.presence_of_element_located(LOGIN_BTN))
+    WebDriverWait(driver, 5).until(EC.presence_of_element_located(NAV_LOGIN_BTN))
 
     # Wait until user API returns 401
     elapsed = 0
     while elapsed < 5:
-        resp = requests.get(
+        resp = http_client.get(
             f"{base_url}/api/user",
             cookies=cookies,
             timeout=5,
@@ -1,7 +1,6 @@
-import re
 import time
 import pytest
-import requests
+from tests.utils import http_client
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -9,34 +8,22 @@ from selenium.common.exceptions import TimeoutException
 from tests.auth.test_auth_email_verification import _dismiss_alert_if_present
 from tests.utils.auth_flows import fill_and_submit_signup, get_auth_cookies, logout, make_unique_username
 from tests.utils.email_verification import fetch_verify_url_from_mailhog
-from tests.utils.db_client import get_study_progress, get_word_from_word_id
+from tests.utils.db_client import get_study_progress
 from tests.utils.fill_flows import answer_all_problems_correctly_and_accept_alert, answer_problems, dismiss_review_mode_modal, enter_review_mode, get_correct_fill_answer, input_correct_fill_answer_from_db_and_submit_with_btn_click, input_correct_fill_answer_from_db_and_submit_with_keyboard, input_fill_answer, input_incorrect_fill_answer, login_and_open_fill_page, login_and_open_fill_page_with_level_reset, reset_fill_level_progress, wait_for_completion_state, wait_for_fill_advance, wait_stays_disabled_until_advance
+from tests.pages.fill import BLK_SENTENCE, ENG_MEANING, FILL_ANS, FILL_BOX, INPUT_BOX, SUBMIT_BTN, FillPage
+from tests.pages.study import PROG_BAR, PROG_CNT
 
-FILL_BOX = (By.CSS_SELECTOR, "[data-testid='fill-box']")
-FILL_ANS = (By.CSS_SELECTOR, "[data-testid='fill-answer']")
-SUBMIT_BTN = (By.CSS_SELECTOR, "[data-testid='submit-btn']")
-ENG_MEANING = (By.CSS_SELECTOR, "[data-testid='english-meaning']")
-BLK_SENTENCE = (By.CSS_SELECTOR, "[data-testid='blank-sentence']")
-PROG_CNT = (By.CSS_SELECTOR, "[data-testid='progress-counter']")
-PROG_BAR = (By.CSS_SELECTOR, "[data-testid='progress-bar-inner']")
-INPUT_BOX = (By.CSS_SELECTOR, "[data-testid='input-box']")
 SUBJECT = "NORI Email Verification"
 
 def get_fill_progress_counts(driver):
-    text = driver.find_element(*PROG_CNT).text.strip()
-    fraction = text.split("(", 1)[0]
-    current_str, total_str = [part.strip() for part in fraction.split("/", 1)]
-    return int(current_str), int(total_str), text
+    return FillPage.on(driver).progress_counts()
 
 def get_progress_bar_percent(driver):
-    style = driver.find_element(*PROG_BAR).get_attribute("style") or ""
-    match = re.search(r"width:\s*([0-9.]+)%", style)
-    if not match:
-        raise AssertionError(f"Progress bar width not found in style: {style!r}")
-    return float(match.group(1))
+    return FillPage.on(driver).progress_bar_percent()
 
 @pytest.mark.tcid("TC-FILL-001")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_fill_page_loads_correctly(driver, base_url, admin_email, admin_password):
     
     level = "N2"
@@ -51,6 +38,7 @@ def test_fill_page_loads_correctly(driver, base_url, admin_email, admin_password
 
 @pytest.mark.tcid("TC-FILL-002")
 @pytest.mark.fill
+@pytest.mark.state(level="TEST")
 def test_correct_answer_marks_fill_as_completed(driver, base_url, admin_email, admin_password):
     
     level = "TEST"
@@ -64,13 +52,14 @@ def test_correct_answer_marks_fill_as_completed(driver, base_url, admin_email, a
     # Assert DB state
     word_id = question.get_attribute("data-word-id")
     cookies = get_auth_cookies(driver)  
-    progress = wait_for_completion_state(base_url, word_id, cookies, expected=True, level=level)
+    progress = wait_for_completion_state(base_url, word_id, cookies, expected=True, level=level, driver=driver)
     assert progress and progress.get("completed") is True, (
         f"Question {word_id} not marked as completed within 5s"
     )
     
 @pytest.mark.tcid("TC-FILL-003")
 @pytest.mark.fill
+@pytest.mark.state(level="TEST")
 def test_incorrect_answer_marks_fill_as_incomplete(driver, base_url, admin_email, admin_password):
     
     level = "TEST"
@@ -84,13 +73,14 @@ def test_incorrect_answer_marks_fill_as_incomplete(driver, base_url, admin_email
     # Assert DB state
     word_id = question.get_attribute("data-word-id")
     cookies = get_auth_cookies(driver)  
-    progress = wait_for_completion_state(base_url, word_id, cookies, expected=False, level=level)
+    progress = wait_for_completion_state(base_url, word_id, cookies, expected=False, level=level, driver=driver)
     assert progress and progress.get("completed") is False, (
         f"Question {word_id} is marked as completed"
     )
     
 @pytest.mark.tcid("TC-FILL-004")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_submit_button_disabled_until_next_sentence(driver, base_url, admin_email, admin_password):
     """Verify that submit button becomes disabled immediately after click,
     remains disabled until the next sentence loads, and then re-enables properly.
@@ -120,6 +110,7 @@ def test_submit_button_disabled_until_next_sentence(driver, base_url, admin_emai
     
 @pytest.mark.tcid("TC-FILL-005")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_correct_fill_answer_feedback_with_btn_click(driver, base_url, admin_email, admin_password):
     
     level = "n2"
@@ -143,6 +134,7 @@ def test_correct_fill_answer_feedback_with_btn_click(driver, base_url, admin_ema
     
 @pytest.mark.tcid("TC-FILL-006")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_correct_fill_answer_feedback_submission_with_keyboard(driver, base_url, admin_email, admin_password):
     
     level = "n2"
@@ -166,6 +158,7 @@ def test_correct_fill_answer_feedback_submission_with_keyboard(driver, base_url,
     
 @pytest.mark.tcid("TC-FILL-007")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_incorrect_fill_answer_feedback_with_btn_click(driver, base_url, admin_email, admin_password):
     
     level = "n2"
@@ -190,14 +183,15 @@ def test_incorrect_fill_answer_feedback_with_btn_click(driver, base_url, admin_e
     
 @pytest.mark.tcid("TC-FILL-008")
 @pytest.mark.fill
-def test_hiragana_answer_rejected(driver, base_url, admin_email, admin_password):
+@pytest.mark.state(level="N2")
+def test_hiragana_answer_rejected(driver, base_url, admin_email, admin_password, word_catalog):
     
     level = "n2"
     login_and_open_fill_page_with_level_reset(driver, base_url, admin_email, admin_password, level)
     
     fill_box = WebDriverWait(driver, 5).until(EC.presence_of_element_located(FILL_BOX))
     word_id = fill_box.get_attribute("data-word-id")
-    hiragana_answer = get_word_from_word_id(base_url, word_id)['furigana']
+    hiragana_answer = word_catalog.answer(word_id, "furigana", level)
     
     input_fill_answer(driver, hiragana_answer)
     submit_btn = WebDriverWait(driver, 5).until(EC.presence_of_element_located(SUBMIT_BTN))
@@ -205,6 +199,7 @@ def test_hiragana_answer_rejected(driver, base_url, admin_email, admin_password)
 
 @pytest.mark.tcid("TC-FILL-009")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_whitespace_trimmed_for_correct_answer(driver, base_url, admin_email, admin_password):
     """Verify leading/trailing spaces are trimmed and answer is accepted as correct."""
     
@@ -240,6 +235,7 @@ def test_whitespace_trimmed_for_correct_answer(driver, base_url, admin_email, ad
 
 @pytest.mark.tcid("TC-FILL-010")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_empty_submission_feedback_and_advance(driver, base_url, admin_email, admin_password):
     """Verify empty submission shows incorrect feedback and advances to next sentence."""
     
@@ -275,6 +271,7 @@ def test_empty_submission_feedback_and_advance(driver, base_url, admin_email, ad
 
 @pytest.mark.tcid("TC-FILL-011")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_submit_button_disabled_after_submission(driver, base_url, admin_email, admin_password):
     """Verify submit button is disabled after submission and prevents a second click."""
     
@@ -297,6 +294,7 @@ def test_submit_button_disabled_after_submission(driver, base_url, admin_email,
 
 @pytest.mark.tcid("TC-FILL-012")
 @pytest.mark.fill
+@pytest.mark.state(level="TEST")
 def test_half_width_katakana_answer_accepted(driver, base_url, admin_email, admin_password):
 
     level = "TEST"
@@ -317,6 +315,7 @@ def test_half_width_katakana_answer_accepted(driver, base_url, admin_email, admi
 
 @pytest.mark.tcid("TC-FILL-013")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_fill_progress_counter_increments_on_correct_answer(driver, base_url, admin_email, admin_password):
     """Verify progress counter and bar increment on correct answer."""
     
@@ -349,6 +348,7 @@ def test_fill_progress_counter_increments_on_correct_answer(driver, base_url, ad
 
 @pytest.mark.tcid("TC-FILL-014")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_fill_progress_counter_unchanged_on_incorrect_answer(driver, base_url, admin_email, admin_password):
     """Verify progress counter and bar do not change on incorrect answer."""
     
@@ -378,6 +378,7 @@ def test_fill_progress_counter_unchanged_on_incorrect_answer(driver, base_url, a
 
 @pytest.mark.tcid("TC-FILL-015")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_fill_rapid_submissions_do_not_duplicate_increment(driver, base_url, admin_email, admin_password):
     """Verify rapid submissions only increment progress once."""
     
@@ -411,6 +412,7 @@ def test_fill_rapid_submissions_do_not_duplicate_increment(driver, base_url, adm
 
 @pytest.mark.tcid("TC-FILL-016")
 @pytest.mark.fill
+@pytest.mark.state(level="TEST")
 def test_fill_review_mode_modal_appears(driver, base_url, admin_email, admin_password):
     
     level = "TEST"
@@ -436,6 +438,7 @@ def test_fill_review_mode_modal_appears(driver, base_url, admin_email, admin_pas
     
 @pytest.mark.tcid("TC-FILL-017")
 @pytest.mark.fill
+@pytest.mark.state(level="TEST")
 def test_accepting_review_modal_starts_fill_review_mode(driver, base_url, admin_email, admin_password):
     
     level = "TEST"
@@ -450,6 +453,7 @@ def test_accepting_review_modal_starts_fill_review_mode(driver, base_url, admin_
     
 @pytest.mark.tcid("TC-FILL-018")
 @pytest.mark.fill
+@pytest.mark.state(level="TEST")
 def test_cancel_review_modal_redirects_and_resets_fill_progress(driver, base_url, admin_email, admin_password):
     
     level = "TEST"
@@ -470,6 +474,7 @@ def test_cancel_review_modal_redirects_and_resets_fill_progress(driver, base_url
     
 @pytest.mark.tcid("TC-FILL-019")
 @pytest.mark.fill
+@pytest.mark.state(level="TEST")
 def test_review_mode_excludes_completed_sentence(driver, base_url, admin_email, admin_password):
     """Ensure review mode only surfaces sentences that still need review."""
     
@@ -512,6 +517,7 @@ def test_review_mode_excludes_completed_sentence(driver, base_url, admin_email,
     
 @pytest.mark.tcid("TC-FILL-020")
 @pytest.mark.fill
+@pytest.mark.state(level="TEST")
 def test_fill_review_mode_label_displayed_in_progress_counter(driver, base_url, admin_email, admin_password):
     
     level = "TEST"
@@ -526,6 +532,7 @@ def test_fill_review_mode_label_displayed_in_progress_counter(driver, base_url,
     
 @pytest.mark.tcid("TC-FILL-021")
 @pytest.mark.fill
+@pytest.mark.state(level="TEST")
 def test_fill_review_mode_progress_counter(driver, base_url, admin_email, admin_password):
     """Verify that the progress counter displays correct counts when entering review mode."""
     
@@ -545,6 +552,7 @@ def test_fill_review_mode_progress_counter(driver, base_url, admin_email, admin_
   
 @pytest.mark.tcid("TC-FILL-023")
 @pytest.mark.fill  
+@pytest.mark.state(level="TEST")
 def test_fill_progress_reset_modal_message(driver, base_url, admin_email, admin_password):
     """Complete all problems; accept completion alert and confirm modal message contains reset confirmation text."""
     
@@ -556,6 +564,7 @@ def test_fill_progress_reset_modal_message(driver, base_url, admin_email, admin_
     
 @pytest.mark.tcid("TC-FILL-02４")
 @pytest.mark.fill  
+@pytest.mark.state(level="TEST")
 def test_fill_progress_counter_after_reset(driver, base_url, admin_email, admin_password):
     """Verify that the progress counter resets to 0 after completing all problems and resetting."""
     
@@ -574,6 +583,7 @@ def test_fill_progress_counter_after_reset(driver, base_url, admin_email, admin_
   
 @pytest.mark.tcid("TC-FILL-025")
 @pytest.mark.fill    
+@pytest.mark.state(level="TEST")
 def test_fill_study_progress_deleted_from_db_after_reset(driver, base_url, admin_email, admin_password):
     """Verify that study progress is completely removed from the database after reset."""
     
@@ -615,6 +625,7 @@ def test_fill_reset_scope_limited_to_current_level(driver, base_url, admin_email
 
 @pytest.mark.tcid("TC-FILL-027")
 @pytest.mark.fill
+@pytest.mark.state(level="TEST")
 def test_fill_sentence_order_randomized_after_cycle_reset(driver, base_url, admin_email, admin_password):
     """Verify sentence order changes after completing and resetting a cycle."""
     
@@ -647,6 +658,7 @@ def test_fill_sentence_order_randomized_after_cycle_reset(driver, base_url, admi
 
 @pytest.mark.tcid("TC-FILL-028")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_fill_position_persists_after_page_refresh(driver, base_url, admin_email, admin_password):
     """Verify the same sentence loads after a browser refresh."""
     
@@ -679,6 +691,7 @@ def test_fill_position_persists_after_page_refresh(driver, base_url, admin_email
     
 @pytest.mark.tcid("TC-FILL-029")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_fill_position_persists_after_logout_login(driver, base_url, admin_email, admin_password):
     """Verify the same sentence loads after logout and re-login."""
     
@@ -713,6 +726,7 @@ def test_fill_position_persists_after_logout_login(driver, base_url, admin_email
  
 @pytest.mark.tcid("TC-FILL-030")
 @pytest.mark.fill   
+@pytest.mark.state(level="N2")
 def test_fill_position_persists_after_reopening_browser_or_across_devices(driver_factory, base_url, admin_email, admin_password):
     """Verify the same sentence loads after closing and reopening the browser."""
     
@@ -740,6 +754,7 @@ def test_fill_position_persists_after_reopening_browser_or_across_devices(driver
     
 @pytest.mark.tcid("TC-FILL-031")
 @pytest.mark.fill  
+@pytest.mark.state(level="N2")
 def test_fill_progress_persists_on_reenter_normal_mode(driver, base_url, admin_email, admin_password):
     """Verify completed sentences remain persisted after leaving and re-entering Fill in the Blank page in Normal mode."""
     
@@ -781,6 +796,7 @@ def test_fill_progress_persists_on_reenter_normal_mode(driver, base_url, admin_e
     
 @pytest.mark.tcid("TC-FILL-032")
 @pytest.mark.fill 
+@pytest.mark.state(level="TEST")
 def test_fill_progress_persists_on_reenter_review_mode(driver, base_url, admin_email, admin_password):
     """Verify completed sentences remain persisted after leaving and re-entering Fill in the Blank page in Review mode."""
     
@@ -825,6 +841,7 @@ def test_fill_progress_persists_on_reenter_review_mode(driver, base_url, admin_e
 
 @pytest.mark.tcid("TC-FILL-033")
 @pytest.mark.fill
+@pytest.mark.state(level="N2")
 def test_fill_progress_persists_until_account_deletion(driver, base_url, test1_email, test1_password):
     """Verify fill progress is wiped and APIs deny access after deleting the account."""
     
@@ -853,7 +870,7 @@ def test_fill_progress_persists_until_account_deletion(driver, base_url, test1_e
     assert progress_before, "Progress is not saved in DB"
     
     # Delete account
-    r = requests.delete(
+    r = http_client.delete(
         f"{base_url}/api/user",
         cookies=cookies,
         timeout=5,
@@ -863,7 +880,7 @@ def test_fill_progress_persists_until_account_deletion(driver, base_url, test1_e
     # Wait until study-progress API returns 401
     elapsed = 0
     while elapsed < 5:
-        resp = requests.get(
+        resp = http_client.get(
             f"{base_url}/api/study-progress",
             params={"type": "fill", "level": level},
             cookies=cookies,
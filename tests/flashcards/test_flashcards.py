@@ -1,6 +1,6 @@
 import time
 import pytest
-import requests
+from tests.utils import http_client
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -11,61 +11,20 @@ from tests.utils.email_verification import fetch_verify_url_from_mailhog
 from tests.utils.flashcards_flows import enter_review_mode, login_and_open_flashcards_page, login_and_open_flashcards_page_with_level_reset, mark_all_flashcards_O_and_accept_alert, reset_flashcards_level_progress, study_flashcards, wait_for_completion_state, wait_for_flashcard_advance, wait_stays_disabled_until_advance
 from tests.utils.auth_flows import fill_and_submit_signup, get_auth_cookies, logout, make_unique_username
 from tests.utils.db_client import get_study_progress
+from tests.utils.favorites import clear_favorites, get_favorite_word_ids, wait_for_favorite_state
+from tests.pages.flashcards import EX_BTN, EX_SENTENCE, EX_TRANSLATION, FAVORITES_BTN, FAVORITE_BTN, FURIGANA, MEANING, MEANING_BTN, O_BTN, STAR_BTN, VOCAB, X_BTN, FlashcardsPage
+from tests.pages.study import PROG_CNT
 
-VOCAB = (By.CSS_SELECTOR, "[data-testid='vocabulary']")
-FURIGANA = (By.CSS_SELECTOR, "[data-testid='furigana']")
-O_BTN = (By.CSS_SELECTOR, "[data-testid='o-btn']")
-X_BTN = (By.CSS_SELECTOR, "[data-testid='x-btn']")
-EX_BTN = (By.CSS_SELECTOR, "[data-testid='example-btn']")
-EX_SENTENCE = (By.CSS_SELECTOR, "[data-testid='ex-sentence']")
-MEANING_BTN = (By.CSS_SELECTOR, "[data-testid='meaning-btn']")
-MEANING = (By.CSS_SELECTOR, "[data-testid='meaning']")
-PROG_CNT = (By.CSS_SELECTOR, "[data-testid='progress-counter']")
 SUBJECT = "NORI Email Verification"
-EX_TRANSLATION = (By.CSS_SELECTOR, "[data-testid='ex-translation']")
-FAVORITE_BTN = (By.CSS_SELECTOR, "[data-testid='favorite-btn']")
-STAR_BTN = (By.CSS_SELECTOR, "[data-testid='star-btn']")
-FAVORITES_BTN = (By.CSS_SELECTOR, "[data-testid='level-btn-favorites']")
 STAR_FILLED = "★"
 STAR_EMPTY = "☆"
 
 def get_progress_counts(driver):
-    text = driver.find_element(*PROG_CNT).text.strip()
-    fraction = text.split("(", 1)[0]
-    current_str, total_str = [part.strip() for part in fraction.split("/", 1)]
-    return int(current_str), int(total_str), text
-
-def get_favorite_word_ids(base_url, cookies):
-    response = requests.get(
-        f"{base_url}/api/favorites",
-        cookies=cookies,
-        timeout=5,
-    )
-    response.raise_for_status()
-    return [int(word["id"]) for word in response.json()]
-
-def clear_favorites(base_url, cookies):
-    favorite_ids = get_favorite_word_ids(base_url, cookies)
-    for word_id in favorite_ids:
-        response = requests.post(
-            f"{base_url}/api/favorites",
-            json={"wordId": word_id},
-            cookies=cookies,
-            timeout=5,
-        )
-        response.raise_for_status()
-
-def wait_for_favorite_state(base_url, cookies, word_id, expected, timeout=10):
-    end_time = time.time() + timeout
-    while time.time() < end_time:
-        ids = get_favorite_word_ids(base_url, cookies)
-        if (word_id in ids) == expected:
-            return ids
-        time.sleep(0.5)
-    return get_favorite_word_ids(base_url, cookies)
+    return FlashcardsPage.on(driver).progress_counts()
 
 @pytest.mark.tcid("TC-FC-001")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_flashcard_vocabulary_visible(driver, base_url, admin_email, admin_password):
     """Verify that the vocabulary element is visible and furigana is hidden on initial flashcard load."""
     
@@ -87,6 +46,8 @@ def test_flashcard_vocabulary_visible(driver, base_url, admin_email, admin_passw
     
 @pytest.mark.tcid("TC-FC-002")
 @pytest.mark.flashcards
+@pytest.mark.full_render
+@pytest.mark.state(level="N2")
 def test_japanese_characters_render(driver, base_url, admin_email, admin_password):
     """Verify that the vocabulary text is non-empty, contains no broken glyphs, and uses the correct font."""
     
@@ -106,6 +67,7 @@ def test_japanese_characters_render(driver, base_url, admin_email, admin_passwor
 
 @pytest.mark.tcid("TC-FC-003")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_o_button_marks_word_as_completed(driver, base_url, admin_email, admin_password):
     """Verify that clicking the O button marks the current word as completed in the database."""
     
@@ -126,13 +88,14 @@ def test_o_button_marks_word_as_completed(driver, base_url, admin_email, admin_p
     cookies = get_auth_cookies(driver)
     
     # Assert DB state  
-    progress = wait_for_completion_state(base_url, word_id, cookies, expected=True, level=level)
+    progress = wait_for_completion_state(base_url, word_id, cookies, expected=True, level=level, driver=driver)
     assert progress and progress.get("completed") is True, (
         f"Word {word_id} not marked as completed within 5s"
     )
         
 @pytest.mark.tcid("TC-FC-004")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_x_button_does_not_mark_word_completed(driver, base_url, admin_email, admin_password):
     """Verify that clicking the X button does not mark the word as completed in the database."""
     
@@ -153,13 +116,14 @@ def test_x_button_does_not_mark_word_completed(driver, base_url, admin_email, ad
     cookies = get_auth_cookies(driver)
 
     # Assert DB state  
-    progress = wait_for_completion_state(base_url, word_id, cookies, expected=False, level=level)
+    progress = wait_for_completion_state(base_url, word_id, cookies, expected=False, level=level, driver=driver)
     assert progress is not None and progress.get("completed") is False, (
         f"Expected completed=False, got {progress}"
     )
 
 @pytest.mark.tcid("TC-FC-005")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_advance_to_next_flashcard(driver, base_url, admin_email, admin_password):
     """Verify that clicking either O or X advances to the next flashcard."""
 
@@ -190,6 +154,7 @@ def test_advance_to_next_flashcard(driver, base_url, admin_email, admin_password
 
 @pytest.mark.tcid("TC-FC-006")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_OX_buttons_disabled_until_next_flashcard(driver, base_url, admin_email, admin_password):
     """Verify that both 'O' and 'X' buttons become disabled immediately after click,
     remain disabled until the next flashcard loads, and then re-enable properly.
@@ -241,6 +206,7 @@ def test_OX_buttons_disabled_until_next_flashcard(driver, base_url, admin_email,
 
 @pytest.mark.tcid("TC-FC-007")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_OX_button_hover_animation_triggers(driver, base_url, admin_email, admin_password):
     """Verify that hovering O and X buttons triggers scale-up transform effect."""
 
@@ -268,6 +234,7 @@ def test_OX_button_hover_animation_triggers(driver, base_url, admin_email, admin
 
 @pytest.mark.tcid("TC-FC-008")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_example_sentence_toggle_button(driver, base_url, admin_email, admin_password):
     """Verify the 'Show example sentence' button toggles the example sentence on/off and button text changes."""
 
@@ -297,6 +264,7 @@ def test_example_sentence_toggle_button(driver, base_url, admin_email, admin_pas
 
 @pytest.mark.tcid("TC-FC-009")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_meaning_toggle_button(driver, base_url, admin_email, admin_password):
     """Verify 'Show meaning' button toggles furigana, meaning, and example translation on and off."""
 
@@ -337,6 +305,7 @@ def test_meaning_toggle_button(driver, base_url, admin_email, admin_password):
 
 @pytest.mark.tcid("TC-FC-010")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_toggle_state_persists_after_refresh(driver, base_url, admin_email, admin_password):
     """Verify meaning and example sentence toggle states persist after refresh within the session."""
 
@@ -378,6 +347,7 @@ def test_toggle_state_persists_after_refresh(driver, base_url, admin_email, admi
 
 @pytest.mark.tcid("TC-FC-011")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_flashcards_progress_counter_format(driver, base_url, admin_email, admin_password):
     """Verify the progress counter displays in the expected numeric format."""
 
@@ -393,6 +363,7 @@ def test_flashcards_progress_counter_format(driver, base_url, admin_email, admin
 
 @pytest.mark.tcid("TC-FC-012")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_flashcards_progress_counter_updates_on_button_clicks(driver, base_url, admin_email, admin_password):
     """Verify progress counter increments correctly after clicking O and X buttons."""
 
@@ -427,6 +398,7 @@ def test_flashcards_progress_counter_updates_on_button_clicks(driver, base_url,
 
 @pytest.mark.tcid("TC-FC-013")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_rapid_o_clicks_do_not_duplicate_progress(driver, base_url, admin_email, admin_password):
     """Verify rapid clicking O does not increment the progress counter multiple times."""
 
@@ -455,6 +427,7 @@ def test_rapid_o_clicks_do_not_duplicate_progress(driver, base_url, admin_email,
 
 @pytest.mark.tcid("TC-FC-014")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_star_button_toggle_updates_favorites_db(driver, base_url, admin_email, admin_password):
     """Verify star button adds/removes the word in favorites table."""
 
@@ -476,6 +449,7 @@ def test_star_button_toggle_updates_favorites_db(driver, base_url, admin_email,
 
 @pytest.mark.tcid("TC-FC-015")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_star_button_ui_changes_on_click(driver, base_url, admin_email, admin_password):
     """Verify star icon toggles between filled and empty states on click."""
 
@@ -499,6 +473,7 @@ def test_star_button_ui_changes_on_click(driver, base_url, admin_email, admin_pa
 
 @pytest.mark.tcid("TC-FC-016")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_star_icon_matches_favorite_state_after_reopen(driver, base_url, admin_email, admin_password):
     """Verify star icon reflects DB state after leaving and returning to flashcards, with no duplicates."""
 
@@ -527,6 +502,7 @@ def test_star_icon_matches_favorite_state_after_reopen(driver, base_url, admin_e
 
 @pytest.mark.tcid("TC-FC-017")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_favorite_persists_across_sessions(driver, base_url, admin_email, admin_password):
     """Verify favorite status persists after logout and login."""
 
@@ -557,6 +533,7 @@ def test_favorite_persists_across_sessions(driver, base_url, admin_email, admin_
 
 @pytest.mark.tcid("TC-FC-018")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_favorites_flashcards_page_shows_only_favorited_words(driver, base_url, admin_email, admin_password):
     """Verify Favorites flashcards set contains only favorited words."""
 
@@ -611,6 +588,7 @@ def test_favorites_flashcards_page_shows_only_favorited_words(driver, base_url,
     )
 @pytest.mark.tcid("TC-FC-019")
 @pytest.mark.flashcards
+@pytest.mark.state(level="TEST")
 def test_flashcard_review_mode_modal_appears(driver, base_url, admin_email, admin_password):
     """Verify that the review mode modal appears after marking multiple flashcards incorrect."""
     
@@ -639,6 +617,7 @@ def test_flashcard_review_mode_modal_appears(driver, base_url, admin_email, admi
 
 @pytest.mark.tcid("TC-FC-020")
 @pytest.mark.flashcards
+@pytest.mark.state(level="TEST")
 def test_accepting_review_modal_starts_flashcards_review_mode(driver, base_url, admin_email, admin_password):
     """Verify that accepting the review mode modal transitions the session into Review Mode."""
     
@@ -651,6 +630,7 @@ def test_accepting_review_modal_starts_flashcards_review_mode(driver, base_url,
     
 @pytest.mark.tcid("TC-FC-021")
 @pytest.mark.flashcards
+@pytest.mark.state(level="TEST")
 def test_cancel_review_modal_redirects_and_resets_flashcards_progress(driver, base_url, admin_email, admin_password):
     """Verify that dismissing the review mode modal redirects to level selection and resets progress."""
     
@@ -687,6 +667,7 @@ def test_cancel_review_modal_redirects_and_resets_flashcards_progress(driver, ba
     
 @pytest.mark.tcid("TC-FC-022")
 @pytest.mark.flashcards
+@pytest.mark.state(level="TEST")
 def test_review_mode_excludes_completed_flashcards(driver, base_url, admin_email, admin_password):
     """Ensure review mode only surfaces words that still need review."""
     
@@ -728,6 +709,7 @@ def test_review_mode_excludes_completed_flashcards(driver, base_url, admin_email
     
 @pytest.mark.tcid("TC-FC-023")
 @pytest.mark.flashcards
+@pytest.mark.state(level="TEST")
 def test_review_mode_text_is_displayed_next_to_progress_counter(driver, base_url, admin_email, admin_password):
     """Verify that 'Review Mode' label is displayed next to the progress counter when in review mode."""
     
@@ -749,6 +731,7 @@ def test_review_mode_text_is_displayed_next_to_progress_counter(driver, base_url
     
 @pytest.mark.tcid("TC-FC-024")
 @pytest.mark.flashcards
+@pytest.mark.state(level="TEST")
 def test_flashcards_review_mode_progress_counter(driver, base_url, admin_email, admin_password):
     """Verify that the progress counter displays correct counts when entering review mode."""
     
@@ -769,6 +752,7 @@ def test_flashcards_review_mode_progress_counter(driver, base_url, admin_email,
     
 @pytest.mark.tcid("TC-FC-026")
 @pytest.mark.flashcards
+@pytest.mark.state(level="TEST")
 def test_flashcards_progress_reset_modal_message(driver, base_url, admin_email, admin_password):
     """Verify that the progress reset modal displays the correct message upon completion."""
     
@@ -782,6 +766,7 @@ def test_flashcards_progress_reset_modal_message(driver, base_url, admin_email,
     
 @pytest.mark.tcid("TC-FC-027")
 @pytest.mark.flashcards
+@pytest.mark.state(level="TEST")
 def test_flashcards_progress_counter_after_reset(driver, base_url, admin_email, admin_password):
     """Verify that the progress counter resets to 0 after completing all flashcards and resetting."""
     
@@ -796,6 +781,7 @@ def test_flashcards_progress_counter_after_reset(driver, base_url, admin_email,
 
 @pytest.mark.tcid("TC-FC-028")
 @pytest.mark.flashcards
+@pytest.mark.state(level="TEST")
 def test_flashcards_study_progress_deleted_from_db_after_reset(driver, base_url, admin_email, admin_password):
     """Verify that study progress is completely removed from the database after reset."""
     
@@ -835,6 +821,7 @@ def test_flashcards_reset_scope_limited_to_current_level(driver, base_url, admin
     
 @pytest.mark.tcid("TC-FC-030")
 @pytest.mark.flashcards
+@pytest.mark.state(level="TEST")
 def test_flashcard_order_randomized_after_cycle_reset(driver, base_url, admin_email, admin_password):
     """Verify flashcard order changes after completing and resetting a cycle."""
     
@@ -869,6 +856,7 @@ def test_flashcard_order_randomized_after_cycle_reset(driver, base_url, admin_em
 
 @pytest.mark.tcid("TC-FC-031")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_flashcard_position_persists_after_page_refresh(driver, base_url, admin_email, admin_password):
     """Verify the same flashcard remains selected after a browser refresh."""
     
@@ -901,6 +889,7 @@ def test_flashcard_position_persists_after_page_refresh(driver, base_url, admin_
     
 @pytest.mark.tcid("TC-FC-032")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_flashcard_position_persists_after_logout_login(driver, base_url, admin_email, admin_password):
     """Verify the same flashcard remains selected after logout then login."""
     
@@ -922,6 +911,7 @@ def test_flashcard_position_persists_after_logout_login(driver, base_url, admin_
     
 @pytest.mark.tcid("TC-FC-033")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_flashcard_position_persists_after_reopening_browser_or_across_devices(driver_factory, base_url, admin_email, admin_password):
     """Verify the same flashcard remains selected after closing and reopening the browser."""
     
@@ -948,6 +938,7 @@ def test_flashcard_position_persists_after_reopening_browser_or_across_devices(d
     
 @pytest.mark.tcid("TC-FC-034")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_flashcard_progress_persists_on_reenter_normal_mode(driver, base_url, admin_email, admin_password):
     """Verify completed words remain persisted after leaving and re-entering flashcards in Normal mode."""
     
@@ -994,6 +985,7 @@ def test_flashcard_progress_persists_on_reenter_normal_mode(driver, base_url, ad
     
 @pytest.mark.tcid("TC-FC-035")
 @pytest.mark.flashcards
+@pytest.mark.state(level="TEST")
 def test_flashcard_progress_persists_on_reenter_review_mode(driver, base_url, admin_email, admin_password):
     """Verify completed words remain persisted after leaving and re-entering flashcards in Review mode."""
     
@@ -1043,6 +1035,7 @@ def test_flashcard_progress_persists_on_reenter_review_mode(driver, base_url, ad
 
 @pytest.mark.tcid("TC-FC-036")
 @pytest.mark.flashcards
+@pytest.mark.state(level="N2")
 def test_study_progress_deletion_after_account_deletion(driver, base_url, test1_email, test1_password):
     """Verify that flashcard progress is wiped and APIs deny access after deleting the account."""
     
@@ -1070,7 +1063,7 @@ def test_study_progress_deletion_after_account_deletion(driver, base_url, test1_
     assert progress_before, "Progress is not saved in DB"
     
     # Delete account
-    r = requests.delete(
+    r = http_client.delete(
         f"{base_url}/api/user",
         cookies=cookies,
         timeout=5,
@@ -1080,7 +1073,7 @@ def test_study_progress_deletion_after_account_deletion(driver, base_url, test1_
     # Wait until study-progress API returns 401
     elapsed = 0
     while elapsed < 5:
-        resp = requests.get(
+        resp = http_client.get(
             f"{base_url}/api/study-progress",
             params={"type": "flashcards", "level": level},
             cookies=cookies,
@@ -3,14 +3,16 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from tests.utils.auth_flows import login
+from selenium.common.exceptions import TimeoutException
+from tests.utils.auth_flows import sign_in
+from tests.utils.navigation import study_path
 
 @pytest.mark.tcid("TC-LEVEL-001")
 @pytest.mark.auth
 def test_all_jlpt_levels_visible(driver, base_url, admin_email, admin_password):
     """Verify all JLPT level buttons (N5–N1) are visible across study pages."""
 
-    login(driver, base_url, admin_email, admin_password)
+    sign_in(driver, base_url, admin_email, admin_password)
     
     pages = ["flashcards", "quiz", "fill-in-the-blank"]
     expected_levels = ["n5", "n4", "n3", "n2", "n1"]
@@ -36,7 +38,7 @@ def test_all_jlpt_levels_visible(driver, base_url, admin_email, admin_password):
 def test_level_card_hover_animation_triggers(driver, base_url, admin_email, admin_password):
     """Verify level card hover triggers a CSS transform animation on the button."""
 
-    login(driver, base_url, admin_email, admin_password)
+    sign_in(driver, base_url, admin_email, admin_password)
     driver.get(f"{base_url}/study/flashcards")
     
     level_btn = WebDriverWait(driver, 5).until(
@@ -55,3 +57,50 @@ def wait_for_transform_change(driver, element, old_val, timeout=1.0, poll_interv
         lambda d: element.value_of_css_property("transform") != old_val,
         "Hover transform animation did not trigger"
     )
+
+@pytest.mark.tcid("TC-LEVEL-003")
+@pytest.mark.auth
+@pytest.mark.parametrize("menu_item, section, quiz_type", [
+    ("flashcards-btn", "flashcards", None),
+    ("quiz-btn", "quiz", "kanji-to-furigana"),
+    ("fill-btn", "fill", None),
+])
+def test_study_menu_hover_path_reaches_study_page(driver, base_url, admin_email, admin_password, menu_item, section, quiz_type):
+    """Verify the Study menu hover path lands on the same route the deep-link navigator opens."""
+
+    level = "n5"
+    sign_in(driver, base_url, admin_email, admin_password)
+    WebDriverWait(driver, 5).until(EC.url_to_be(f"{base_url}/"), "Did not navigate to main page")
+
+    study_btn = WebDriverWait(driver, 5).until(
+        EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='study-btn']")),
+        "Study button is not found"
+    )
+    for attempt in range(3):
+        ActionChains(driver).move_to_element(study_btn).pause(0.2).perform()
+        try:
+            WebDriverWait(driver, 2).until(
+                EC.element_to_be_clickable((By.CSS_SELECTOR, f"[data-testid='{menu_item}']")),
+                f"{menu_item} is not clickable"
+            ).click()
+            break
+        except TimeoutException:
+            if attempt == 2:
+                raise
+    WebDriverWait(driver, 5).until(EC.url_to_be(f"{base_url}{study_path(section)}"))
+
+    WebDriverWait(driver, 5).until(
+        EC.element_to_be_clickable((By.CSS_SELECTOR, f"[data-testid='level-btn-{level}']")),
+        f"{level.upper()} button is not clickable"
+    ).click()
+    if quiz_type is not None:
+        WebDriverWait(driver, 5).until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, f"[data-testid='{quiz_type}-btn']")),
+            f"{quiz_type} button is not clickable"
+        ).click()
+
+    expected = f"{base_url}{study_path(section, level, quiz_type)}"
+    WebDriverWait(driver, 5).until(
+        EC.url_to_be(expected),
+        f"Menu path did not land on {expected}"
+    )
@@ -0,0 +1,92 @@
+import pytest
+from tests.utils.api_bench import benchmark, find_regressions
+from tests.utils.auth_flows import fetch_auth_cookie
+from tests.utils.perf_stats import summarize
+from tests.utils.word_catalog import catalog_for
+
+BENCH_LEVEL = "TEST"
+
+@pytest.fixture(scope="module", autouse=True)
+def _api_bench_opt_in(request):
+    if not (request.config.getoption("--run-api-bench") or request.config.getoption("--update-api-baseline")):
+        pytest.skip("API latency benchmarks are opt-in; pass --run-api-bench (or --update-api-baseline)")
+
+@pytest.fixture(scope="module")
+def auth_cookies(base_url, admin_email, admin_password):
+    cookie = fetch_auth_cookie(base_url, admin_email, admin_password)
+    return {cookie["name"]: cookie["value"]}
+
+def run_endpoint_benchmark(endpoint, method, url, api_bench, nfr_report, **kwargs):
+    """Benchmark one endpoint, record min/p50/p95/p99/max and compare against the stored baseline."""
+
+    latencies = benchmark(method, url, api_bench["runs"], **kwargs)
+    summary = summarize(latencies)
+    nfr_report.setdefault("api", {})[endpoint] = summary
+
+    if api_bench["update"]:
+        api_bench["measured"][endpoint] = summary
+        return
+
+    baseline = api_bench["baseline"].get(endpoint)
+    if baseline is None:
+        pytest.skip(
+            f"No latency baseline for {endpoint}, so regressions cannot be detected (measured {summary}); "
+            f"record one against a representative environment with --update-api-baseline and commit it"
+        )
+
+    regressions = find_regressions(summary, baseline, api_bench["tolerance"], api_bench["slack_ms"])
+    assert not regressions, f"{endpoint} latency regressed: " + "; ".join(regressions)
+
+@pytest.mark.tcid("TC-NFR-007")
+@pytest.mark.nfr
+def test_study_progress_latency(base_url, auth_cookies, api_bench, nfr_report):
+    """Verify GET /api/study-progress latency has not regressed against the baseline."""
+
+    run_endpoint_benchmark(
+        "GET /api/study-progress", "GET", f"{base_url}/api/study-progress", api_bench, nfr_report,
+        params={"type": "flashcards", "level": BENCH_LEVEL}, cookies=auth_cookies,
+    )
+
+@pytest.mark.tcid("TC-NFR-008")
+@pytest.mark.nfr
+def test_study_progress_reset_latency(base_url, auth_cookies, api_bench, nfr_report):
+    """Verify POST /api/study-progress/reset latency has not regressed against the baseline."""
+
+    run_endpoint_benchmark(
+        "POST /api/study-progress/reset", "POST", f"{base_url}/api/study-progress/reset", api_bench, nfr_report,
+        params={"type": "flashcards", "level": BENCH_LEVEL}, cookies=auth_cookies,
+    )
+
+@pytest.mark.tcid("TC-NFR-009")
+@pytest.mark.nfr
+def test_words_summary_latency(base_url, auth_cookies, api_bench, nfr_report):
+    """Verify GET /api/words?summary=true latency has not regressed against the baseline."""
+
+    run_endpoint_benchmark(
+        "GET /api/words", "GET", f"{base_url}/api/words", api_bench, nfr_report,
+        params={"summary": "true"}, cookies=auth_cookies,
+    )
+
+@pytest.mark.tcid("TC-NFR-010")
+@pytest.mark.nfr
+def test_word_by_id_latency(base_url, auth_cookies, api_bench, nfr_report):
+    """Verify GET /api/words/{id} latency has not regressed against the baseline."""
+
+    word_ids = catalog_for(base_url).word_ids(BENCH_LEVEL)
+    if not word_ids:
+        pytest.skip(f"Could not list {BENCH_LEVEL} word ids to benchmark /api/words/{{id}}")
+
+    run_endpoint_benchmark(
+        "GET /api/words/{id}", "GET", f"{base_url}/api/words/{word_ids[0]}", api_bench, nfr_report,
+        cookies=auth_cookies,
+    )
+
+@pytest.mark.tcid("TC-NFR-011")
+@pytest.mark.nfr
+def test_favorites_latency(base_url, auth_cookies, api_bench, nfr_report):
+    """Verify GET /api/favorites latency has not regressed against the baseline."""
+
+    run_endpoint_benchmark(
+        "GET /api/favorites", "GET", f"{base_url}/api/favorites", api_bench, nfr_report,
+        cookies=auth_cookies,
+    )
@@ -0,0 +1,27 @@
+import pytest
+from tests.utils.load_gen import load_accounts, parse_stages, run_load
+
+@pytest.mark.tcid("TC-NFR-012")
+@pytest.mark.nfr
+def test_backend_sustains_concurrent_study_traffic(request, base_url, nfr_report):
+    """Verify the backend serves concurrent virtual learners with an error rate under the threshold."""
+
+    config = request.config
+    if not config.getoption("--run-load"):
+        pytest.skip("Load test is opt-in; pass --run-load to hit the backend with virtual users")
+    accounts = load_accounts()
+    if not accounts:
+        pytest.skip("LOAD_ACCOUNTS is not set; the load test needs its own accounts, not the functional suite's")
+    summary = run_load(
+        base_url,
+        accounts,
+        parse_stages(config.getoption("--load-stages")),
+        hold_s=config.getoption("--load-hold"),
+    )
+    nfr_report["load"] = summary
+
+    assert summary["requests"] > 0, "Virtual users did not send any requests"
+    max_error_rate = config.getoption("--load-max-error-rate")
+    assert summary["error_rate"] <= max_error_rate, (
+        f"Error rate {summary['error_rate']:.2%} exceeds {max_error_rate:.2%}: {summary['error_samples']}"
+    )
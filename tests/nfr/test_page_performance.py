@@ -0,0 +1,88 @@
+import pytest
+from tests.utils.auth_flows import sign_in
+from tests.utils.navigation import study_path
+from tests.utils.page_timing import measure_page_load
+from tests.utils.perf_trace import trace_phase, tracing_enabled
+from tests.utils.perf_stats import summarize
+
+LEVELS = ["n5", "n4", "n3", "n2", "n1"]
+QUIZ_TYPE = "kanji-to-furigana"
+
+def budgets_for(page_budgets, path_key):
+    """Merge the default p95 budgets (ms) with the overrides for one page."""
+
+    budgets = dict(page_budgets.get("default", {}))
+    budgets.update(page_budgets.get("pages", {}).get(path_key, {}))
+    return budgets
+
+def check_page_against_budgets(driver, url, path_key, runs, page_budgets, nfr_report):
+    """Load the page `runs` times, record p50/p95 per metric and assert every p95 is within budget."""
+
+    samples = measure_page_load(driver, url, runs)
+    if tracing_enabled():
+        # One extra, traced load after the measured runs; it is not one of the samples
+        with trace_phase(driver, "page load"):
+            driver.get(url)
+    summary = {metric: summarize(values) for metric, values in samples.items() if values}
+    nfr_report.setdefault("pages", {})[path_key] = summary
+
+    budgets = budgets_for(page_budgets, path_key)
+    over_budget = [
+        f"{metric} p95={summary[metric]['p95']}ms > {budget}ms"
+        for metric, budget in budgets.items()
+        if metric in summary and summary[metric]["p95"] > budget
+    ]
+    assert not over_budget, f"{path_key} over budget across {runs} runs: " + "; ".join(over_budget)
+    return summary
+
+@pytest.mark.tcid("TC-NFR-001")
+@pytest.mark.nfr
+def test_login_page_load_within_budget(driver, base_url, perf_runs, page_budgets, nfr_report):
+    """Verify the login page meets its load and paint budgets at p95."""
+
+    check_page_against_budgets(driver, f"{base_url}/login", "/login", perf_runs, page_budgets, nfr_report)
+
+@pytest.mark.tcid("TC-NFR-002")
+@pytest.mark.nfr
+def test_signup_page_load_within_budget(driver, base_url, perf_runs, page_budgets, nfr_report):
+    """Verify the signup page meets its load and paint budgets at p95."""
+
+    check_page_against_budgets(driver, f"{base_url}/signup", "/signup", perf_runs, page_budgets, nfr_report)
+
+@pytest.mark.tcid("TC-NFR-003")
+@pytest.mark.nfr
+def test_account_page_load_within_budget(driver, base_url, admin_email, admin_password, perf_runs, page_budgets, nfr_report):
+    """Verify the logged-in account page meets its load and paint budgets at p95."""
+
+    sign_in(driver, base_url, admin_email, admin_password)
+    check_page_against_budgets(driver, f"{base_url}/account", "/account", perf_runs, page_budgets, nfr_report)
+
+@pytest.mark.tcid("TC-NFR-004")
+@pytest.mark.nfr
+@pytest.mark.parametrize("level", LEVELS)
+def test_flashcards_page_load_within_budget(driver, base_url, admin_email, admin_password, level, perf_runs, page_budgets, nfr_report):
+    """Verify the flashcards page of each JLPT level meets its load and paint budgets at p95."""
+
+    sign_in(driver, base_url, admin_email, admin_password)
+    path = study_path("flashcards", level)
+    check_page_against_budgets(driver, f"{base_url}{path}", path, perf_runs, page_budgets, nfr_report)
+
+@pytest.mark.tcid("TC-NFR-005")
+@pytest.mark.nfr
+@pytest.mark.parametrize("level", LEVELS)
+def test_quiz_page_load_within_budget(driver, base_url, admin_email, admin_password, level, perf_runs, page_budgets, nfr_report):
+    """Verify the quiz page of each JLPT level meets its load and paint budgets at p95."""
+
+    sign_in(driver, base_url, admin_email, admin_password)
+    path = study_path("quiz", level, QUIZ_TYPE)
+    check_page_against_budgets(driver, f"{base_url}{path}", path, perf_runs, page_budgets, nfr_report)
+
+@pytest.mark.tcid("TC-NFR-006")
+@pytest.mark.nfr
+@pytest.mark.parametrize("level", LEVELS)
+def test_fill_page_load_within_budget(driver, base_url, admin_email, admin_password, level, perf_runs, page_budgets, nfr_report):
+    """Verify the fill-in-the-blank page of each JLPT level meets its load and paint budgets at p95."""
+
+    sign_in(driver, base_url, admin_email, admin_password)
+    path = study_path("fill", level)
+    check_page_against_budgets(driver, f"{base_url}{path}", path, perf_runs, page_budgets, nfr_report)
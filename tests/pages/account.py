@@ -0,0 +1,38 @@
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from tests.pages.auth import NAV_HELLO
+from tests.pages.base import Page
+
+ACCOUNT_LINK = (By.XPATH, "//a[@href='/account']")
+ACCOUNT_SETTINGS_TAB = (By.CSS_SELECTOR, "[data-testid='account-settings-tab']")
+STUDY_PROGRESS_TAB = (By.CSS_SELECTOR, "[data-testid='study-progress-tab']")
+CURRENT_USERNAME_TEXT = (By.XPATH, "//*[contains(normalize-space(.), 'Current username:')]")
+PROGRESS_TOTAL_LABEL = (By.CSS_SELECTOR, "[data-testid='progress-total']")
+USERNAME_FIELD = (By.CSS_SELECTOR, "[data-testid='username-field']")
+USERNAME_CHECK = (By.CSS_SELECTOR, "[data-testid='username-check']")
+PW_FIELD = (By.CSS_SELECTOR, "[data-testid='pw-field']")
+PW_CHECK = (By.CSS_SELECTOR, "[data-testid='pw-check']")
+SAVE_BTN = (By.CSS_SELECTOR, "[data-testid='save-btn']")
+SUCCESS_MSG = (By.CSS_SELECTOR, "[data-testid='success-msg']")
+DELETE_BTN = (By.CSS_SELECTOR, "[data-testid='delete-btn']")
+
+class AccountPage(Page):
+
+    def open_from_header(self, base_url):
+        """Open My Account through the header dropdown."""
+
+        nav_hello = self.element(NAV_HELLO)
+        ActionChains(self.driver).move_to_element(nav_hello).perform()
+        self.click(ACCOUNT_LINK)
+        WebDriverWait(self.driver, self.timeout).until(EC.url_to_be(f"{base_url}/account"))
+
+    def open_settings_tab(self):
+        self.click(ACCOUNT_SETTINGS_TAB)
+
+    def current_username(self):
+        label = self.text(CURRENT_USERNAME_TEXT).strip()
+        if ":" in label:
+            return label.split(":", 1)[1].strip()
+        raise AssertionError(f"Unexpected username label: {label!r}")
@@ -0,0 +1,47 @@
+from selenium.webdriver.common.by import By
+from tests.pages.base import Page
+
+USERNAME = (By.XPATH, "//input[@placeholder='Username']")
+EMAIL = (By.XPATH, "//input[@placeholder='Email']")
+PASSWORD = (By.XPATH, "//input[@placeholder='Password']")
+CONFIRM_PW = (By.XPATH, "//input[@placeholder='Confirm Password']")
+SIGNUP_BTN = (By.XPATH, '//button[text()="Sign Up"]')
+SIGNUP_SUBMIT = (By.XPATH, '//button[normalize-space()="Sign Up"]')
+LOGIN_SUBMIT = (By.XPATH, '//button[text()="Log In"]')
+USERNAME_FB = (By.CSS_SELECTOR, "[data-testid='username-feedback']")
+EMAIL_ERR = (By.CSS_SELECTOR, "[data-testid='email-feedback']")
+CONFIRM_PW_ERR = (By.CSS_SELECTOR, "[data-testid='confirm-pw-error']")
+LOGIN_ERR = (By.CSS_SELECTOR, "[data-testid='credentials-error']")
+RESEND_BTN = (By.CSS_SELECTOR, "[data-testid='resend-verification-btn']")
+NAV_LOGIN_BTN = (By.CSS_SELECTOR, "[data-testid='login-btn']")
+NAV_HELLO = (By.CSS_SELECTOR, "[data-testid='nav-hello']")
+LOGOUT_BTN = (By.CSS_SELECTOR, "[data-testid='logout-btn']")
+VERIFIED_MSG = (By.XPATH, "//*[contains(., 'successfully verified')]")
+
+class SignupPage(Page):
+
+    def open(self, base_url):
+        self.driver.get(f"{base_url}/signup")
+
+    def fill(self, username, email, password, confirm_password=None):
+        """Fill in every sign-up input; the confirmation defaults to `password`."""
+
+        self.type(USERNAME, username)
+        self.type(EMAIL, email)
+        self.type(PASSWORD, password)
+        self.type(CONFIRM_PW, password if confirm_password is None else confirm_password)
+
+    def submit(self):
+        self.use(SIGNUP_SUBMIT, lambda element: element.click())
+
+class LoginPage(Page):
+
+    def open(self, base_url):
+        self.driver.get(f"{base_url}/login")
+
+    def fill(self, email, password):
+        self.type(EMAIL, email)
+        self.type(PASSWORD, password)
+
+    def submit(self):
+        self.use(LOGIN_SUBMIT, lambda element: element.click())
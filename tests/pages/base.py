@@ -0,0 +1,103 @@
+import weakref
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+_pages = weakref.WeakKeyDictionary()
+
+class Page:
+    """Element handles of one page, found once and found again only when they go stale.
+
+    Rationale: Every helper used to run `WebDriverWait(...).until(presence_of_element_located(...))`
+    before touching an element, which is one `findElement` round trip per call
+    even when the element has not changed. A page object keeps the handle from
+    the first lookup and reuses it. When the app re-renders the node (or the
+    browser navigates), the next call raises StaleElementReferenceException,
+    and only then is the locator resolved again.
+
+    Use `Page.on(driver)` so the helpers working on the same browser share one
+    instance, and so its cache.
+    """
+
+    timeout = 5
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._handles = {}
+
+    @classmethod
+    def on(cls, driver):
+        """Return this page's object for the driver, creating it on first use."""
+
+        pages = _pages.setdefault(driver, {})
+        if cls not in pages:
+            pages[cls] = cls(driver)
+        return pages[cls]
+
+    def element(self, locator, timeout=None):
+        """Return the cached handle for `locator`, waiting for the element on the first lookup."""
+
+        handle = self._handles.get(locator)
+        if handle is None:
+            handle = WebDriverWait(self.driver, timeout or self.timeout).until(
+                EC.presence_of_element_located(locator),
+                f"Element {locator[1]} not found"
+            )
+            self._handles[locator] = handle
+        return handle
+
+    def forget(self, locator=None):
+        """Drop the cached handle for `locator`, or all of them."""
+
+        if locator is None:
+            self._handles.clear()
+        else:
+            self._handles.pop(locator, None)
+
+    def use(self, locator, action, timeout=None):
+        """Return `action(element)`, resolving the locator again once if the handle went stale."""
+
+        try:
+            return action(self.element(locator, timeout))
+        except StaleElementReferenceException:
+            self.forget(locator)
+            return action(self.element(locator, timeout))
+
+    def wait_until(self, locator, condition, timeout=None, message=None):
+        """Poll `condition(element)` on the cached handle until it is truthy; return the element."""
+
+        def check(_driver):
+            try:
+                element = self.element(locator, timeout)
+                return element if condition(element) else False
+            except StaleElementReferenceException:
+                self.forget(locator)
+                return False
+
+        return WebDriverWait(self.driver, timeout or self.timeout).until(
+            check, message or f"Element {locator[1]} did not reach the expected state"
+        )
+
+    def text(self, locator):
+        return self.use(locator, lambda element: element.text)
+
+    def attribute(self, locator, name):
+        return self.use(locator, lambda element: element.get_attribute(name))
+
+    def click(self, locator, timeout=None):
+        """Click the element once it is displayed and enabled."""
+
+        self.wait_until(
+            locator,
+            lambda element: element.is_displayed() and element.is_enabled(),
+            timeout,
+            f"Element {locator[1]} is not clickable",
+        )
+        self.use(locator, lambda element: element.click())
+
+    def type(self, locator, text, clear=True):
+        def send(element):
+            if clear:
+                element.clear()
+            element.send_keys(text)
+        self.use(locator, send)
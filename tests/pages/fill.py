@@ -0,0 +1,28 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from tests.pages.study import StudyPage
+
+FILL_BOX = (By.CSS_SELECTOR, "[data-testid='fill-box']")
+FILL_ANS = (By.CSS_SELECTOR, "[data-testid='fill-answer']")
+INPUT_BOX = (By.CSS_SELECTOR, "[data-testid='input-box']")
+SUBMIT_BTN = (By.CSS_SELECTOR, "[data-testid='submit-btn']")
+ENG_MEANING = (By.CSS_SELECTOR, "[data-testid='english-meaning']")
+BLK_SENTENCE = (By.CSS_SELECTOR, "[data-testid='blank-sentence']")
+
+class FillPage(StudyPage):
+    WORD = FILL_BOX
+
+    def enter(self, answer):
+        """Type the answer into the input box without submitting it."""
+
+        self.type(INPUT_BOX, answer)
+
+    def submit(self, answer=None, keyboard=False):
+        """Submit the answer (or what is already typed) with the Submit button, or with Enter."""
+
+        if answer is not None:
+            self.enter(answer)
+        if keyboard:
+            self.type(INPUT_BOX, Keys.ENTER, clear=False)
+        else:
+            self.click(SUBMIT_BTN)
@@ -0,0 +1,31 @@
+from selenium.webdriver.common.by import By
+from tests.pages.study import StudyPage
+
+VOCAB = (By.CSS_SELECTOR, "[data-testid='vocabulary']")
+FURIGANA = (By.CSS_SELECTOR, "[data-testid='furigana']")
+O_BTN = (By.CSS_SELECTOR, "[data-testid='o-btn']")
+X_BTN = (By.CSS_SELECTOR, "[data-testid='x-btn']")
+EX_BTN = (By.CSS_SELECTOR, "[data-testid='example-btn']")
+EX_SENTENCE = (By.CSS_SELECTOR, "[data-testid='ex-sentence']")
+EX_TRANSLATION = (By.CSS_SELECTOR, "[data-testid='ex-translation']")
+MEANING_BTN = (By.CSS_SELECTOR, "[data-testid='meaning-btn']")
+MEANING = (By.CSS_SELECTOR, "[data-testid='meaning']")
+FAVORITE_BTN = (By.CSS_SELECTOR, "[data-testid='favorite-btn']")
+STAR_BTN = (By.CSS_SELECTOR, "[data-testid='star-btn']")
+FAVORITES_BTN = (By.CSS_SELECTOR, "[data-testid='level-btn-favorites']")
+
+class FlashcardsPage(StudyPage):
+    WORD = VOCAB
+
+    def mark(self, correct=True):
+        """Click O (correct) or X once it is clickable; return the id of the word that was marked."""
+
+        button = O_BTN if correct else X_BTN
+        self.wait_until(
+            button,
+            lambda element: element.is_displayed() and element.is_enabled(),
+            message=f"{'O' if correct else 'X'} button is not clickable",
+        )
+        word_id = self.word_id()
+        self.click(button)
+        return word_id
@@ -0,0 +1,24 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from tests.pages.study import StudyPage
+
+QUIZ = (By.CSS_SELECTOR, "[data-testid='question-box']")
+ANSWERS = (By.CSS_SELECTOR, "[data-testid^='answer-']")
+ANS_BTN_1 = (By.CSS_SELECTOR, "[data-testid='answer-1']")
+ANS_BTN_2 = (By.CSS_SELECTOR, "[data-testid='answer-2']")
+ANS_BTN_3 = (By.CSS_SELECTOR, "[data-testid='answer-3']")
+ANS_BTN_4 = (By.CSS_SELECTOR, "[data-testid='answer-4']")
+K_TO_F_BTN = (By.CSS_SELECTOR, "[data-testid='kanji-to-furigana-btn']")
+F_TO_K_BTN = (By.CSS_SELECTOR, "[data-testid='furigana-to-kanji-btn']")
+
+class QuizPage(StudyPage):
+    WORD = QUIZ
+
+    def answer_buttons(self):
+        """Return the answer buttons; not cached, since each question renders new ones."""
+
+        return WebDriverWait(self.driver, self.timeout).until(
+            EC.presence_of_all_elements_located(ANSWERS),
+            "Quiz answer buttons not found"
+        )
@@ -0,0 +1,28 @@
+from selenium.webdriver.common.by import By
+from tests.pages.base import Page
+
+PROG_CNT = (By.CSS_SELECTOR, "[data-testid='progress-counter']")
+PROG_BAR = (By.CSS_SELECTOR, "[data-testid='progress-bar-inner']")
+
+class StudyPage(Page):
+    """Shared parts of the flashcards, quiz and fill pages: the current word and the progress indicators."""
+
+    WORD = None
+
+    def word_id(self):
+        return self.attribute(self.WORD, "data-word-id")
+
+    def snapshot(self, buttons=()):
+        """Word id, `buttons` disabled flags and progress indicators in one round trip (see dom_snapshot)."""
+
+        from tests.utils.dom_snapshot import take_snapshot
+
+        return take_snapshot(self.driver, self.WORD, buttons)
+
+    def progress_counts(self):
+        """Return (current, total, text) from the progress counter, e.g. '3 / 10 (30%)'."""
+
+        return self.snapshot().progress_counts()
+
+    def progress_bar_percent(self):
+        return self.snapshot().progress_bar_percent()
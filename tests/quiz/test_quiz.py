@@ -1,7 +1,6 @@
-import re
 import time
 import pytest
-import requests
+from tests.utils import http_client
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -9,38 +8,25 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, UnexpectedAlertPresentException
 from tests.auth.test_auth_email_verification import _dismiss_alert_if_present
 from tests.utils.auth_flows import fill_and_submit_signup, get_auth_cookies, logout, make_unique_username
-from tests.utils.db_client import get_study_progress, get_word_from_word_id
+from tests.utils.db_client import get_study_progress
 from tests.utils.email_verification import fetch_verify_url_from_mailhog
 from tests.utils.quiz_flows import answer_all_quizzes_correctly_and_accept_alert, click_correct_quiz_answer, click_incorrect_quiz_answer, dismiss_review_mode_modal, enter_review_mode, get_correct_quiz_answer_element, login_and_open_quiz_page, login_and_open_quiz_page_with_level_reset, login_and_open_quiz_type_selection_page, reset_quiz_level_progress, solve_quizzes, wait_for_completion_state, wait_for_quiz_advance, wait_stays_disabled_until_advance
+from tests.pages.quiz import ANS_BTN_1, F_TO_K_BTN, K_TO_F_BTN, QUIZ, QuizPage
+from tests.pages.study import PROG_BAR, PROG_CNT
 
 STUDY_BTN = (By.CSS_SELECTOR, "[data-testid='study-btn']")
-QUIZ = (By.CSS_SELECTOR, "[data-testid='question-box']")
-ANS_BTN_1 = (By.CSS_SELECTOR, "[data-testid='answer-1']")
-ANS_BTN_2 = (By.CSS_SELECTOR, "[data-testid='answer-2']")
-ANS_BTN_3 = (By.CSS_SELECTOR, "[data-testid='answer-3']")
-ANS_BTN_4 = (By.CSS_SELECTOR, "[data-testid='answer-4']")
 QZ_BTN = (By.CSS_SELECTOR, "[data-testid='quiz-btn']")
-K_TO_F_BTN = (By.CSS_SELECTOR, "[data-testid='kanji-to-furigana-btn']")
-F_TO_K_BTN = (By.CSS_SELECTOR, "[data-testid='furigana-to-kanji-btn']")
-PROG_CNT = (By.CSS_SELECTOR, "[data-testid='progress-counter']")
-PROG_BAR = (By.CSS_SELECTOR, "[data-testid='progress-bar-inner']")
 SUBJECT = "NORI Email Verification"
 
 def get_quiz_progress_counts(driver):
-    text = driver.find_element(*PROG_CNT).text.strip()
-    fraction = text.split("(", 1)[0]
-    current_str, total_str = [part.strip() for part in fraction.split("/", 1)]
-    return int(current_str), int(total_str), text
+    return QuizPage.on(driver).progress_counts()
 
 def get_progress_bar_percent(driver):
-    style = driver.find_element(*PROG_BAR).get_attribute("style") or ""
-    match = re.search(r"width:\s*([0-9.]+)%", style)
-    if not match:
-        raise AssertionError(f"Progress bar width not found in style: {style!r}")
-    return float(match.group(1))
+    return QuizPage.on(driver).progress_bar_percent()
 
 @pytest.mark.tcid("TC-QZ-001")
 @pytest.mark.quiz
+@pytest.mark.state(level="N2")
 def test_quiz_type_selection_page_loads(driver, base_url, admin_email, admin_password):
     """Load quiz type selection page and verify both type buttons render with correct Japanese labels."""
     
@@ -60,6 +46,7 @@ def test_quiz_type_selection_page_loads(driver, base_url, admin_email, admin_pas
 
 @pytest.mark.tcid("TC-QZ-002")
 @pytest.mark.quiz
+@pytest.mark.state(level="N2")
 def test_quiz_type_button_hover_changes_scale(driver, base_url, admin_email, admin_password):
     """Verify that hovering quiz type buttons trigger scale-up transform effect."""
 
@@ -95,6 +82,7 @@ def wait_for_transform_change(driver, element, old_val, timeout=1.0, poll_interv
     
 @pytest.mark.tcid("TC-QZ-003")
 @pytest.mark.quiz
+@pytest.mark.state(level="N2")
 def test_quiz_type_button_hover_changes_color(driver, base_url, admin_email, admin_password):
     """Verify that hovering quiz type buttons trigger color transform effect."""
 
@@ -122,6 +110,7 @@ def test_quiz_type_button_hover_changes_color(driver, base_url, admin_email, adm
 
 @pytest.mark.tcid("TC-QZ-004")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_correct_answer_marks_quiz_as_completed(driver, base_url, admin_email, admin_password):
     """Verify that selecting the correct answer marks the quiz item as completed in the database."""
     
@@ -137,13 +126,14 @@ def test_correct_answer_marks_quiz_as_completed(driver, base_url, admin_email, a
     # Assert DB state
     word_id = question.get_attribute("data-word-id")
     cookies = get_auth_cookies(driver)  
-    progress = wait_for_completion_state(base_url, word_id, cookies, expected=True, level=level, type=type)
+    progress = wait_for_completion_state(base_url, word_id, cookies, expected=True, level=level, type=type, driver=driver)
     assert progress and progress.get("completed") is True, (
         f"Word {word_id} not marked as completed within 5s"
     )
     
 @pytest.mark.tcid("TC-QZ-005")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_incorrect_answer_marks_quiz_as_incomplete(driver, base_url, admin_email, admin_password):
     """Verify that selecting an incorrect answer keeps the quiz item marked as incomplete in the database."""
     
@@ -159,14 +149,15 @@ def test_incorrect_answer_marks_quiz_as_incomplete(driver, base_url, admin_email
     # Assert DB state
     word_id = question.get_attribute("data-word-id")
     cookies = get_auth_cookies(driver)  
-    progress = wait_for_completion_state(base_url, word_id, cookies, expected=False, level=level, type=type)
+    progress = wait_for_completion_state(base_url, word_id, cookies, expected=False, level=level, type=type, driver=driver)
     assert progress and progress.get("completed") is False, (
         f"Word {word_id} is marked as complete"
     )
 
 @pytest.mark.tcid("TC-QZ-006")
 @pytest.mark.quiz
-def test_kanji_to_furigana_quiz_displays_correct_format(driver, base_url, admin_email, admin_password):
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="TEST")
+def test_kanji_to_furigana_quiz_displays_correct_format(driver, base_url, admin_email, admin_password, word_catalog):
     """Verify Kanji-to-Furigana quiz shows a Kanji question and four unique Furigana answer choices including the correct answer."""
     
     level = "TEST"
@@ -180,7 +171,7 @@ def test_kanji_to_furigana_quiz_displays_correct_format(driver, base_url, admin_
     assert "テスト" in q_box.text, f"Quiz is not displaying Kanji. Displaying: {q_box.text}"
     
     word_id = q_box.get_attribute("data-word-id")
-    answer = get_word_from_word_id(base_url, word_id)['furigana']
+    answer = word_catalog.answer(word_id, "furigana", level)
     option_texts = []
     for i in range(1, 5):
         ans_btn = WebDriverWait(driver, 5).until(
@@ -199,7 +190,8 @@ def test_kanji_to_furigana_quiz_displays_correct_format(driver, base_url, admin_
     
 @pytest.mark.tcid("TC-QZ-007")
 @pytest.mark.quiz
-def test_furigana_to_kanji_quiz_displays_correct_format(driver, base_url, admin_email, admin_password):
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
+def test_furigana_to_kanji_quiz_displays_correct_format(driver, base_url, admin_email, admin_password, word_catalog):
     """Verify Furigana-to-Kanji quiz shows a Furigana question and four unique Kanji answer choices including the correct answer."""
     
     level = "TEST"
@@ -213,7 +205,7 @@ def test_furigana_to_kanji_quiz_displays_correct_format(driver, base_url, admin_
     assert "てすと" in q_box.text, f"Quiz is not displaying Kanji. Displaying: {q_box.text}"
     
     word_id = q_box.get_attribute("data-word-id")
-    answer = get_word_from_word_id(base_url, word_id)['kanji']
+    answer = word_catalog.answer(word_id, "kanji", level)
     option_texts = []
     for i in range(1, 5):
         ans_btn = WebDriverWait(driver, 5).until(
@@ -232,6 +224,7 @@ def test_furigana_to_kanji_quiz_displays_correct_format(driver, base_url, admin_
 
 @pytest.mark.tcid("TC-QZ-008")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="TEST")
 def test_answer_quiz_with_mouse_click(driver, base_url, admin_email, admin_password):
     """Click first answer with mouse and confirm the quiz advances to a new word ID."""
     
@@ -253,6 +246,7 @@ def test_answer_quiz_with_mouse_click(driver, base_url, admin_email, admin_passw
     
 @pytest.mark.tcid("TC-QZ-009")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_answer_quiz_with_keyboard_input(driver, base_url, admin_email, admin_password):
     """Press number keys 1–4 to select answers; assert each key triggers selection and advances to next quiz item."""
     
@@ -272,6 +266,7 @@ def test_answer_quiz_with_keyboard_input(driver, base_url, admin_email, admin_pa
 
 @pytest.mark.tcid("TC-QZ-010")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="TEST")
 def test_correct_quiz_answer_color_feedback(driver, base_url, admin_email, admin_password):
     """After selecting the correct answer, its button turns green and the other answers dim to orange."""
     
@@ -298,6 +293,7 @@ def test_correct_quiz_answer_color_feedback(driver, base_url, admin_email, admin
         
 @pytest.mark.tcid("TC-QZ-011")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_incorrect_quiz_answer_color_feedback(driver, base_url, admin_email, admin_password):
     """After selecting an incorrect answer, that button turns red, the correct one turns green, and remaining answers dim to orange."""
     
@@ -331,6 +327,7 @@ def test_incorrect_quiz_answer_color_feedback(driver, base_url, admin_email, adm
         
 @pytest.mark.tcid("TC-QZ-012")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_answer_buttons_disabled_until_next_quiz(driver, base_url, admin_email, admin_password):
     """Verify that answer buttons become disabled immediately after click,
     remain disabled until the next quiz loads, and then re-enable properly.
@@ -364,6 +361,7 @@ def test_answer_buttons_disabled_until_next_quiz(driver, base_url, admin_email,
     
 @pytest.mark.tcid("TC-QZ-013")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_number_keys_select_corresponding_answers(driver, base_url, admin_email, admin_password):
     """Validate numeric keyboard shortcuts (1–4) select the corresponding answer button and show selection color feedback before advancing."""
     
@@ -389,6 +387,7 @@ def test_number_keys_select_corresponding_answers(driver, base_url, admin_email,
 
 @pytest.mark.tcid("TC-QZ-014")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="TEST")
 def test_quiz_progress_counter_increments_on_correct_answer(driver, base_url, admin_email, admin_password):
     """Verify progress counter and bar increment on correct answer and DB marks completion."""
     
@@ -421,11 +420,12 @@ def test_quiz_progress_counter_increments_on_correct_answer(driver, base_url, ad
     )
     
     cookies = get_auth_cookies(driver)
-    progress = wait_for_completion_state(base_url, word_id, cookies, expected=True, level=level, type=type)
+    progress = wait_for_completion_state(base_url, word_id, cookies, expected=True, level=level, type=type, driver=driver)
     assert progress and progress.get("completed") is True, "Quiz item not marked complete in DB"
 
 @pytest.mark.tcid("TC-QZ-015")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_quiz_progress_counter_unchanged_on_incorrect_answer(driver, base_url, admin_email, admin_password):
     """Verify progress counter and bar do not change on incorrect answer and DB remains incomplete."""
     
@@ -455,11 +455,12 @@ def test_quiz_progress_counter_unchanged_on_incorrect_answer(driver, base_url, a
     assert abs(bar_after - bar_before) < 0.1, "Progress bar changed after incorrect answer"
     
     cookies = get_auth_cookies(driver)
-    progress = wait_for_completion_state(base_url, word_id, cookies, expected=False, level=level, type=type)
+    progress = wait_for_completion_state(base_url, word_id, cookies, expected=False, level=level, type=type, driver=driver)
     assert progress is not None and progress.get("completed") is False, "Quiz item incorrectly marked complete in DB"
 
 @pytest.mark.tcid("TC-QZ-016")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="TEST")
 def test_quiz_rapid_clicking_does_not_duplicate_increment(driver, base_url, admin_email, admin_password):
     """Verify rapid clicks on the same answer only increment progress once."""
     
@@ -490,6 +491,7 @@ def test_quiz_rapid_clicking_does_not_duplicate_increment(driver, base_url, admi
 
 @pytest.mark.tcid("TC-QZ-017")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="TEST")
 def test_quiz_review_mode_modal_appears(driver, base_url, admin_email, admin_password):
     """Verify that the review mode modal appears"""
     
@@ -517,6 +519,7 @@ def test_quiz_review_mode_modal_appears(driver, base_url, admin_email, admin_pas
     
 @pytest.mark.tcid("TC-QZ-018")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_accepting_review_modal_starts_quiz_review_mode(driver, base_url, admin_email, admin_password):
     """Enter review mode by triggering modal; accept it and verify progress counter indicates '(Review Mode)'."""
     
@@ -533,6 +536,7 @@ def test_accepting_review_modal_starts_quiz_review_mode(driver, base_url, admin_
 
 @pytest.mark.tcid("TC-QZ-019")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_cancel_review_modal_redirects_and_resets_quiz_progress(driver, base_url, admin_email, admin_password):
     """Dismiss review mode modal (Cancel) and assert redirect to level selection plus cleared progress for that level/type."""
     
@@ -555,6 +559,7 @@ def test_cancel_review_modal_redirects_and_resets_quiz_progress(driver, base_url
     
 @pytest.mark.tcid("TC-QZ-020")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="TEST")
 def test_review_mode_excludes_completed_quiz(driver, base_url, admin_email, admin_password):
     """Ensure review mode only surfaces words that still need review."""
     
@@ -597,6 +602,7 @@ def test_review_mode_excludes_completed_quiz(driver, base_url, admin_email, admi
     
 @pytest.mark.tcid("TC-QZ-021")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="TEST")
 def test_quiz_review_mode_label_displayed_in_progress_counter(driver, base_url, admin_email, admin_password):
     """Ensure progress counter text contains '(Review Mode)' after entering review mode."""
     
@@ -614,6 +620,7 @@ def test_quiz_review_mode_label_displayed_in_progress_counter(driver, base_url,
     
 @pytest.mark.tcid("TC-QZ-022")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="TEST")
 def test_quiz_review_mode_progress_counter(driver, base_url, admin_email, admin_password):
     """Verify that the progress counter displays correct counts when entering review mode."""
     
@@ -635,6 +642,7 @@ def test_quiz_review_mode_progress_counter(driver, base_url, admin_email, admin_
     
 @pytest.mark.tcid("TC-QZ-024")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="TEST")
 def test_quiz_progress_reset_modal_message(driver, base_url, admin_email, admin_password):
     """Complete all quizzes; accept completion alert and confirm modal message contains reset confirmation text."""
     
@@ -647,6 +655,7 @@ def test_quiz_progress_reset_modal_message(driver, base_url, admin_email, admin_
     
 @pytest.mark.tcid("TC-QZ-025")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_quiz_progress_counter_after_reset(driver, base_url, admin_email, admin_password):
     """Verify that the progress counter resets to 0 after completing all quizzes and resetting."""
     
@@ -666,6 +675,7 @@ def test_quiz_progress_counter_after_reset(driver, base_url, admin_email, admin_
     
 @pytest.mark.tcid("TC-QZ-026")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_quiz_study_progress_deleted_from_db_after_reset(driver, base_url, admin_email, admin_password):
     """Verify that study progress is completely removed from the database after reset."""
     
@@ -682,6 +692,7 @@ def test_quiz_study_progress_deleted_from_db_after_reset(driver, base_url, admin
     
 @pytest.mark.tcid("TC-QZ-027")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji")
 def test_quiz_reset_scope_limited_to_current_level(driver, base_url, admin_email, admin_password):
     """Verify that resetting progress for one level does not affect progress in other levels."""
     
@@ -707,6 +718,7 @@ def test_quiz_reset_scope_limited_to_current_level(driver, base_url, admin_email
 
 @pytest.mark.tcid("TC-QZ-028")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="TEST")
 def test_quiz_order_randomized_after_cycle_reset(driver, base_url, admin_email, admin_password):
     """Verify quiz question order changes after completing and resetting a cycle."""
     
@@ -757,6 +769,7 @@ def test_quiz_order_randomized_after_cycle_reset(driver, base_url, admin_email,
 
 @pytest.mark.tcid("TC-QZ-029")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="N2")
 def test_quiz_position_persists_after_page_refresh(driver, base_url, admin_email, admin_password):
     """Verify the same quiz loads after a browser refresh."""
     
@@ -790,6 +803,7 @@ def test_quiz_position_persists_after_page_refresh(driver, base_url, admin_email
     
 @pytest.mark.tcid("TC-QZ-030")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="N1")
 def test_quiz_position_persists_after_logout_login(driver, base_url, admin_email, admin_password):
     """Verify the same quiz loads after logout then login."""
     
@@ -825,6 +839,7 @@ def test_quiz_position_persists_after_logout_login(driver, base_url, admin_email
     
 @pytest.mark.tcid("TC-QZ-031")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-kanji-to-furigana", level="N2")
 def test_quiz_position_persists_after_reopening_browser_or_across_devices(driver_factory, base_url, admin_email, admin_password):
     """Verify the same quiz loads after closing and reopening the browser."""
     
@@ -853,6 +868,7 @@ def test_quiz_position_persists_after_reopening_browser_or_across_devices(driver
    
 @pytest.mark.tcid("TC-QZ-032")
 @pytest.mark.quiz 
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="N2")
 def test_quiz_progress_persists_on_reenter_normal_mode(driver, base_url, admin_email, admin_password):
     """Verify completed quizzes remain persisted after leaving and re-entering Quiz page in Normal mode."""
     
@@ -893,6 +909,7 @@ def test_quiz_progress_persists_on_reenter_normal_mode(driver, base_url, admin_e
     
 @pytest.mark.tcid("TC-QZ-033")
 @pytest.mark.quiz 
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="TEST")
 def test_quiz_progress_persists_on_reenter_review_mode(driver, base_url, admin_email, admin_password):
     """Verify completed words remain persisted after leaving and re-entering Quiz page in Review mode."""
     
@@ -937,6 +954,7 @@ def test_quiz_progress_persists_on_reenter_review_mode(driver, base_url, admin_e
 
 @pytest.mark.tcid("TC-QZ-034")
 @pytest.mark.quiz
+@pytest.mark.state(study_type="quiz-furigana-to-kanji", level="N2")
 def test_quiz_study_progress_deletion_after_account_deletion(driver, base_url, test1_email, test1_password):
     """Verify that quiz progress is wiped and APIs deny access after deleting the account."""
     
@@ -966,7 +984,7 @@ def test_quiz_study_progress_deletion_after_account_deletion(driver, base_url, t
     assert progress_before, "Progress is not saved in DB"
     
     # Delete account
-    r = requests.delete(
+    r = http_client.delete(
         f"{base_url}/api/user",
         cookies=cookies,
         timeout=5,
@@ -976,7 +994,7 @@ def test_quiz_study_progress_deletion_after_account_deletion(driver, base_url, t
     # Wait until study-progress API returns 401
     elapsed = 0
     while elapsed < 5:
-        resp = requests.get(
+        resp = http_client.get(
             f"{base_url}/api/study-progress",
             params={"type": f"quiz-{type}", "level": level},
             cookies=cookies,
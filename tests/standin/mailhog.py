@@ -0,0 +1,237 @@
+import collections
+import datetime
+import email
+import json
+import logging
+import re
+import secrets
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+MAILBOX_SIZE = 1000
+HOSTNAME = "nori-mailhog"
+ADDRESS_PATTERN = re.compile(r"<([^>]*)>")
+
+logger = logging.getLogger(__name__)
+
+def _path(address):
+    """MailHog's JSON shape for an envelope address."""
+
+    mailbox, _, domain = address.partition("@")
+    return {"Relays": None, "Mailbox": mailbox, "Domain": domain, "Params": ""}
+
+def _headers(message):
+    headers = {}
+    for name, value in message.items():
+        headers.setdefault(name, []).append(value)
+    return headers
+
+def _raw_body(data):
+    for separator in ("\r\n\r\n", "\n\n"):
+        if separator in data:
+            return data.split(separator, 1)[1]
+    return ""
+
+def to_mailhog_json(mail_from, recipients, data):
+    """Build the message document MailHog's v2 API returns (ID, From/To, Content, MIME, Raw, Created)."""
+
+    parsed = email.message_from_string(data)
+    mime = None
+    if parsed.is_multipart():
+        mime = {"Parts": [
+            {"Headers": _headers(part), "Body": part.get_payload(), "Size": len(part.get_payload() or "")}
+            for part in parsed.get_payload()
+        ]}
+    return {
+        "ID": f"{secrets.token_hex(12)}@{HOSTNAME}",
+        "From": _path(mail_from),
+        "To": [_path(r) for r in recipients],
+        "Content": {"Headers": _headers(parsed), "Body": _raw_body(data), "Size": len(data), "MIME": None},
+        "Created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "MIME": mime,
+        "Raw": {"From": mail_from, "To": list(recipients), "Data": data, "Helo": "localhost"},
+    }
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib.sendmail: EHLO/HELO, MAIL, RCPT, DATA, RSET, NOOP, QUIT."""
+
+    def handle(self):
+        self._reply(f"220 {HOSTNAME} ESMTP")
+        mail_from, recipients = None, []
+        while True:
+            line = self.rfile.readline(65537)
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").rstrip("\r\n")
+            verb = command.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self._reply(f"250-{HOSTNAME}", "250-8BITMIME", "250 PIPELINING")
+            elif verb == "HELO":
+                self._reply(f"250 {HOSTNAME}")
+            elif command.upper().startswith("MAIL FROM:"):
+                mail_from, recipients = self._address(command[10:]), []
+                self._reply("250 Sender OK")
+            elif command.upper().startswith("RCPT TO:"):
+                if mail_from is None:
+                    self._reply("503 Need MAIL command")
+                    continue
+                recipients.append(self._address(command[8:]))
+                self._reply("250 Recipient OK")
+            elif verb == "DATA":
+                if not recipients:
+                    self._reply("503 Need RCPT command")
+                    continue
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                message = self.server.mailhog.store(mail_from, recipients, self._read_data())
+                self._reply(f"250 Ok: queued as {message['ID']}")
+                mail_from, recipients = None, []
+            elif verb == "RSET":
+                mail_from, recipients = None, []
+                self._reply("250 Ok")
+            elif verb == "NOOP":
+                self._reply("250 Ok")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _read_data(self):
+        lines = []
+        while True:
+            line = self.rfile.readline(65537)
+            if not line or line in (b".\r\n", b".\n"):
+                break
+            if line.startswith(b".."):
+                line = line[1:]
+            lines.append(line.decode("utf-8", "replace"))
+        return "".join(lines)
+
+    def _address(self, value):
+        match = ADDRESS_PATTERN.search(value)
+        return (match.group(1) if match else value.split(" ", 1)[0]).strip()
+
+    def _reply(self, *lines):
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode("utf-8"))
+
+class _SMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+class _APIHandler(BaseHTTPRequestHandler):
+    """The MailHog API subset the suite calls: v2 messages/search and deleting all messages."""
+
+    protocol_version = "HTTP/1.1"
+    # See StandInHandler: keep-alive replies would otherwise wait for the delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        params = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        mailhog = self.server.mailhog
+        if parts.path == "/api/v2/messages":
+            items = mailhog.messages()
+        elif parts.path == "/api/v2/search":
+            items = mailhog.search(params.get("kind", "containing"), params.get("query", ""))
+        else:
+            return self._send(404, {"error": "Not found"})
+        start, limit = int(params.get("start", 0)), int(params.get("limit", 50))
+        page = items[start:start + limit]
+        self._send(200, {"total": len(items), "count": len(page), "start": start, "items": page})
+
+    def do_DELETE(self):
+        if urlsplit(self.path).path not in ("/api/v1/messages", "/api/v2/messages"):
+            return self._send(404, {"error": "Not found"})
+        self.server.mailhog.clear()
+        self._send(200, {})
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+class LocalMailHog:
+    """In-process mail sink: SMTP in, MailHog's v2 JSON out, newest message first.
+
+    Both listeners bind 127.0.0.1 on free ports by default. Every stored
+    message is also handed to the callbacks registered with `subscribe`, so
+    a waiting test is woken as soon as the mail arrives.
+    """
+
+    def __init__(self, smtp_port=0, http_port=0):
+        self._lock = threading.Lock()
+        self._messages = collections.deque(maxlen=MAILBOX_SIZE)
+        self._subscribers = []
+        self.smtp_server = _SMTPServer(("127.0.0.1", smtp_port), _SMTPHandler)
+        self.smtp_server.mailhog = self
+        self.http_server = ThreadingHTTPServer(("127.0.0.1", http_port), _APIHandler)
+        self.http_server.daemon_threads = True
+        self.http_server.mailhog = self
+        self.smtp_address = self.smtp_server.server_address[:2]
+        self.api_url = f"http://127.0.0.1:{self.http_server.server_address[1]}/api/v2"
+        self._threads = []
+
+    def subscribe(self, callback):
+        """Call `callback(message)` for every message stored from now on."""
+
+        self._subscribers.append(callback)
+
+    def store(self, mail_from, recipients, data):
+        message = to_mailhog_json(mail_from, recipients, data)
+        with self._lock:
+            self._messages.appendleft(message)
+        for callback in self._subscribers:
+            callback(message)
+        return message
+
+    def messages(self):
+        with self._lock:
+            return list(self._messages)
+
+    def search(self, kind, query):
+        """Filter like MailHog: `kind` is 'to', 'from' or 'containing', matched case-insensitively."""
+
+        query = query.lower()
+
+        def matches(message):
+            headers = message["Content"]["Headers"]
+            if kind == "to":
+                values = headers.get("To", []) + message["Raw"]["To"]
+            elif kind == "from":
+                values = headers.get("From", []) + [message["Raw"]["From"]]
+            else:
+                values = [message["Raw"]["Data"]]
+            return any(query in value.lower() for value in values)
+
+        return [message for message in self.messages() if matches(message)]
+
+    def clear(self):
+        with self._lock:
+            self._messages.clear()
+
+    def start(self):
+        for name, server in (("smtp", self.smtp_server), ("api", self.http_server)):
+            thread = threading.Thread(target=server.serve_forever, name=f"nori-mailhog-{name}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        for server in (self.smtp_server, self.http_server):
+            server.shutdown()
+            server.server_close()
+        for thread in self._threads:
+            thread.join(timeout=5)
+
+def start_local_mailhog(smtp_port=0, http_port=0):
+    """Start the mail sink in daemon threads and return it."""
+
+    return LocalMailHog(smtp_port, http_port).start()
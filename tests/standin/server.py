@@ -0,0 +1,385 @@
+import json
+import logging
+import os
+import re
+import smtplib
+import threading
+from email.charset import QP, Charset
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import formataddr, formatdate, make_msgid
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+from tests.standin.store import Store
+
+STATIC_DIR = Path(__file__).parent / "static"
+STATIC_TYPES = {".js": "application/javascript; charset=utf-8", ".css": "text/css; charset=utf-8"}
+SMTP_HOST = os.getenv("NORI_SMTP_HOST", "localhost")
+SMTP_PORT = int(os.getenv("NORI_SMTP_PORT", "1025"))
+MAIL_FROM = formataddr(("NORI", "no-reply@nori.local"))
+VERIFY_SUBJECT = "NORI Email Verification"
+USERNAME_RULE = re.compile(r"^[A-Za-z0-9]{4,19}$")
+EMAIL_RULE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]{2,}$")
+PASSWORD_RULES = (r"[a-z]", r"[A-Z]", r"[0-9]", r"[^A-Za-z0-9]", r"^.{6,}$")
+
+logger = logging.getLogger(__name__)
+
+def _password_ok(password):
+    return all(re.search(rule, password or "") for rule in PASSWORD_RULES)
+
+class _Reply(Exception):
+    """Raised by route handlers to end the request with a JSON status."""
+
+    def __init__(self, status, payload):
+        super().__init__(status)
+        self.status = status
+        self.payload = payload
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves the NORI pages (one shell + app.js) and the `/api/*` routes the suite calls."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "NoriStandIn/1.0"
+    # Headers and body go out as separate writes; with Nagle on, keep-alive replies wait for the delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    # --- dispatch ---
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        parts = urlsplit(self.path)
+        self.route = parts.path.rstrip("/") or "/"
+        self.query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        self.body = self._read_body()
+        self.set_cookie = None
+
+        if not self.route.startswith("/api/"):
+            if method != "GET":
+                return self._send_json(405, {"error": "Method not allowed"})
+            return self._serve_page()
+
+        handler = self._find_api_handler(method)
+        if handler is None:
+            return self._send_json(404, {"error": "Not found"})
+        try:
+            status, payload = handler()
+        except _Reply as reply:
+            status, payload = reply.status, reply.payload
+        self._send_json(status, payload)
+
+    def _find_api_handler(self, method):
+        store = self.server.store
+        routes = {
+            ("POST", "/api/auth/signup"): self.api_signup,
+            ("POST", "/api/auth/login"): self.api_login,
+            ("POST", "/api/auth/logout"): self.api_logout,
+            ("POST", "/api/auth/resend-verification"): self.api_resend_verification,
+            ("GET", "/api/auth/verify"): self.api_verification_status,
+            ("POST", "/api/auth/verify"): self.api_verify,
+            ("POST", "/api/auth/verify/expiry"): self.api_verify_expiry,
+            ("GET", "/api/auth/check-username"): self.api_check_username,
+            ("GET", "/api/auth/check-email"): self.api_check_email,
+            ("GET", "/api/user"): self.api_user,
+            ("PATCH", "/api/user"): self.api_update_user,
+            ("DELETE", "/api/user"): self.api_delete_user,
+            ("GET", "/api/words"): self.api_words,
+            ("GET", "/api/study-progress"): self.api_progress,
+            ("POST", "/api/study-progress"): self.api_record_progress,
+            ("POST", "/api/study-progress/reset"): self.api_reset_progress,
+            ("GET", "/api/study-session"): self.api_study_session,
+            ("PUT", "/api/study-session"): self.api_save_study_session,
+            ("GET", "/api/favorites"): self.api_favorites,
+            ("POST", "/api/favorites"): self.api_toggle_favorite,
+        }
+        handler = routes.get((method, self.route))
+        if handler is None and method == "GET":
+            match = re.fullmatch(r"/api/words/(\d+)", self.route)
+            if match and int(match.group(1)) in store.words_by_id:
+                word = store.words_by_id[int(match.group(1))]
+                return lambda: (200, word)
+        return handler
+
+    # --- plumbing ---
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        raw = self.rfile.read(length)
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            return {}
+        return body if isinstance(body, dict) else {}
+
+    def _cookie(self, name):
+        cookie = SimpleCookie(self.headers.get("Cookie") or "")
+        return cookie[name].value if name in cookie else None
+
+    def _send(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        if self.set_cookie:
+            self.send_header("Set-Cookie", self.set_cookie)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+    def _serve_page(self):
+        if self.route == "/favicon.ico":
+            return self._send(204, b"", "image/x-icon")
+        if self.route.startswith("/static/"):
+            path = (STATIC_DIR / self.route[len("/static/"):]).resolve()
+            if path.parent != STATIC_DIR.resolve() or path.suffix not in STATIC_TYPES or not path.is_file():
+                return self._send(404, b"Not found", "text/plain")
+            return self._send(200, path.read_bytes(), STATIC_TYPES[path.suffix])
+        self._send(200, (STATIC_DIR / "index.html").read_bytes(), "text/html; charset=utf-8")
+
+    def _current_user(self):
+        user = self.server.store.user_for_token(self._cookie("token"))
+        if user is None:
+            raise _Reply(401, {"error": "Unauthorized"})
+        return user
+
+    def _int_field(self, name, default=0):
+        value = self.body.get(name, default)
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise _Reply(400, {"error": f"{name} must be an integer"})
+
+    def _level_and_type(self, source):
+        type, level = source.get("type"), source.get("level")
+        if not type or not level:
+            raise _Reply(400, {"error": "type and level are required"})
+        return type, level
+
+    def _send_verification(self, email):
+        token = self.server.store.issue_verify_token(email)
+        self.server.send_verification_mail(email, f"{self.server.base_url}/verify?token={token}")
+
+    # --- auth ---
+
+    def api_signup(self):
+        store = self.server.store
+        username, email, password = (self.body.get(k, "") for k in ("username", "email", "password"))
+        if not USERNAME_RULE.match(username) or not EMAIL_RULE.match(email) or not _password_ok(password):
+            return 400, {"error": "Invalid signup data"}
+        if store.username_taken(username, exclude_email=email):
+            return 409, {"error": "Username is already in use"}
+        if store.email_taken(email):
+            return 409, {"error": "Email is already in use"}
+        store.add_user(username, email, password)
+        self._send_verification(email)
+        return 201, {"message": "Please check your email to verify your account."}
+
+    def api_login(self):
+        store = self.server.store
+        user = store.user_by_email(self.body.get("email"))
+        if user is None or user["password"] != self.body.get("password"):
+            return 401, {"error": "Invalid email or password"}
+        if not user["verified"]:
+            return 403, {"error": "Please verify your email first.", "unverified": True}
+        token = store.issue_auth_token(user)
+        self.set_cookie = f"token={token}; Path=/; HttpOnly; SameSite=Lax"
+        return 200, {"username": user["username"]}
+
+    def api_logout(self):
+        self.server.store.revoke_auth_token(self._cookie("token"))
+        self.set_cookie = "token=; Path=/; HttpOnly; Max-Age=0"
+        return 200, {"message": "Logged out"}
+
+    def api_resend_verification(self):
+        user = self.server.store.user_by_email(self.body.get("email"))
+        if user is not None and not user["verified"]:
+            self._send_verification(user["email"])
+        return 200, {"message": "If the account exists, a new verification email was sent."}
+
+    def api_verification_status(self):
+        user = self.server.store.user_by_email(self.query.get("email"))
+        if user is None:
+            return 404, {"error": "User not found"}
+        return 200, {"isVerified": user["verified"]}
+
+    def api_verify(self):
+        status = self.server.store.verify(self.body.get("token"))
+        return (200 if status == "verified" else 400), {"status": status}
+
+    def api_verify_expiry(self):
+        if not self.server.store.shift_verify_expiry(self.body.get("email", ""), self._int_field("minutesOffset")):
+            return 404, {"error": "No pending verification for this email"}
+        return 200, {"message": "Expiry updated"}
+
+    def api_check_username(self):
+        user = self.server.store.user_for_token(self._cookie("token"))
+        taken = self.server.store.username_taken(self.query.get("username", ""), exclude_email=user and user["email"])
+        return 200, {"available": not taken}
+
+    def api_check_email(self):
+        return 200, {"available": not self.server.store.email_taken(self.query.get("email", ""))}
+
+    # --- account ---
+
+    def api_user(self):
+        user = self._current_user()
+        return 200, {"id": user["id"], "username": user["username"], "email": user["email"]}
+
+    def api_update_user(self):
+        user = self._current_user()
+        username, password = self.body.get("username"), self.body.get("password")
+        if username and (not USERNAME_RULE.match(username) or self.server.store.username_taken(username, user["email"])):
+            return 400, {"error": "Invalid username"}
+        if password and not _password_ok(password):
+            return 400, {"error": "Invalid password"}
+        self.server.store.update_user(user, username, password)
+        return 200, {"message": "Account updated successfully."}
+
+    def api_delete_user(self):
+        self.server.store.delete_user(self._current_user())
+        self.set_cookie = "token=; Path=/; HttpOnly; Max-Age=0"
+        return 200, {"message": "Account deleted."}
+
+    # --- study data ---
+
+    def api_words(self):
+        store = self.server.store
+        if self.query.get("summary") == "true":
+            return 200, store.words_summary()
+        if self.query.get("level"):
+            return 200, store.words_for_level(self.query["level"])
+        return 200, store.words
+
+    def api_progress(self):
+        user = self._current_user()
+        type = self.query.get("type")
+        if not type:
+            return 400, {"error": "type is required"}
+        return 200, self.server.store.progress(user, type, self.query.get("level"), self.query.get("wordId"))
+
+    def api_record_progress(self):
+        user = self._current_user()
+        type, level = self._level_and_type(self.body)
+        word_id = self._int_field("wordId")
+        if word_id not in self.server.store.words_by_id:
+            return 404, {"error": "Unknown word"}
+        self.server.store.record_progress(user, type, level, word_id, self.body.get("completed"))
+        return 200, {"message": "Progress saved"}
+
+    def api_reset_progress(self):
+        user = self._current_user()
+        type, level = self._level_and_type({**self.query, **self.body})
+        self.server.store.reset_progress(user, type, level)
+        return 200, {"message": "Progress reset"}
+
+    def api_study_session(self):
+        user = self._current_user()
+        type, level = self._level_and_type(self.query)
+        return 200, self.server.store.study_session(user, type, level) or {}
+
+    def api_save_study_session(self):
+        user = self._current_user()
+        type, level = self._level_and_type(self.query)
+        self.server.store.save_study_session(user, type, level, self.body)
+        return 200, {"message": "Saved"}
+
+    def api_favorites(self):
+        return 200, self.server.store.favorites(self._current_user())
+
+    def api_toggle_favorite(self):
+        user = self._current_user()
+        word_id = self._int_field("wordId")
+        if word_id not in self.server.store.words_by_id:
+            return 404, {"error": "Unknown word"}
+        return 200, {"favorited": self.server.store.toggle_favorite(user, word_id)}
+
+class LocalNoriServer(ThreadingHTTPServer):
+    """Threaded stand-in for the NORI deployment, bound to 127.0.0.1 on a free port by default."""
+
+    daemon_threads = True
+
+    def __init__(self, port=0, smtp=(SMTP_HOST, SMTP_PORT)):
+        super().__init__(("127.0.0.1", port), StandInHandler)
+        self.store = Store()
+        self.smtp = smtp
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}"
+        self._thread = None
+
+    def seed_account(self, username, email, password):
+        """Create a verified account (e.g. the admin the suite logs in with)."""
+
+        return self.store.add_user(username, email, password, verified=True)
+
+    def send_verification_mail(self, to_addr, verify_url):
+        """Send the verification email over SMTP (MailHog by default); failures are logged, not raised."""
+
+        text = (
+            "Verify your email to join NORI\n\n"
+            f"Open this link to verify your email address:\n{verify_url}\n\n"
+            "If you did not sign up for NORI, just ignore this email.\n"
+        )
+        html = (
+            "<html><body>\n"
+            "<h2>Verify your email to join NORI</h2>\n"
+            "<p>Click the button below to verify your email address.</p>\n"
+            f'<p><a href="{verify_url}">Verify Email</a></p>\n'
+            "<p>If you did not sign up for NORI, just ignore this email.</p>\n"
+            "</body></html>\n"
+        )
+        # Quoted-printable like the real mailer, so the suite's quopri decoding sees what it expects
+        charset = Charset("utf-8")
+        charset.body_encoding = QP
+        msg = MIMEMultipart("alternative")
+        msg.attach(MIMEText(text, "plain", charset))
+        msg.attach(MIMEText(html, "html", charset))
+        msg["From"] = MAIL_FROM
+        msg["To"] = to_addr
+        msg["Subject"] = VERIFY_SUBJECT
+        msg["Date"] = formatdate(localtime=False, usegmt=True)
+        msg["Message-ID"] = make_msgid(domain="nori.local")
+        try:
+            with smtplib.SMTP(*self.smtp, timeout=5) as smtp:
+                smtp.sendmail("no-reply@nori.local", [to_addr], msg.as_string())
+        except OSError as exc:
+            logger.warning("Could not send verification mail to %s via %s:%s: %s", to_addr, *self.smtp, exc)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="nori-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+def start_local_server(port=0, accounts=(), smtp=(SMTP_HOST, SMTP_PORT)):
+    """Start the stand-in in a daemon thread; `accounts` are (username, email, password) seeded as verified."""
+
+    server = LocalNoriServer(port, smtp)
+    for username, email, password in accounts:
+        server.seed_account(username, email, password)
+    return server.start()
@@ -0,0 +1,886 @@
+// Front end of the local NORI stand-in. Every page is served the same shell;
+// this script routes on location.pathname and renders with plain DOM calls.
+// Elements that the suite holds references to (cards, buttons, counters) are
+// created once per page and updated in place.
+"use strict";
+
+const LEVELS = ["N5", "N4", "N3", "N2", "N1"];
+const TEST_LEVEL = "TEST";
+const PROGRESS_TYPES = [
+  ["flashcards", "Flashcards"],
+  ["quiz-kanji-to-furigana", "Quiz (漢字 → ふりがな)"],
+  ["quiz-furigana-to-kanji", "Quiz (ふりがな → 漢字)"],
+  ["fill", "Fill in the Blank"],
+];
+const SECTION_TITLES = { "flashcards": "Flashcards", "quiz": "Quiz", "fill-in-the-blank": "Fill in the Blank" };
+
+const FLASHCARD_TRANSITION_MS = 400;
+const QUIZ_FEEDBACK_MS = 700;
+const FILL_FEEDBACK_MS = 1000;
+
+const MAX_LOGIN_ATTEMPTS = 5;
+const LOCKOUT_MS = 5 * 60 * 1000;
+const FAILED_LOGINS_KEY = "nori-failed-logins";
+const LOCKOUT_UNTIL_KEY = "nori-lockout-until";
+const SHOW_MEANING_KEY = "nori-show-meaning";
+const SHOW_EXAMPLE_KEY = "nori-show-example";
+
+const USERNAME_RULE = /^[A-Za-z0-9]{4,19}$/;
+const EMAIL_RULE = /^[^\s@]+@[^\s@]+\.[^\s@]{2,}$/;
+const PASSWORD_RULES = [
+  ["lowercase", "At least one lowercase letter", /[a-z]/],
+  ["uppercase", "At least one uppercase letter", /[A-Z]/],
+  ["number", "At least one number", /[0-9]/],
+  ["special-char", "At least one special character", /[^A-Za-z0-9]/],
+  ["length", "At least 6 characters", /^.{6,}$/],
+];
+const USERNAME_HINT = "Username must be 4-19 characters, letters and numbers only";
+
+let currentUser = null;
+
+// --- helpers ---
+
+function el(tag, attrs, ...children) {
+  const node = document.createElement(tag);
+  for (const [key, value] of Object.entries(attrs || {})) {
+    if (value === undefined || value === null || value === false) continue;
+    if (key === "testid") node.dataset.testid = value;
+    else if (key === "className") node.className = value;
+    else if (key.startsWith("on")) node.addEventListener(key.slice(2).toLowerCase(), value);
+    else node.setAttribute(key, value === true ? "" : value);
+  }
+  node.append(...children.flat().filter((child) => child !== null && child !== undefined));
+  return node;
+}
+
+function svg(tag, attrs, ...children) {
+  const node = document.createElementNS("http://www.w3.org/2000/svg", tag);
+  for (const [key, value] of Object.entries(attrs || {})) node.setAttribute(key, value);
+  node.append(...children);
+  return node;
+}
+
+async function api(method, path, body) {
+  const options = { method, credentials: "same-origin", headers: {} };
+  if (body !== undefined) {
+    options.headers["Content-Type"] = "application/json";
+    options.body = JSON.stringify(body);
+  }
+  const response = await fetch(path, options);
+  let data = null;
+  try {
+    data = await response.json();
+  } catch (err) {
+    data = null;
+  }
+  return { ok: response.ok, status: response.status, data };
+}
+
+function query(params) {
+  return new URLSearchParams(params).toString();
+}
+
+function sleep(ms) {
+  return new Promise((resolve) => setTimeout(resolve, ms));
+}
+
+function shuffle(items) {
+  const copy = items.slice();
+  for (let i = copy.length - 1; i > 0; i--) {
+    const j = Math.floor(Math.random() * (i + 1));
+    [copy[i], copy[j]] = [copy[j], copy[i]];
+  }
+  return copy;
+}
+
+// Banker's rounding, so percentages agree with Python's round() in the suite.
+function roundHalfEven(value) {
+  const floor = Math.floor(value);
+  const diff = value - floor;
+  if (Math.abs(diff - 0.5) < 1e-9) return floor % 2 === 0 ? floor : floor + 1;
+  return Math.round(value);
+}
+
+function percent(part, whole) {
+  return whole > 0 ? roundHalfEven((part / whole) * 100) : 0;
+}
+
+function passwordOk(value) {
+  return PASSWORD_RULES.every(([, , rule]) => rule.test(value));
+}
+
+function setFeedback(node, text, ok) {
+  if (!text) {
+    node.replaceChildren();
+    node.hidden = true;
+    return;
+  }
+  node.replaceChildren(el("span", { className: ok ? "text-green-600" : "text-red-500" }, text));
+  node.hidden = false;
+}
+
+function passwordChecklist(testid, rulePrefix) {
+  const items = PASSWORD_RULES.map(([name, label]) =>
+    el("li", { testid: rulePrefix ? `${rulePrefix}${name}` : null, className: "text-red-500" }, label));
+  const list = el("ul", { testid, className: "checklist" }, items);
+  const update = (value) => PASSWORD_RULES.forEach(([, , rule], i) => {
+    items[i].className = rule.test(value) ? "text-green-600" : "text-red-500";
+  });
+  return { list, update };
+}
+
+// Validate an input as the user types and ask the API whether the value is free.
+// A sequence number drops responses that arrive after a newer keystroke.
+function liveAvailability(input, feedback, options, onChange) {
+  const state = { valid: false, available: false };
+  let sequence = 0;
+  input.addEventListener("input", async () => {
+    const value = input.value.trim();
+    const ticket = ++sequence;
+    state.valid = options.rule.test(value);
+    state.available = false;
+    setFeedback(feedback, value && !state.valid ? options.invalidText : "", false);
+    onChange();
+    if (!state.valid) return;
+    const res = await api("GET", `${options.endpoint}?${query({ [options.param]: value })}`);
+    if (ticket !== sequence) return;
+    state.available = Boolean(res.ok && res.data && res.data.available);
+    setFeedback(feedback, state.available ? options.availableText : options.takenText, state.available);
+    onChange();
+  });
+  return state;
+}
+
+// --- study runs ---
+
+// One pass over a level for a study type. The order and position are stored
+// server-side so a refresh, a new login or another browser resumes in place.
+class StudyRun {
+  constructor({ type, level, section, reviewMessage, doneMessage }) {
+    this.type = type;
+    this.level = level;
+    this.section = section;
+    this.reviewMessage = reviewMessage;
+    this.doneMessage = doneMessage;
+  }
+
+  async load() {
+    const scope = query({ type: this.type, level: this.level });
+    const [words, progress, saved] = await Promise.all([
+      api("GET", `/api/words?${query({ level: this.level })}`),
+      api("GET", `/api/study-progress?${scope}`),
+      api("GET", `/api/study-session?${scope}`),
+    ]);
+    this.words = words.data || [];
+    this.byId = new Map(this.words.map((word) => [word.id, word]));
+    this.completed = new Set((progress.data || []).filter((row) => row.completed).map((row) => row.wordId));
+
+    const state = saved.data || {};
+    const order = Array.isArray(state.order) ? state.order.filter((id) => this.byId.has(id)) : [];
+    if (order.length && order.length === state.order.length && state.index >= 0 && state.index < order.length) {
+      this.order = order;
+      this.index = state.index;
+      this.review = Boolean(state.review);
+    } else {
+      this.startCycle();
+      await this.save();
+    }
+  }
+
+  get current() {
+    return this.byId.get(this.order[this.index]);
+  }
+
+  get done() {
+    return this.review ? this.order.filter((id) => this.completed.has(id)).length : this.completed.size;
+  }
+
+  get total() {
+    return this.review ? this.order.length : this.words.length;
+  }
+
+  counterText() {
+    return `${this.done} / ${this.total}${this.review ? " (Review Mode)" : ""}`;
+  }
+
+  startCycle(ids = this.words.map((word) => word.id), review = false) {
+    this.order = shuffle(ids);
+    this.index = 0;
+    this.review = review;
+  }
+
+  save() {
+    return api("PUT", `/api/study-session?${query({ type: this.type, level: this.level })}`,
+      { order: this.order, index: this.index, review: this.review });
+  }
+
+  async record(correct) {
+    const wordId = this.current.id;
+    if (correct) this.completed.add(wordId);
+    else this.completed.delete(wordId);
+    await api("POST", "/api/study-progress", { wordId, type: this.type, level: this.level, completed: correct });
+  }
+
+  reset() {
+    this.completed.clear();
+    return api("POST", `/api/study-progress/reset?${query({ type: this.type, level: this.level })}`);
+  }
+
+  // Move to the next word; returns false when the page is being left.
+  async advance() {
+    if (this.index + 1 < this.order.length) {
+      this.index += 1;
+      await this.save();
+      return true;
+    }
+    const remaining = this.words.map((word) => word.id).filter((id) => !this.completed.has(id));
+    if (!remaining.length) {
+      await this.reset();
+      alert(this.doneMessage);
+      this.startCycle();
+      await this.save();
+      return true;
+    }
+    if (confirm(this.reviewMessage(remaining.length))) {
+      this.startCycle(remaining, true);
+      await this.save();
+      return true;
+    }
+    await this.reset();
+    location.href = `/study/${this.section}`;
+    return false;
+  }
+}
+
+// Flashcards over the user's favorites: no stored progress, a fresh shuffle per visit.
+class FavoritesRun {
+  async load() {
+    const res = await api("GET", "/api/favorites");
+    this.words = res.data || [];
+    this.byId = new Map(this.words.map((word) => [word.id, word]));
+    this.order = shuffle(this.words.map((word) => word.id));
+    this.index = 0;
+  }
+
+  get current() {
+    return this.byId.get(this.order[this.index]);
+  }
+
+  counterText() {
+    return `${this.index} / ${this.order.length}`;
+  }
+
+  async record() {}
+
+  async advance() {
+    if (this.index + 1 < this.order.length) {
+      this.index += 1;
+      return true;
+    }
+    alert("You reviewed all your favorite words!");
+    this.order = shuffle(this.order);
+    this.index = 0;
+    return true;
+  }
+}
+
+// --- layout ---
+
+function renderNav() {
+  const studyMenu = el("div", { className: "menu" },
+    el("button", { testid: "study-btn", type: "button", className: "nav-link" }, "Study"),
+    el("div", { className: "dropdown" },
+      el("a", { testid: "flashcards-btn", href: "/study/flashcards" }, "Flashcards"),
+      el("a", { testid: "quiz-btn", href: "/study/quiz" }, "Quiz"),
+      el("a", { testid: "fill-btn", href: "/study/fill-in-the-blank" }, "Fill in the Blank")));
+  const userItem = currentUser
+    ? el("div", { className: "menu" },
+      el("span", { testid: "nav-hello", className: "nav-link" }, `Hello, ${currentUser.username}`),
+      el("div", { className: "dropdown dropdown-right" },
+        el("a", { href: "/account" }, "My Account"),
+        el("button", { testid: "logout-btn", type: "button", onClick: logout }, "Log Out")))
+    : el("a", { testid: "login-btn", className: "nav-link", href: "/login" }, "Log In");
+  document.getElementById("nav").replaceChildren(
+    el("a", { className: "brand", href: "/" }, "NORI"),
+    el("nav", { className: "nav-items" }, studyMenu, userItem));
+}
+
+async function logout() {
+  await api("POST", "/api/auth/logout");
+  location.href = "/login";
+}
+
+// --- public pages ---
+
+function renderHome(app) {
+  app.append(
+    el("h1", {}, "Welcome to NORI"),
+    el("p", {}, "Study JLPT vocabulary from N5 to N1 with flashcards, quizzes and fill-in-the-blank practice."),
+    el("div", { className: "level-grid" },
+      Object.entries(SECTION_TITLES).map(([section, title]) =>
+        el("a", { className: "level-card", href: `/study/${section}` }, title))));
+}
+
+function renderLogin(app) {
+  const email = el("input", { type: "email", placeholder: "Email", autocomplete: "username" });
+  const password = el("input", { type: "password", placeholder: "Password", autocomplete: "current-password" });
+  const submit = el("button", { type: "submit", className: "primary" }, "Log In");
+  const error = el("div", { testid: "credentials-error", className: "error", hidden: true });
+  let lockoutTimer = null;
+
+  const showError = (...lines) => {
+    error.replaceChildren(...lines.map((line) => (typeof line === "string" ? el("p", {}, line) : line)));
+    error.hidden = false;
+  };
+  const lockedUntil = () => Number(localStorage.getItem(LOCKOUT_UNTIL_KEY) || 0);
+
+  function refreshLockout() {
+    const remaining = lockedUntil() - Date.now();
+    if (remaining <= 0) {
+      clearInterval(lockoutTimer);
+      lockoutTimer = null;
+      localStorage.removeItem(LOCKOUT_UNTIL_KEY);
+      localStorage.removeItem(FAILED_LOGINS_KEY);
+      submit.disabled = false;
+      setFeedback(error, "");
+      return;
+    }
+    const seconds = Math.ceil(remaining / 1000);
+    submit.disabled = true;
+    showError("Too many failed login attempts. Please try again later.",
+      `Remaining lockout time: ${Math.floor(seconds / 60)}:${String(seconds % 60).padStart(2, "0")}`);
+  }
+
+  function startLockout() {
+    refreshLockout();
+    if (!lockoutTimer && lockedUntil() > Date.now()) lockoutTimer = setInterval(refreshLockout, 1000);
+  }
+
+  async function resend(event) {
+    const button = event.currentTarget;
+    button.disabled = true;
+    await api("POST", "/api/auth/resend-verification", { email: email.value.trim() });
+    button.textContent = "Verification email sent";
+    button.disabled = false;
+  }
+
+  async function onSubmit(event) {
+    event.preventDefault();
+    if (lockedUntil() > Date.now()) return startLockout();
+    setFeedback(error, "");
+    submit.disabled = true;
+    const res = await api("POST", "/api/auth/login", { email: email.value.trim(), password: password.value });
+    submit.disabled = false;
+    if (res.ok) {
+      localStorage.removeItem(FAILED_LOGINS_KEY);
+      location.href = "/";
+      return;
+    }
+    if (res.status === 403 && res.data && res.data.unverified) {
+      showError("Please verify your email first.",
+        el("button", { testid: "resend-verification-btn", type: "button", className: "link", onClick: resend },
+          "Resend verification email"));
+      return;
+    }
+    const failures = Number(localStorage.getItem(FAILED_LOGINS_KEY) || 0) + 1;
+    if (failures >= MAX_LOGIN_ATTEMPTS) {
+      localStorage.setItem(LOCKOUT_UNTIL_KEY, String(Date.now() + LOCKOUT_MS));
+      return startLockout();
+    }
+    localStorage.setItem(FAILED_LOGINS_KEY, String(failures));
+    const left = MAX_LOGIN_ATTEMPTS - failures;
+    showError("Invalid email or password.", `${left} ${left === 1 ? "attempt" : "attempts"} remaining`);
+  }
+
+  app.append(el("div", { className: "panel" },
+    el("h1", {}, "Log In"),
+    el("form", { onSubmit, novalidate: true }, email, password, error, submit),
+    el("p", {}, "New to NORI? ", el("a", { href: "/signup" }, "Create an account"))));
+  if (lockedUntil()) startLockout();
+}
+
+function renderSignup(app) {
+  const username = el("input", { type: "text", placeholder: "Username", autocomplete: "off" });
+  const email = el("input", { type: "email", placeholder: "Email", autocomplete: "off" });
+  const password = el("input", { type: "password", placeholder: "Password", autocomplete: "new-password" });
+  const confirmPassword = el("input", { type: "password", placeholder: "Confirm Password", autocomplete: "new-password" });
+  const usernameFeedback = el("div", { testid: "username-feedback", className: "feedback", hidden: true });
+  const emailFeedback = el("div", { testid: "email-feedback", className: "feedback", hidden: true });
+  const checklist = passwordChecklist("password-checklist", "pw-rule-");
+  const confirmError = el("p", { testid: "confirm-pw-error", className: "error", hidden: true }, "Passwords do not match");
+  const formError = el("p", { className: "error", hidden: true });
+  const submit = el("button", { type: "submit", className: "primary" }, "Sign Up");
+
+  const refreshConfirm = () => {
+    confirmError.hidden = !confirmPassword.value || confirmPassword.value === password.value;
+  };
+  const usernameState = liveAvailability(username, usernameFeedback, {
+    rule: USERNAME_RULE, invalidText: USERNAME_HINT, endpoint: "/api/auth/check-username", param: "username",
+    availableText: "Username available!", takenText: "Username is already in use",
+  }, () => {});
+  const emailState = liveAvailability(email, emailFeedback, {
+    rule: EMAIL_RULE, invalidText: "Invalid email format", endpoint: "/api/auth/check-email", param: "email",
+    availableText: "Email available!", takenText: "Email is already in use",
+  }, () => {});
+  password.addEventListener("input", () => {
+    checklist.update(password.value);
+    refreshConfirm();
+  });
+  confirmPassword.addEventListener("input", refreshConfirm);
+
+  // Availability checks may still be in flight when the form is submitted; the
+  // server re-checks uniqueness, so only the local rules gate submission here.
+  async function onSubmit(event) {
+    event.preventDefault();
+    formError.hidden = true;
+    if (!usernameState.valid || !emailState.valid || !passwordOk(password.value)
+        || password.value !== confirmPassword.value) {
+      formError.textContent = "Please fix the highlighted fields.";
+      formError.hidden = false;
+      return;
+    }
+    submit.disabled = true;
+    const res = await api("POST", "/api/auth/signup",
+      { username: username.value.trim(), email: email.value.trim(), password: password.value });
+    submit.disabled = false;
+    if (res.ok) {
+      alert("Please check your email to verify your account.");
+      location.href = "/login";
+      return;
+    }
+    formError.textContent = (res.data && res.data.error) || "Sign up failed. Please try again.";
+    formError.hidden = false;
+  }
+
+  app.append(el("div", { className: "panel" },
+    el("h1", {}, "Sign Up"),
+    el("form", { onSubmit, novalidate: true },
+      username, usernameFeedback,
+      email, emailFeedback,
+      password, checklist.list,
+      confirmPassword, confirmError,
+      formError, submit),
+    el("p", {}, "Already have an account? ", el("a", { href: "/login" }, "Log in"))));
+}
+
+async function renderVerify(app) {
+  const message = el("p", {}, "Verifying your email...");
+  const panel = el("div", { className: "panel" }, el("h1", {}, "Email Verification"), message);
+  app.append(panel);
+  const token = new URLSearchParams(location.search).get("token");
+  const res = await api("POST", "/api/auth/verify", { token });
+  const status = res.data && res.data.status;
+  if (status === "verified") {
+    message.textContent = "Your email has been successfully verified! You can now log in.";
+    panel.append(el("a", { className: "primary", href: "/login" }, "Go to login"));
+  } else if (status === "expired") {
+    message.textContent = "Verification link expired. Please request a new verification email.";
+  } else {
+    message.textContent = "Invalid or expired verification link.";
+  }
+}
+
+// --- level and type selection ---
+
+function renderLevelSelection(app, section) {
+  const cards = LEVELS.map((level) =>
+    el("a", { testid: `level-btn-${level.toLowerCase()}`, className: "level-card",
+      href: `/study/${section}/${level.toLowerCase()}` }, level));
+  cards.push(el("a", { testid: "level-btn-test", className: "level-card",
+    href: `/study/${section}/${TEST_LEVEL}` }, TEST_LEVEL));
+  if (section === "flashcards") {
+    cards.push(el("a", { testid: "level-btn-favorites", className: "level-card",
+      href: "/study/flashcards/favorites" }, "★ Favorites"));
+  }
+  app.append(el("h1", {}, SECTION_TITLES[section]), el("p", {}, "Choose a level"), el("div", { className: "level-grid" }, cards));
+}
+
+function renderQuizTypeSelection(app, level) {
+  app.append(
+    el("h1", {}, `Quiz ${level.toUpperCase()}`),
+    el("p", {}, "Choose a quiz type"),
+    el("div", { className: "level-grid" },
+      el("a", { testid: "kanji-to-furigana-btn", className: "type-card",
+        href: `/study/quiz/${level}/kanji-to-furigana` }, "漢字 → ふりがな"),
+      el("a", { testid: "furigana-to-kanji-btn", className: "type-card",
+        href: `/study/quiz/${level}/furigana-to-kanji` }, "ふりがな → 漢字")));
+}
+
+// --- study pages ---
+
+function progressHeader(run) {
+  const counter = el("div", { testid: "progress-counter", className: "progress-counter" });
+  const barInner = el("div", { testid: "progress-bar-inner", className: "progress-bar-inner" });
+  const update = () => {
+    counter.textContent = run.counterText();
+    barInner.style.width = `${percent(run.done, run.total)}%`;
+  };
+  return { nodes: [counter, el("div", { className: "progress-bar" }, barInner)], update };
+}
+
+async function renderFlashcards(app, level) {
+  const favoritesMode = level === null;
+  const run = favoritesMode ? new FavoritesRun() : new StudyRun({
+    type: "flashcards", level, section: "flashcards",
+    reviewMessage: (n) => `${n} words still need review. Continue in review mode? If you cancel, your progress will be reset.`,
+    doneMessage: "You've completed all flashcards! Progress has been reset.",
+  });
+  const [, favorites] = await Promise.all([run.load(), api("GET", "/api/favorites")]);
+  const favoriteIds = new Set((favorites.data || []).map((word) => word.id));
+  app.append(el("h1", {}, favoritesMode ? "Favorite Flashcards" : `Flashcards ${level}`));
+  if (!run.order.length) {
+    app.append(el("p", {}, "No favorite words yet."));
+    return;
+  }
+
+  let showMeaning = sessionStorage.getItem(SHOW_MEANING_KEY) === "1";
+  let showExample = sessionStorage.getItem(SHOW_EXAMPLE_KEY) === "1";
+  let busy = false;
+
+  const counter = el("div", { testid: "progress-counter", className: "progress-counter" });
+  const star = el("span", { testid: "star-btn" });
+  const favoriteBtn = el("button", { testid: "favorite-btn", type: "button", className: "star", "aria-label": "Favorite" }, star);
+  const vocabulary = el("div", { testid: "vocabulary", className: "vocabulary" });
+  const furigana = el("div", { testid: "furigana", className: "furigana" });
+  const meaning = el("div", { testid: "meaning", className: "meaning" });
+  const exSentence = el("div", { testid: "ex-sentence", className: "ex-sentence" });
+  const exTranslation = el("div", { testid: "ex-translation", className: "ex-translation" });
+  const meaningBtn = el("button", { testid: "meaning-btn", type: "button", className: "toggle" });
+  const exampleBtn = el("button", { testid: "example-btn", type: "button", className: "toggle" });
+  const oBtn = el("button", { testid: "o-btn", type: "button", className: "ox-btn" }, "O");
+  const xBtn = el("button", { testid: "x-btn", type: "button", className: "ox-btn" }, "X");
+
+  function applyToggles() {
+    furigana.hidden = !showMeaning;
+    meaning.hidden = !showMeaning;
+    exSentence.hidden = !showExample;
+    exTranslation.hidden = !(showExample && showMeaning);
+    meaningBtn.textContent = showMeaning ? "Hide meaning" : "Show meaning";
+    exampleBtn.textContent = showExample ? "Hide example sentence" : "See example sentence";
+  }
+
+  function show() {
+    const word = run.current;
+    vocabulary.textContent = word.kanji;
+    furigana.textContent = word.furigana;
+    meaning.textContent = word.meaning;
+    exSentence.textContent = word.example_sentence;
+    exTranslation.textContent = word.example_translation;
+    star.textContent = favoriteIds.has(word.id) ? "★" : "☆";
+    counter.textContent = run.counterText();
+    vocabulary.dataset.wordId = word.id;
+    oBtn.disabled = false;
+    xBtn.disabled = false;
+    busy = false;
+  }
+
+  async function answer(correct) {
+    if (busy) return;
+    busy = true;
+    oBtn.disabled = true;
+    xBtn.disabled = true;
+    await run.record(correct);
+    counter.textContent = run.counterText();
+    await sleep(FLASHCARD_TRANSITION_MS);
+    if (await run.advance()) show();
+  }
+
+  meaningBtn.addEventListener("click", () => {
+    showMeaning = !showMeaning;
+    sessionStorage.setItem(SHOW_MEANING_KEY, showMeaning ? "1" : "0");
+    applyToggles();
+  });
+  exampleBtn.addEventListener("click", () => {
+    showExample = !showExample;
+    sessionStorage.setItem(SHOW_EXAMPLE_KEY, showExample ? "1" : "0");
+    applyToggles();
+  });
+  favoriteBtn.addEventListener("click", async () => {
+    const wordId = run.current.id;
+    const res = await api("POST", "/api/favorites", { wordId });
+    if (!res.ok) return;
+    if (res.data.favorited) favoriteIds.add(wordId);
+    else favoriteIds.delete(wordId);
+    if (run.current.id === wordId) star.textContent = res.data.favorited ? "★" : "☆";
+  });
+  oBtn.addEventListener("click", () => answer(true));
+  xBtn.addEventListener("click", () => answer(false));
+
+  app.append(counter, el("div", { className: "card" },
+    favoriteBtn, vocabulary, furigana, meaning, exSentence, exTranslation,
+    el("div", {}, meaningBtn, exampleBtn)),
+  el("div", { className: "answer-row" }, oBtn, xBtn));
+  applyToggles();
+  show();
+}
+
+async function renderQuiz(app, level, type) {
+  const run = new StudyRun({
+    type: `quiz-${type}`, level, section: "quiz",
+    reviewMessage: (n) => `${n} words need review. Continue in review mode? If you cancel, your progress will be reset.`,
+    doneMessage: "Quiz completed! Progress reset.",
+  });
+  await run.load();
+  const [promptField, answerField] = type === "kanji-to-furigana" ? ["kanji", "furigana"] : ["furigana", "kanji"];
+  const header = progressHeader(run);
+  const question = el("div", { testid: "question-box", className: "question-box", tabindex: "0" });
+  const buttons = [1, 2, 3, 4].map((n) =>
+    el("button", { testid: `answer-${n}`, type: "button", className: "answer-btn", onClick: () => choose(n - 1) }));
+  let options = [];
+  let busy = false;
+
+  function show() {
+    const word = run.current;
+    const distractors = shuffle([...new Set(run.words.map((w) => w[answerField]))]
+      .filter((value) => value !== word[answerField])).slice(0, 3);
+    options = shuffle([word[answerField], ...distractors]);
+    buttons.forEach((button, i) => {
+      button.textContent = `${i + 1}. ${options[i] || ""}`;
+      button.className = "answer-btn";
+      button.hidden = i >= options.length;
+      button.disabled = false;
+    });
+    question.textContent = word[promptField];
+    question.dataset.wordId = word.id;
+    header.update();
+    busy = false;
+  }
+
+  async function choose(i) {
+    if (busy || i >= options.length) return;
+    busy = true;
+    const expected = run.current[answerField];
+    buttons.forEach((button, j) => {
+      button.disabled = true;
+      if (options[j] === expected) button.classList.add("bg-green-400");
+      else if (j === i) button.classList.add("bg-red-400");
+      else button.classList.add("bg-orange-100");
+    });
+    await Promise.all([run.record(options[i] === expected), sleep(QUIZ_FEEDBACK_MS)]);
+    header.update();
+    if (await run.advance()) show();
+  }
+
+  document.addEventListener("keydown", (event) => {
+    if (/^[1-4]$/.test(event.key)) choose(Number(event.key) - 1);
+  });
+
+  app.append(el("h1", {}, `Quiz ${level}`), ...header.nodes, question, el("div", { className: "answers" }, buttons));
+  show();
+}
+
+async function renderFill(app, level) {
+  const run = new StudyRun({
+    type: "fill", level, section: "fill-in-the-blank",
+    reviewMessage: (n) => `${n} words need review. Continue in review mode? If you cancel, your progress will be reset.`,
+    doneMessage: "You completed all Fill-in-the-Blank quizzes! Progress reset.",
+  });
+  await run.load();
+  const header = progressHeader(run);
+  const sentence = el("p", { testid: "blank-sentence" });
+  const fillBox = el("div", { testid: "fill-box", className: "fill-box" }, sentence);
+  const meaning = el("p", { testid: "english-meaning", className: "english-meaning" });
+  const input = el("input", { testid: "input-box", type: "text", autocomplete: "off", placeholder: "Type the missing word" });
+  const submit = el("button", { testid: "submit-btn", type: "submit", className: "primary" }, "Submit");
+  let blank = null;
+  let busy = false;
+
+  function show() {
+    const word = run.current;
+    const [before, ...after] = word.example_sentence.split(word.answer_in_example);
+    blank = el("span", { className: "blank" }, "____");
+    sentence.replaceChildren(before, blank, after.join(word.answer_in_example));
+    meaning.textContent = word.meaning;
+    fillBox.dataset.wordId = word.id;
+    input.value = "";
+    submit.textContent = "Submit";
+    submit.disabled = false;
+    header.update();
+    busy = false;
+    input.focus();
+  }
+
+  // The input stays enabled during feedback; the busy flag and the disabled
+  // submit button keep repeated clicks or Enter presses from double-recording.
+  async function onSubmit(event) {
+    event.preventDefault();
+    if (busy) return;
+    busy = true;
+    const expected = run.current.answer_in_example;
+    const correct = input.value.normalize("NFKC").trim() === expected.normalize("NFKC");
+    blank.replaceWith(el("span", { testid: "fill-answer",
+      className: `fill-answer ${correct ? "text-green-500" : "text-red-500"}` }, expected));
+    submit.textContent = correct ? "Correct!" : "Incorrect";
+    submit.disabled = true;
+    await Promise.all([run.record(correct), sleep(FILL_FEEDBACK_MS)]);
+    header.update();
+    if (await run.advance()) show();
+  }
+
+  app.append(el("h1", {}, `Fill in the Blank ${level}`), ...header.nodes, fillBox, meaning,
+    el("form", { className: "fill-form", onSubmit }, input, submit));
+  show();
+}
+
+// --- account ---
+
+function pieChart(value, size) {
+  const radius = 15.9155; // circumference of 100, so the dash array is the percentage
+  return svg("svg", { viewBox: "0 0 36 36", width: size, height: size },
+    svg("circle", { cx: 18, cy: 18, r: radius, fill: "none", stroke: "#fed7aa", "stroke-width": 4 }),
+    svg("circle", { cx: 18, cy: 18, r: radius, fill: "none", stroke: "#f97316", "stroke-width": 4,
+      "stroke-dasharray": `${value} ${100 - value}`, "stroke-dashoffset": 25 }),
+    svg("text", { x: 18, y: 20.5, "text-anchor": "middle", "font-size": 8 }, `${value}%`));
+}
+
+async function renderProgressCharts(panel) {
+  const [summary, ...progress] = await Promise.all([
+    api("GET", "/api/words?summary=true"),
+    ...PROGRESS_TYPES.map(([key]) => api("GET", `/api/study-progress?${query({ type: key })}`)),
+  ]);
+  const totals = new Map(((summary.data && summary.data.summary) || []).map((item) => [item.level, item.count]));
+  const totalWords = (summary.data && summary.data.total) || 0;
+
+  PROGRESS_TYPES.forEach(([key, label], i) => {
+    const completed = (progress[i].data || []).filter((row) => row.completed);
+    const byLevel = new Map();
+    completed.forEach((row) => byLevel.set(row.level.toUpperCase(), (byLevel.get(row.level.toUpperCase()) || 0) + 1));
+    const pies = LEVELS.slice().reverse().map((level) =>
+      el("div", { testid: `progress-pie-${level.toLowerCase()}`, className: "pie" },
+        pieChart(percent(byLevel.get(level) || 0, totals.get(level) || 0), 64), el("span", {}, level)));
+    panel.append(el("div", { testid: `progress-chart-container-${key}`, className: "chart" },
+      el("h3", {}, label),
+      el("div", { className: "pies" },
+        el("div", { className: "pie" },
+          pieChart(percent(completed.length, totalWords), 96),
+          el("span", { testid: "progress-total" }, `${completed.length} of ${totalWords} words`)),
+        pies)));
+  });
+}
+
+function renderSettings(panel) {
+  const current = el("p", {}, `Current username: ${currentUser.username}`);
+  const usernameField = el("input", { testid: "username-field", type: "text", placeholder: "New username", autocomplete: "off" });
+  const usernameCheck = el("div", { testid: "username-check", className: "feedback", hidden: true });
+  const pwField = el("input", { testid: "pw-field", type: "password", placeholder: "New password", autocomplete: "new-password" });
+  const pwCheck = passwordChecklist("pw-check", null);
+  const save = el("button", { testid: "save-btn", type: "button", className: "primary", disabled: true }, "Save Changes");
+  const status = el("div", {});
+  let saving = false;
+
+  function refresh() {
+    const name = usernameField.value.trim();
+    const pw = pwField.value;
+    const nameOk = !name || (usernameState.valid && usernameState.available);
+    const pwOk = !pw || passwordOk(pw);
+    save.disabled = saving || !(name || pw) || !nameOk || !pwOk;
+  }
+
+  const usernameState = liveAvailability(usernameField, usernameCheck, {
+    rule: USERNAME_RULE, invalidText: USERNAME_HINT, endpoint: "/api/auth/check-username", param: "username",
+    availableText: "Username available!", takenText: "Username is already in use",
+  }, refresh);
+  pwField.addEventListener("input", () => {
+    pwCheck.update(pwField.value);
+    refresh();
+  });
+
+  save.addEventListener("click", async () => {
+    const body = {};
+    if (usernameField.value.trim()) body.username = usernameField.value.trim();
+    if (pwField.value) body.password = pwField.value;
+    saving = true;
+    refresh();
+    status.replaceChildren();
+    const res = await api("PATCH", "/api/user", body);
+    saving = false;
+    if (!res.ok) {
+      status.replaceChildren(el("p", { className: "text-red-500" }, (res.data && res.data.error) || "Update failed."));
+      refresh();
+      return;
+    }
+    if (body.username) {
+      currentUser.username = body.username;
+      current.textContent = `Current username: ${body.username}`;
+      renderNav();
+    }
+    usernameField.value = "";
+    pwField.value = "";
+    setFeedback(usernameCheck, "");
+    pwCheck.update("");
+    refresh();
+    status.replaceChildren(el("p", { testid: "success-msg", className: "text-green-600" }, "Account updated successfully."));
+  });
+
+  const remove = el("button", { testid: "delete-btn", type: "button", className: "danger" }, "Delete Account");
+  remove.addEventListener("click", async () => {
+    if (!confirm("Are you sure you want to delete your account? This cannot be undone.")) return;
+    const res = await api("DELETE", "/api/user");
+    if (!res.ok) return;
+    alert("Account deleted.");
+    location.href = "/";
+  });
+
+  panel.append(current,
+    el("label", {}, "Username"), usernameField, usernameCheck,
+    el("label", {}, "Password"), pwField, pwCheck.list,
+    save, status, el("hr", {}), remove);
+}
+
+async function renderAccount(app) {
+  const progressPanel = el("section", {});
+  const settingsPanel = el("section", { className: "settings", hidden: true });
+  const progressTab = el("button", { testid: "study-progress-tab", type: "button", className: "active" }, "Study Progress");
+  const settingsTab = el("button", { testid: "account-settings-tab", type: "button" }, "Account Settings");
+  const select = (showSettings) => {
+    progressPanel.hidden = showSettings;
+    settingsPanel.hidden = !showSettings;
+    progressTab.classList.toggle("active", !showSettings);
+    settingsTab.classList.toggle("active", showSettings);
+  };
+  progressTab.addEventListener("click", () => select(false));
+  settingsTab.addEventListener("click", () => select(true));
+
+  app.append(el("h1", {}, "My Account"), el("div", { className: "tabs" }, progressTab, settingsTab),
+    progressPanel, settingsPanel);
+  renderSettings(settingsPanel);
+  await renderProgressCharts(progressPanel);
+}
+
+// --- routing ---
+
+const PUBLIC_PAGES = { "/": renderHome, "/login": renderLogin, "/signup": renderSignup, "/verify": renderVerify };
+
+function routePrivate(app, path) {
+  let match;
+  if (path === "/account") return renderAccount(app);
+  if ((match = path.match(/^\/study\/(flashcards|quiz|fill-in-the-blank)$/))) return renderLevelSelection(app, match[1]);
+  if (path === "/study/flashcards/favorites") return renderFlashcards(app, null);
+  if ((match = path.match(/^\/study\/flashcards\/([^/]+)$/))) return renderFlashcards(app, match[1].toUpperCase());
+  if ((match = path.match(/^\/study\/quiz\/([^/]+)$/))) return renderQuizTypeSelection(app, match[1]);
+  if ((match = path.match(/^\/study\/quiz\/([^/]+)\/(kanji-to-furigana|furigana-to-kanji)$/))) {
+    return renderQuiz(app, match[1].toUpperCase(), match[2]);
+  }
+  if ((match = path.match(/^\/study\/fill-in-the-blank\/([^/]+)$/))) return renderFill(app, match[1].toUpperCase());
+  app.append(el("h1", {}, "Page not found"));
+}
+
+// Public pages render before the session lookup so their forms exist as soon
+// as the document has loaded; everything else needs the user first.
+async function boot() {
+  const app = document.getElementById("app");
+  const path = location.pathname.replace(/\/+$/, "") || "/";
+  const publicPage = PUBLIC_PAGES[path];
+  const pageDone = publicPage ? publicPage(app) : null;
+  const me = await api("GET", "/api/user");
+  currentUser = me.ok ? me.data : null;
+  renderNav();
+  if (publicPage) return pageDone;
+  if (!currentUser) {
+    location.href = "/login";
+    return;
+  }
+  await routePrivate(app, path);
+}
+
+document.addEventListener("DOMContentLoaded", boot);
@@ -0,0 +1,213 @@
+import datetime
+import secrets
+import threading
+from tests.standin.words import build_words
+
+VERIFY_TOKEN_TTL = datetime.timedelta(hours=24)
+
+def _now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+class Store:
+    """In-memory users, tokens, study progress and favorites for the stand-in server.
+
+    Every public method takes the store lock, so the threaded HTTP server can
+    call in from any request thread. Levels are kept upper-case; callers may
+    pass 'n2' or 'N2'.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.words = build_words()
+        self.words_by_id = {w["id"]: w for w in self.words}
+        self._users = {}            # email -> user dict
+        self._auth_tokens = {}      # token -> email
+        self._verify_tokens = {}    # token -> {"email", "expires", "used"}
+        self._progress = {}         # (user_id, type, LEVEL) -> {word_id: completed}
+        self._study_sessions = {}   # (user_id, type, LEVEL) -> {"order", "index", "review"}
+        self._favorites = {}        # user_id -> [word_id, ...]
+        self._next_user_id = 1
+
+    # --- users ---
+
+    def add_user(self, username, email, password, verified=False):
+        """Create (or replace an unverified) account and return it."""
+
+        with self._lock:
+            existing = self._users.get(email.lower())
+            if existing is not None:
+                self._drop_user_data(existing)
+            user = {
+                "id": self._next_user_id,
+                "username": username,
+                "email": email,
+                "password": password,
+                "verified": verified,
+            }
+            self._next_user_id += 1
+            self._users[email.lower()] = user
+            return user
+
+    def user_by_email(self, email):
+        with self._lock:
+            return self._users.get((email or "").lower())
+
+    def username_taken(self, username, exclude_email=None):
+        with self._lock:
+            return any(
+                u["username"].lower() == (username or "").lower() and u["email"].lower() != (exclude_email or "").lower()
+                for u in self._users.values()
+            )
+
+    def email_taken(self, email):
+        """Verified accounts own their address; an unverified signup may be repeated."""
+
+        user = self.user_by_email(email)
+        return user is not None and user["verified"]
+
+    def update_user(self, user, username=None, password=None):
+        with self._lock:
+            if username:
+                user["username"] = username
+            if password:
+                user["password"] = password
+
+    def delete_user(self, user):
+        with self._lock:
+            self._users.pop(user["email"].lower(), None)
+            self._drop_user_data(user)
+
+    def _drop_user_data(self, user):
+        for token in [t for t, email in self._auth_tokens.items() if email.lower() == user["email"].lower()]:
+            del self._auth_tokens[token]
+        for key in [k for k in self._progress if k[0] == user["id"]]:
+            del self._progress[key]
+        for key in [k for k in self._study_sessions if k[0] == user["id"]]:
+            del self._study_sessions[key]
+        self._favorites.pop(user["id"], None)
+
+    # --- auth tokens ---
+
+    def issue_auth_token(self, user):
+        with self._lock:
+            token = secrets.token_urlsafe(24)
+            self._auth_tokens[token] = user["email"]
+            return token
+
+    def revoke_auth_token(self, token):
+        with self._lock:
+            self._auth_tokens.pop(token, None)
+
+    def user_for_token(self, token):
+        with self._lock:
+            email = self._auth_tokens.get(token or "")
+            return self._users.get(email.lower()) if email else None
+
+    # --- email verification ---
+
+    def issue_verify_token(self, email):
+        """Issue a fresh verification token; earlier ones for the address stop working."""
+
+        with self._lock:
+            for entry in self._verify_tokens.values():
+                if entry["email"].lower() == email.lower():
+                    entry["used"] = True
+            token = secrets.token_urlsafe(24)
+            self._verify_tokens[token] = {"email": email, "expires": _now() + VERIFY_TOKEN_TTL, "used": False}
+            return token
+
+    def shift_verify_expiry(self, email, minutes_offset):
+        """Move the live token's expiry to now + minutes_offset; returns False when there is none."""
+
+        with self._lock:
+            live = [e for e in self._verify_tokens.values() if e["email"].lower() == email.lower() and not e["used"]]
+            for entry in live:
+                entry["expires"] = _now() + datetime.timedelta(minutes=minutes_offset)
+            return bool(live)
+
+    def verify(self, token):
+        """Consume a verification token; returns 'verified', 'expired' or 'invalid'."""
+
+        with self._lock:
+            entry = self._verify_tokens.get(token or "")
+            if entry is None or entry["used"]:
+                return "invalid"
+            user = self._users.get(entry["email"].lower())
+            if user is None:
+                return "invalid"
+            if entry["expires"] < _now():
+                return "expired"
+            entry["used"] = True
+            user["verified"] = True
+            return "verified"
+
+    # --- words ---
+
+    def words_for_level(self, level):
+        level = (level or "").upper()
+        return [w for w in self.words if w["level"] == level]
+
+    def words_summary(self):
+        counts = {}
+        for word in self.words:
+            counts[word["level"]] = counts.get(word["level"], 0) + 1
+        return {
+            "summary": [{"level": level, "count": count} for level, count in counts.items()],
+            "total": len(self.words),
+        }
+
+    # --- study progress ---
+
+    def progress(self, user, type, level=None, word_id=None):
+        """Progress rows as the API returns them; a dict (possibly empty) when `word_id` is given."""
+
+        with self._lock:
+            rows = []
+            for (user_id, row_type, row_level), words in self._progress.items():
+                if user_id != user["id"] or row_type != type:
+                    continue
+                if level is not None and row_level != level.upper():
+                    continue
+                rows.extend({"wordId": wid, "level": row_level, "completed": done} for wid, done in words.items())
+            if word_id is None:
+                return rows
+            return next((row for row in rows if row["wordId"] == int(word_id)), {})
+
+    def record_progress(self, user, type, level, word_id, completed):
+        with self._lock:
+            self._progress.setdefault((user["id"], type, level.upper()), {})[int(word_id)] = bool(completed)
+
+    def reset_progress(self, user, type, level):
+        with self._lock:
+            self._progress.pop((user["id"], type, level.upper()), None)
+            self._study_sessions.pop((user["id"], type, level.upper()), None)
+
+    def study_session(self, user, type, level):
+        with self._lock:
+            state = self._study_sessions.get((user["id"], type, level.upper()))
+            return dict(state) if state else None
+
+    def save_study_session(self, user, type, level, state):
+        with self._lock:
+            self._study_sessions[(user["id"], type, level.upper())] = {
+                "order": [int(w) for w in state.get("order", [])],
+                "index": int(state.get("index", 0)),
+                "review": bool(state.get("review", False)),
+            }
+
+    # --- favorites ---
+
+    def favorites(self, user):
+        with self._lock:
+            return [self.words_by_id[wid] for wid in self._favorites.get(user["id"], []) if wid in self.words_by_id]
+
+    def toggle_favorite(self, user, word_id):
+        """Add or remove the word; returns True when it is now a favorite."""
+
+        with self._lock:
+            ids = self._favorites.setdefault(user["id"], [])
+            if word_id in ids:
+                ids.remove(word_id)
+                return False
+            ids.append(word_id)
+            return True
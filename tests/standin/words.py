@@ -0,0 +1,106 @@
+STUDY_LEVELS = ("N5", "N4", "N3", "N2", "N1")
+TEST_LEVEL = "TEST"
+
+# (kanji, furigana, meaning, example sentence, example translation, answer as it appears in the example)
+_VOCABULARY = {
+    "N5": [
+        ("学校", "がっこう", "school", "毎日学校へ行きます。", "I go to school every day.", "学校"),
+        ("先生", "せんせい", "teacher", "先生に質問しました。", "I asked the teacher a question.", "先生"),
+        ("友達", "ともだち", "friend", "友達と映画を見ました。", "I watched a movie with a friend.", "友達"),
+        ("電車", "でんしゃ", "train", "電車で会社に行きます。", "I go to work by train.", "電車"),
+        ("天気", "てんき", "weather", "今日はいい天気ですね。", "Nice weather today, isn't it?", "天気"),
+        ("時間", "じかん", "time", "時間がありません。", "I don't have time.", "時間"),
+        ("新聞", "しんぶん", "newspaper", "父は朝新聞を読みます。", "My father reads the newspaper in the morning.", "新聞"),
+        ("病院", "びょういん", "hospital", "病院は駅の近くです。", "The hospital is near the station.", "病院"),
+        ("会社", "かいしゃ", "company", "兄は大きい会社で働いています。", "My brother works at a big company.", "会社"),
+        ("映画", "えいが", "movie", "週末に映画を見に行きましょう。", "Let's go see a movie on the weekend.", "映画"),
+        ("料理", "りょうり", "cooking", "母の料理はおいしいです。", "My mother's cooking is delicious.", "料理"),
+        ("写真", "しゃしん", "photograph", "旅行の写真を見せてください。", "Please show me the photos from your trip.", "写真"),
+    ],
+    "N4": [
+        ("会議", "かいぎ", "meeting", "午後から会議があります。", "There is a meeting in the afternoon.", "会議"),
+        ("準備", "じゅんび", "preparation", "旅行の準備はできましたか。", "Are you ready for the trip?", "準備"),
+        ("経験", "けいけん", "experience", "海外で働いた経験があります。", "I have experience working abroad.", "経験"),
+        ("説明", "せつめい", "explanation", "先生の説明はわかりやすいです。", "The teacher's explanation is easy to understand.", "説明"),
+        ("予定", "よてい", "plan", "明日の予定を教えてください。", "Please tell me your plans for tomorrow.", "予定"),
+        ("研究", "けんきゅう", "research", "大学で日本語の研究をしています。", "I research Japanese at university.", "研究"),
+        ("趣味", "しゅみ", "hobby", "私の趣味は写真を撮ることです。", "My hobby is taking photos.", "趣味"),
+        ("約束", "やくそく", "promise", "友達との約束を忘れました。", "I forgot my promise to my friend.", "約束"),
+        ("景色", "けしき", "scenery", "山の上からの景色はきれいです。", "The view from the top of the mountain is beautiful.", "景色"),
+        ("意見", "いけん", "opinion", "あなたの意見を聞かせてください。", "Please let me hear your opinion.", "意見"),
+        ("交通", "こうつう", "traffic", "この町は交通が便利です。", "Transportation in this town is convenient.", "交通"),
+        ("旅館", "りょかん", "Japanese inn", "京都の旅館に泊まりました。", "I stayed at a Japanese inn in Kyoto.", "旅館"),
+    ],
+    "N3": [
+        ("違反", "いはん", "violation", "それは交通違反です。", "That is a traffic violation.", "違反"),
+        ("感情", "かんじょう", "emotion", "彼は感情を顔に出さない。", "He doesn't show his emotions.", "感情"),
+        ("努力", "どりょく", "effort", "努力すれば必ず上手になります。", "If you make an effort, you will surely improve.", "努力"),
+        ("環境", "かんきょう", "environment", "環境を守ることは大切です。", "Protecting the environment is important.", "環境"),
+        ("影響", "えいきょう", "influence", "台風の影響で電車が止まった。", "The trains stopped because of the typhoon.", "影響"),
+        ("現在", "げんざい", "present time", "現在、東京に住んでいます。", "I currently live in Tokyo.", "現在"),
+        ("目的", "もくてき", "purpose", "旅行の目的は何ですか。", "What is the purpose of your trip?", "目的"),
+        ("機会", "きかい", "opportunity", "日本語を話す機会が少ない。", "I have few opportunities to speak Japanese.", "機会"),
+        ("情報", "じょうほう", "information", "新しい情報を集めています。", "I am collecting new information.", "情報"),
+        ("将来", "しょうらい", "future", "将来は医者になりたいです。", "I want to become a doctor in the future.", "将来"),
+        ("解決", "かいけつ", "solution", "問題はすぐに解決した。", "The problem was solved right away.", "解決"),
+        ("責任", "せきにん", "responsibility", "失敗の責任は私にあります。", "The responsibility for the failure is mine.", "責任"),
+    ],
+    "N2": [
+        ("把握", "はあく", "grasp", "状況を正確に把握する必要がある。", "We need to grasp the situation accurately.", "把握"),
+        ("需要", "じゅよう", "demand", "夏はビールの需要が高まる。", "Demand for beer rises in summer.", "需要"),
+        ("削減", "さくげん", "reduction", "会社は経費の削減を決めた。", "The company decided to cut expenses.", "削減"),
+        ("維持", "いじ", "maintenance", "健康を維持するために運動している。", "I exercise to maintain my health.", "維持"),
+        ("貢献", "こうけん", "contribution", "彼は地域社会に貢献した。", "He contributed to the local community.", "貢献"),
+        ("抵抗", "ていこう", "resistance", "新しい制度に抵抗を感じる人もいる。", "Some people resist the new system.", "抵抗"),
+        ("拡大", "かくだい", "expansion", "事業を海外に拡大する予定だ。", "We plan to expand the business overseas.", "拡大"),
+        ("範囲", "はんい", "range", "試験の範囲を確認してください。", "Please check the scope of the exam.", "範囲"),
+        ("傾向", "けいこう", "tendency", "最近、若者の読書離れの傾向がある。", "Recently young people tend to read less.", "傾向"),
+        ("妥協", "だきょう", "compromise", "両者は妥協して合意に至った。", "Both sides compromised and reached an agreement.", "妥協"),
+        ("援助", "えんじょ", "assistance", "被災地に援助を送った。", "We sent aid to the disaster area.", "援助"),
+        ("催促", "さいそく", "urging", "返事を催促するメールを送った。", "I sent an email pressing for a reply.", "催促"),
+    ],
+    "N1": [
+        ("斡旋", "あっせん", "mediation", "知人の斡旋で就職が決まった。", "I got the job through an acquaintance's introduction.", "斡旋"),
+        ("抜粋", "ばっすい", "excerpt", "報告書の抜粋を配布した。", "We handed out an excerpt of the report.", "抜粋"),
+        ("逸脱", "いつだつ", "deviation", "規則からの逸脱は認められない。", "Deviation from the rules is not permitted.", "逸脱"),
+        ("頒布", "はんぷ", "distribution", "資料を会場で頒布する。", "The materials will be distributed at the venue.", "頒布"),
+        ("懸念", "けねん", "concern", "景気の悪化が懸念されている。", "There are concerns about the economy worsening.", "懸念"),
+        ("是正", "ぜせい", "correction", "不公平な制度を是正するべきだ。", "The unfair system should be corrected.", "是正"),
+        ("督促", "とくそく", "demand for payment", "家賃の督促状が届いた。", "A reminder to pay the rent arrived.", "督促"),
+        ("顕著", "けんちょ", "remarkable", "効果が顕著に現れた。", "The effect appeared remarkably.", "顕著"),
+        ("措置", "そち", "measure", "政府は緊急の措置を取った。", "The government took emergency measures.", "措置"),
+        ("緩和", "かんわ", "relaxation", "規制の緩和が進んでいる。", "Deregulation is progressing.", "緩和"),
+        ("拘束", "こうそく", "restraint", "長時間の拘束は負担になる。", "Being tied up for long hours is a burden.", "拘束"),
+        ("踏襲", "とうしゅう", "following precedent", "前任者の方針を踏襲する。", "I will follow my predecessor's policy.", "踏襲"),
+    ],
+}
+
+def _test_words():
+    """Five words in the shape the TEST-level assertions rely on.
+
+    The kanji contains テスト, the furigana contains てすと, and the fill answer
+    is テスト followed by the last character of the English meaning.
+    """
+    return [
+        (f"テスト{n}", f"てすと{n}", f"test word {n}", f"これはテスト{n}です。", f"This is test {n}.", f"テスト{n}")
+        for n in range(1, 6)
+    ]
+
+def build_words():
+    """Return every seeded word as API-shaped dicts, ids assigned level by level (N5 first, TEST last)."""
+
+    words = []
+    levels = [(level, _VOCABULARY[level]) for level in STUDY_LEVELS] + [(TEST_LEVEL, _test_words())]
+    for level, entries in levels:
+        for kanji, furigana, meaning, sentence, translation, answer in entries:
+            words.append({
+                "id": len(words) + 1,
+                "level": level,
+                "kanji": kanji,
+                "furigana": furigana,
+                "meaning": meaning,
+                "example_sentence": sentence,
+                "example_translation": translation,
+                "answer_in_example": answer,
+            })
+    return words
@@ -1,6 +1,26 @@
+import statistics
+import time
+import pytest
+from tests.utils import http_client
+
 def test_homepage_loads(driver, base_url):
     try:
         driver.get(base_url)
         assert driver.title != ""
     finally:
-        driver.quit()
\ No newline at end of file
+        driver.quit()
+
+def test_local_server_answers_api(local_server):
+    """The --local-server stand-in serves the API over keep-alive without Nagle/delayed-ACK stalls."""
+
+    if local_server is None:
+        pytest.skip("Needs --local-server")
+    url = f"{local_server.base_url}/api/words"
+    latencies = []
+    for _ in range(5):
+        start = time.perf_counter()
+        r = http_client.get(url, params={"summary": "true"}, timeout=5)
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert r.status_code == 200, r.text
+    assert "summary" in r.json()
+    assert statistics.median(latencies) < 30, f"Stand-in replies too slowly: {latencies} ms"
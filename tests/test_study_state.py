@@ -0,0 +1,26 @@
+import pytest
+from tests.utils import http_client
+
+EMAIL = "restore@nori.local"
+PASSWORD = "Rest0re!"
+
+def test_restore_replays_a_snapshot(local_server, study_state):
+    """A snapshot written back with `restore` reads back the same, and teardown resets the restored scope."""
+
+    if local_server is None:
+        pytest.skip("Needs --local-server")
+    local_server.seed_account("Restore", EMAIL, PASSWORD)
+    words = http_client.get(f"{local_server.base_url}/api/words", params={"level": "N5"}, timeout=5).json()
+    rows = [{"wordId": w["id"], "completed": i % 2 == 0} for i, w in enumerate(words[:5])]
+
+    study_state.restore(EMAIL, PASSWORD, "flashcards", "N5", rows)
+    saved = study_state.snapshot(EMAIL, PASSWORD, "flashcards", "N5")
+    assert {(r["wordId"], r["completed"]) for r in saved} == {(r["wordId"], r["completed"]) for r in rows}
+
+    # Restoring replaces the scope rather than adding to it
+    study_state.restore(EMAIL, PASSWORD, "flashcards", "N5", saved[:2])
+    assert len(study_state.snapshot(EMAIL, PASSWORD, "flashcards", "N5")) == 2
+    assert not study_state.is_clean(EMAIL, "flashcards", "N5")
+
+    assert study_state.reset_dirty() == 1
+    assert study_state.snapshot(EMAIL, PASSWORD, "flashcards", "N5") == []
@@ -0,0 +1,49 @@
+import json
+import time
+from pathlib import Path
+from tests.utils import http_client
+
+COMPARED_PERCENTILES = ("p50", "p95")
+
+def benchmark(method, url, runs, warmup=3, **kwargs):
+    """Send `warmup` untimed requests, then `runs` timed ones; return latencies in ms.
+
+    Requests go through the shared keep-alive client, so the numbers measure
+    the server rather than TCP/TLS setup.
+    """
+    kwargs.setdefault("timeout", 10)
+    for _ in range(warmup):
+        http_client.request(method, url, **kwargs).raise_for_status()
+
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        r = http_client.request(method, url, **kwargs)
+        latencies.append((time.perf_counter() - start) * 1000)
+        r.raise_for_status()
+    return latencies
+
+def find_regressions(summary, baseline, tolerance, slack_ms):
+    """Return a message per compared percentile that exceeds baseline * (1 + tolerance) + slack_ms."""
+
+    regressions = []
+    for key in COMPARED_PERCENTILES:
+        if baseline.get(key) is None:
+            continue
+        limit = baseline[key] * (1 + tolerance) + slack_ms
+        if summary[key] > limit:
+            regressions.append(f"{key}={summary[key]}ms > {limit:.1f}ms (baseline {baseline[key]}ms)")
+    return regressions
+
+def load_baseline(path):
+    return json.loads(Path(path).read_text())
+
+def write_baseline(path, baseline):
+    Path(path).write_text(json.dumps(baseline, indent=2) + "\n")
+
+def merge_baseline(path, measured):
+    """Update only the endpoints in `measured`, keeping the file's other entries."""
+
+    baseline = load_baseline(path)
+    baseline.update(measured)
+    write_baseline(path, baseline)
@@ -1,3 +1,15 @@
+import os
+import warnings
+
+# Assumed to be the route the login form posts to; override if the backend differs
+LOGIN_API_PATH = os.getenv("NORI_LOGIN_API_PATH", "/api/auth/login")
+
+_fast_login_enabled = False
+_auth_cookie_cache = {}
+
+class LoginApiUnavailable(RuntimeError):
+    """The login API route does not exist or does not set a `token` cookie."""
+
 def make_unique_username(prefix="Test", max_len=20):
     """Generate a unique-looking username using the current timestamp."""
     
@@ -8,59 +20,147 @@ def make_unique_username(prefix="Test", max_len=20):
 def fill_signup_form(driver, base_url, username, email, password):
     """Fill in all sign-up inputs without submitting the form."""
     
-    from selenium.webdriver.common.by import By
+    from tests.pages.auth import SignupPage
     
-    driver.get(f"{base_url}/signup")
-    driver.find_element(By.XPATH, "//input[@placeholder='Username']").clear()
-    driver.find_element(By.XPATH, "//input[@placeholder='Username']").send_keys(username)
-    driver.find_element(By.XPATH, "//input[@placeholder='Email']").clear()
-    driver.find_element(By.XPATH, "//input[@placeholder='Email']").send_keys(email)
-    driver.find_element(By.XPATH, "//input[@placeholder='Password']").clear()
-    driver.find_element(By.XPATH, "//input[@placeholder='Password']").send_keys(password)
-    driver.find_element(By.XPATH, "//input[@placeholder='Confirm Password']").clear()
-    driver.find_element(By.XPATH, "//input[@placeholder='Confirm Password']").send_keys(password)
+    page = SignupPage.on(driver)
+    page.open(base_url)
+    page.fill(username, email, password)
     
 def fill_and_submit_signup(driver, base_url, username, email, password):
     """Complete and submit the sign-up form to create a user."""
     
-    from selenium.webdriver.common.by import By
+    from tests.pages.auth import SignupPage
     
-    driver.get(f"{base_url}/signup")
-    driver.find_element(By.XPATH, "//input[@placeholder='Username']").clear()
-    driver.find_element(By.XPATH, "//input[@placeholder='Username']").send_keys(username)
-    driver.find_element(By.XPATH, "//input[@placeholder='Email']").clear()
-    driver.find_element(By.XPATH, "//input[@placeholder='Email']").send_keys(email)
-    driver.find_element(By.XPATH, "//input[@placeholder='Password']").clear()
-    driver.find_element(By.XPATH, "//input[@placeholder='Password']").send_keys(password)
-    driver.find_element(By.XPATH, "//input[@placeholder='Confirm Password']").clear()
-    driver.find_element(By.XPATH, "//input[@placeholder='Confirm Password']").send_keys(password)
-    driver.find_element(By.XPATH, '//button[normalize-space()="Sign Up"]').click()
+    page = SignupPage.on(driver)
+    page.open(base_url)
+    page.fill(username, email, password)
+    page.submit()
 
 def login(driver, base_url, email, password):
     """Log into the application using the UI login form."""
-    from selenium.webdriver.common.by import By
+    from tests.pages.auth import LoginPage
+    
+    page = LoginPage.on(driver)
+    page.open(base_url)
+    page.fill(email, password)
+    page.submit()
+
+def enable_fast_login(enabled=True):
+    """Switch `sign_in` between the API fast path and the UI login form."""
+    
+    global _fast_login_enabled
+    _fast_login_enabled = bool(enabled)
+
+def sign_in(driver, base_url, email, password):
+    """Log in for tests that do not cover the login form itself.
+
+    Uses the API fast path when enabled (--fast-login), otherwise the UI form.
+    Either way the browser ends up on the home page.
+    """
+    from tests.utils.step_timing import step
+    
+    with step("login"):
+        if _fast_login_enabled:
+            fast_login(driver, base_url, email, password)
+        else:
+            login(driver, base_url, email, password)
+
+def fast_login(driver, base_url, email, password):
+    """Log in by injecting a cached auth `token` cookie instead of submitting the form.
+
+    If the login API is unusable, warns once, logs in through the UI form
+    and keeps using the form for the rest of the session.
+    """
+    global _fast_login_enabled
+    
+    try:
+        cookie = fetch_auth_cookie(base_url, email, password)
+    except LoginApiUnavailable as exc:
+        warnings.warn(f"{exc}; --fast-login falls back to the UI login form")
+        _fast_login_enabled = False
+        login(driver, base_url, email, password)
+        return
+    inject_auth_cookie(driver, base_url, cookie)
+    driver.get(f"{base_url}/")
+
+def fetch_auth_cookie(base_url, email, password):
+    """Return the `token` cookie for the user, logging in through the backend once per session.
+
+    Rationale: The UI login form costs a page load, two inputs and a redirect
+    per test. The token is reusable, so we fetch it once per user and cache it.
+    """
+    from tests.utils import http_client
+    
+    key = (base_url, email)
+    if key in _auth_cookie_cache:
+        return _auth_cookie_cache[key]
+    
+    r = http_client.post(
+        f"{base_url}{LOGIN_API_PATH}",
+        json={"email": email, "password": password},
+        timeout=5,
+    )
+    if r.status_code in (404, 405):
+        raise LoginApiUnavailable(
+            f"Login API {base_url}{LOGIN_API_PATH} returned {r.status_code}; set NORI_LOGIN_API_PATH to the backend's login route"
+        )
+    r.raise_for_status()
+    token = next((c for c in r.cookies if c.name == "token" and c.value), None)
+    if token is None:
+        raise LoginApiUnavailable(
+            f"Login API {base_url}{LOGIN_API_PATH} did not set a token cookie for {email}; "
+            f"check NORI_LOGIN_API_PATH"
+        )
     
-    driver.get(f"{base_url}/login")
-    driver.find_element(By.XPATH, "//input[@placeholder='Email']").clear()
-    driver.find_element(By.XPATH, "//input[@placeholder='Email']").send_keys(email)
-    driver.find_element(By.XPATH, "//input[@placeholder='Password']").clear()
-    driver.find_element(By.XPATH, "//input[@placeholder='Password']").send_keys(password)
-    driver.find_element(By.XPATH, '//button[text()="Log In"]').click()
+    cookie = {
+        "name": "token",
+        "value": token.value,
+        "path": token.path or "/",
+        "secure": bool(token.secure),
+        "httpOnly": token.has_nonstandard_attr("HttpOnly"),
+    }
+    _auth_cookie_cache[key] = cookie
+    return cookie
+
+def inject_auth_cookie(driver, base_url, cookie):
+    """Set the auth cookie for `base_url` before the first navigation."""
+    
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.setCookie", {**cookie, "url": base_url})
+        return
+    # WebDriver can only add cookies for the current domain - load a cheap page on it first
+    driver.get(f"{base_url}/favicon.ico")
+    driver.add_cookie({k: v for k, v in cookie.items() if k != "httpOnly"})
 
 def logout(driver):
     """Log the current user out via the navigation menu."""
     
-    from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.common.action_chains import ActionChains
     from selenium.webdriver.support import expected_conditions as EC
+    from tests.pages.auth import LOGOUT_BTN, NAV_HELLO
 
-    nav_hello = WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='nav-hello']")))
+    token = get_auth_token(driver, timeout=0)
+    nav_hello = WebDriverWait(driver, 5).until(EC.presence_of_element_located(NAV_HELLO))
     ActionChains(driver).move_to_element(nav_hello).perform() # hover
     logout_btn = WebDriverWait(driver, 5).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, "[data-testid='logout-btn']"))
+        EC.element_to_be_clickable(LOGOUT_BTN)
     )
     logout_btn.click()
+    forget_auth_cookie(token)
+
+def forget_auth_cookie(token):
+    """Drop cached login cookies carrying `token` (all of them when it is None), e.g. once the server revoked it.
+
+    Rationale: The server revokes the token on logout. A cached copy would be
+    injected by every later `fast_login` of that user and leave the browser
+    logged out, so the next fast login fetches a fresh one instead.
+    """
+    if token is None:
+        _auth_cookie_cache.clear()
+        return
+    for key in [key for key, cookie in _auth_cookie_cache.items() if cookie["value"] == token]:
+        del _auth_cookie_cache[key]
      
 def assert_logged_in(driver, base_url):
     """Assert the user lands on the home page and sees the logged-in nav."""
@@ -92,18 +192,21 @@ def assert_no_verify_error(driver):
         )
         pytest.fail("Unexpected verification error banner/text was shown")
 
-def new_chrome_like_fixture():
-    """Spin up a headless Chrome instance with sensible defaults."""
+def new_chrome_like_fixture(driver_path):
+    """Spin up a headless Chrome instance with sensible defaults.
+
+    `driver_path` comes from the `chromedriver_path` fixture, so the driver
+    cache and --offline-driver settings apply here too.
+    """
     
     from selenium import webdriver
     from selenium.webdriver.chrome.options import Options
     from selenium.webdriver.chrome.service import Service
-    from webdriver_manager.chrome import ChromeDriverManager
 
     opts = Options()
     opts.add_argument("--headless=new")
     opts.add_argument("--window-size=1366,900")
-    d = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=opts)
+    d = webdriver.Chrome(service=Service(driver_path), options=opts)
     return d
 
 def assert_no_sensitive_data_in_storage(driver):
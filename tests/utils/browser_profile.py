@@ -0,0 +1,55 @@
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from tests.utils.network_observer import add_performance_logging
+from tests.utils.perf_trace import add_trace_logging
+
+PROFILES = ("default", "lean")
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+DEFAULT_PAGE_LOAD_STRATEGY = {"default": "normal", "lean": "eager"}
+
+BLOCKED_URL_PATTERNS = [
+    # Images
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico",
+    # Fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # Analytics
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*vercel-insights.com*", "*/_vercel/insights/*", "*/_vercel/speed-insights/*",
+]
+
+def chrome_options(profile="default", page_load_strategy=None, network_log=False, trace=False):
+    """Build Chrome options for a profile.
+
+    Rationale: Functional tests assert on `data-testid` elements only, so the
+    lean profile runs headless, turns off image loading and returns control on
+    DOMContentLoaded (`eager`) instead of waiting for every asset. The default
+    profile keeps a visible, fully rendered browser. `network_log` keeps
+    DevTools Network events in the `performance` log for the network observer,
+    and `trace` adds DevTools trace events to it for `perf_trace`.
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unsupported browser profile: {profile}")
+
+    options = ChromeOptions()
+    if profile == "lean":
+        options.add_argument("--headless=new")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    options.add_argument("--window-size=1366,900")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.page_load_strategy = page_load_strategy or DEFAULT_PAGE_LOAD_STRATEGY[profile]
+    if network_log:
+        add_performance_logging(options)
+    if trace:
+        add_trace_logging(options)
+    return options
+
+def apply_profile(driver, profile="default"):
+    """Install the profile's DevTools network rules on the current tab (no-op outside Chrome).
+
+    Blocked URLs are per tab, so this runs again whenever a pooled browser has
+    been reset to a fresh tab.
+    """
+    if profile != "lean" or not hasattr(driver, "execute_cdp_cmd"):
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
@@ -1,38 +1,25 @@
-import requests
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from tests.utils import http_client
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from tests.pages.account import AccountPage
 
 LEVELS = ["N1", "N2", "N3", "N4", "N5"]
-NAV_HELLO = (By.CSS_SELECTOR, "[data-testid='nav-hello']")
-ACCOUNT_LINK = (By.XPATH, "//a[@href='/account']")
-ACCOUNT_SETTINGS_TAB = (By.CSS_SELECTOR, "[data-testid='account-settings-tab']")
-CURRENT_USERNAME_TEXT = (By.XPATH, "//*[contains(normalize-space(.), 'Current username:')]")
 
 def open_account_page_from_header(driver, base_url):
     """Open My Account via header dropdown."""
     
-    nav_hello = WebDriverWait(driver, 5).until(EC.presence_of_element_located(NAV_HELLO))
-    ActionChains(driver).move_to_element(nav_hello).perform()
-    account_link = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(ACCOUNT_LINK))
-    account_link.click()
-    WebDriverWait(driver, 5).until(EC.url_to_be(f"{base_url}/account"))
+    AccountPage.on(driver).open_from_header(base_url)
 
 def open_account_settings_tab(driver):
     """Open the Account Settings tab on the account page."""
     
-    tab = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(ACCOUNT_SETTINGS_TAB))
-    tab.click()
+    AccountPage.on(driver).open_settings_tab()
 
 def get_current_username(driver):
     """Return the current username text from Account Settings."""
     
-    text = WebDriverWait(driver, 5).until(EC.presence_of_element_located(CURRENT_USERNAME_TEXT))
-    label = text.text.strip()
-    if ":" in label:
-        return label.split(":", 1)[1].strip()
-    raise AssertionError(f"Unexpected username label: {label!r}")
+    return AccountPage.on(driver).current_username()
 
 def get_percentage_from_element(element):
     texts = element.find_elements(By.CSS_SELECTOR, "text")
@@ -43,7 +30,7 @@ def get_percentage_from_element(element):
     raise AssertionError("Percentage label not found in progress chart")
 
 def fetch_words_summary(base_url, cookies):
-    r = requests.get(
+    r = http_client.get(
         f"{base_url}/api/words",
         params={"summary": "true"},
         cookies=cookies,
@@ -53,7 +40,7 @@ def fetch_words_summary(base_url, cookies):
     return r.json()
 
 def fetch_progress_data(base_url, cookies, progress_type):
-    r = requests.get(
+    r = http_client.get(
         f"{base_url}/api/study-progress",
         params={"type": progress_type},
         cookies=cookies,
@@ -62,27 +49,42 @@ def fetch_progress_data(base_url, cookies, progress_type):
     r.raise_for_status()
     return r.json()
 
-def compute_expected_progress(progress, words_summary):
-    totals_by_level = {}
-    for item in words_summary.get("summary", []):
-        totals_by_level[item["level"]] = {"total": item["count"], "completed": 0}
+def fetch_all_progress_data(base_url, cookies, progress_types):
+    """Fetch the progress rows of every type concurrently; returns {type: rows}."""
+
+    with ThreadPoolExecutor(max_workers=max(1, len(progress_types))) as pool:
+        results = pool.map(lambda progress_type: fetch_progress_data(base_url, cookies, progress_type), progress_types)
+        return dict(zip(progress_types, results))
 
-    for item in progress:
-        lvl = item.get("level", "").upper()
-        if lvl not in totals_by_level:
-            totals_by_level[lvl] = {"total": 0, "completed": 0}
-        if item.get("completed"):
-            totals_by_level[lvl]["completed"] += 1
+def compute_expected_progress_all(progress_by_type, words_summary):
+    """Return {type: (overall, [N1..N5 percentages])} for every type.
 
+    Completed rows of all types are counted per (type, level) in one pass with
+    a Counter. The rows come from `fetch_all_progress_data`, which fetches the
+    types in parallel on a ThreadPoolExecutor.
+    """
+    totals_by_level = {item["level"]: item["count"] for item in words_summary.get("summary", [])}
     total_words = words_summary.get("total", 0) or 0
-    completed_words = sum(v["completed"] for v in totals_by_level.values())
-    overall = round((completed_words / total_words) * 100) if total_words > 0 else 0
 
-    levels = []
-    for lvl in LEVELS:
-        stats = totals_by_level.get(lvl, {"total": 0, "completed": 0})
-        if stats["total"]:
-            levels.append(round((stats["completed"] / stats["total"]) * 100))
-        else:
-            levels.append(0)
-    return overall, levels
+    completed = collections.Counter(
+        (progress_type, item.get("level", "").upper())
+        for progress_type, progress in progress_by_type.items()
+        for item in progress
+        if item.get("completed")
+    )
+    completed_by_type = collections.Counter()
+    for (progress_type, _), count in completed.items():
+        completed_by_type[progress_type] += count
+
+    expected = {}
+    for progress_type in progress_by_type:
+        overall = round((completed_by_type[progress_type] / total_words) * 100) if total_words > 0 else 0
+        levels = []
+        for lvl in LEVELS:
+            total = totals_by_level.get(lvl, 0)
+            levels.append(round((completed[(progress_type, lvl)] / total) * 100) if total else 0)
+        expected[progress_type] = (overall, levels)
+    return expected
+
+def compute_expected_progress(progress, words_summary):
+    return compute_expected_progress_all({None: progress}, words_summary)[None]
@@ -0,0 +1,106 @@
+import collections
+import re
+import time
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, UnexpectedAlertPresentException
+from selenium.webdriver.common.by import By
+from tests.pages.study import PROG_BAR, PROG_CNT
+
+SAMPLE_INTERVAL_S = 0.02
+
+_SNAPSHOT_JS = """
+const [wordSelector, buttonSelectors, counterSelector, barSelector] = arguments;
+const word = wordSelector && document.querySelector(wordSelector);
+const counter = document.querySelector(counterSelector);
+const bar = document.querySelector(barSelector);
+const disabled = {};
+for (const selector of buttonSelectors) {
+    const button = document.querySelector(selector);
+    disabled[selector] = button ? button.disabled || button.hasAttribute("disabled") : null;
+}
+return {
+    wordId: word ? word.getAttribute("data-word-id") : null,
+    disabled: disabled,
+    progressText: counter ? counter.innerText : null,
+    progressStyle: bar ? bar.getAttribute("style") : null,
+};
+"""
+
+class DomSnapshot(collections.namedtuple("DomSnapshot", "word_id disabled progress_text progress_style alert")):
+    """What a study page shows at one instant, read in a single `execute_script` round trip.
+
+    `disabled` maps each requested button locator to True/False, or None if
+    the button is not rendered. Missing elements give None elsewhere too. When
+    a JavaScript alert is open, the page cannot be read: `alert` is True and
+    every other field is empty.
+    """
+
+    def is_disabled(self, locator):
+        return self.disabled.get(locator)
+
+    def progress_counts(self):
+        """Return (current, total, text) from the progress counter, e.g. '3 / 10 (30%)'."""
+
+        text = self._require(self.progress_text, "Progress counter").strip()
+        fraction = text.split("(", 1)[0]
+        current_str, total_str = [part.strip() for part in fraction.split("/", 1)]
+        return int(current_str), int(total_str), text
+
+    def progress_bar_percent(self):
+        style = self._require(self.progress_style, "Progress bar")
+        match = re.search(r"width:\s*([0-9.]+)%", style)
+        if not match:
+            raise AssertionError(f"Progress bar width not found in style: {style!r}")
+        return float(match.group(1))
+
+    def _require(self, value, name):
+        if self.alert:
+            raise UnexpectedAlertPresentException(f"{name} cannot be read while an alert is open")
+        if value is None:
+            raise NoSuchElementException(f"{name} not found")
+        return value
+
+def _css(locator):
+    if locator is None:
+        return None
+    by, selector = locator
+    assert by == By.CSS_SELECTOR, f"Snapshots only support CSS locators, got {by!r}"
+    return selector
+
+def take_snapshot(driver, word_locator=None, buttons=()):
+    """Read the word id, the disabled state of `buttons`, the progress counter and the progress bar at once."""
+
+    try:
+        raw = driver.execute_script(
+            _SNAPSHOT_JS, _css(word_locator), [_css(b) for b in buttons], _css(PROG_CNT), _css(PROG_BAR)
+        )
+    except UnexpectedAlertPresentException:
+        return DomSnapshot(None, {}, None, None, alert=True)
+    disabled = {b: raw["disabled"][_css(b)] for b in buttons}
+    return DomSnapshot(raw["wordId"], disabled, raw["progressText"], raw["progressStyle"], alert=False)
+
+def wait_disabled_until_advance(driver, word_locator, old_word_id, button, timeout=3, flicker_s=0.1,
+                                what="Page", re_enabled_message="Button re-enabled before the next word appeared"):
+    """Wait until the word changes, failing if `button` is enabled for longer than `flicker_s` before that.
+
+    Rationale: The old loops issued two or three WebDriver calls per 50 ms
+    sample. One snapshot per sample reads the word id and the button together,
+    so the page can be sampled every `SAMPLE_INTERVAL_S` at a lower cost, and
+    the two values can never come from different renders.
+    """
+    deadline = time.monotonic() + timeout
+    enabled_since = None
+    while time.monotonic() < deadline:
+        snap = take_snapshot(driver, word_locator, [button])
+        if snap.alert:
+            raise UnexpectedAlertPresentException(f"Alert opened before the {what.lower()} advanced")
+        if snap.word_id is not None and snap.word_id != old_word_id:
+            return snap
+        if snap.is_disabled(button) is False:
+            now = time.monotonic()
+            enabled_since = enabled_since or now
+            if now - enabled_since >= flicker_s:
+                raise AssertionError(re_enabled_message)
+        else:
+            enabled_since = None
+        time.sleep(SAMPLE_INTERVAL_S)
+    raise TimeoutException(f"{what} did not advance")
@@ -0,0 +1,190 @@
+import contextlib
+import hashlib
+import json
+import os
+import re
+import shutil
+import stat
+import subprocess
+import tempfile
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+MANIFEST_NAME = "manifest.json"
+LOCK_NAME = ".lock"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "nori-test" / "chromedriver"
+CHROME_BINARIES = (
+    "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+)
+
+_resolved_path = None
+
+def resolve_chromedriver(cache_dir=None, offline=False):
+    """Return the chromedriver binary path, resolving it at most once per session.
+
+    Rationale: `ChromeDriverManager().install()` probes the latest driver
+    version over the network on every call. We resolve once, copy the binary
+    into `cache_dir` next to a manifest (version + sha256), and on later runs
+    load it from there. With `offline=True` the network is never touched and
+    the cache directory must be pre-seeded.
+
+    A cached driver whose major version differs from the installed Chrome
+    (e.g. after a Chrome auto-update) is re-resolved, or rejected with a clear
+    error offline, instead of failing every session with "session not created".
+    """
+    global _resolved_path
+
+    if _resolved_path:
+        return _resolved_path
+
+    cache_dir = Path(cache_dir or os.getenv("CHROMEDRIVER_CACHE_DIR") or DEFAULT_CACHE_DIR)
+    chrome_major = installed_chrome_major()
+    path = load_cached_driver(cache_dir, chrome_major)
+    if path is None:
+        if offline:
+            cached_major = _major(_read_manifest(cache_dir).get("version"))
+            if cached_major and chrome_major and cached_major != chrome_major:
+                raise RuntimeError(
+                    f"Cached chromedriver in {cache_dir} is for Chrome {cached_major} but Chrome {chrome_major} "
+                    f"is installed and offline mode is on; re-seed the cache for Chrome {chrome_major}."
+                )
+            raise RuntimeError(
+                f"No valid chromedriver cached in {cache_dir} and offline mode is on; "
+                f"seed it by running once online or copy a cache directory with {MANIFEST_NAME}."
+            )
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        with cache_lock(cache_dir):
+            # Another xdist worker may have seeded the cache while this one waited for the lock
+            path = load_cached_driver(cache_dir, chrome_major)
+            if path is None:
+                path = _seed(cache_dir, ChromeDriverManager().install())
+
+    _resolved_path = path
+    return path
+
+def load_cached_driver(cache_dir, chrome_major=None):
+    """Return the cached driver path if the manifest exists, the checksum matches and, when
+    `chrome_major` is known, the driver's major version matches it; else None."""
+
+    manifest = _read_manifest(cache_dir)
+    if not manifest:
+        return None
+
+    binary = Path(cache_dir) / manifest.get("path", "")
+    if not binary.is_file() or _sha256(binary) != manifest.get("sha256"):
+        return None
+    if chrome_major and _major(manifest.get("version")) != chrome_major:
+        return None
+    return str(binary)
+
+def installed_chrome_major():
+    """Return the installed Chrome's major version (e.g. '139'), or None if it cannot be determined.
+
+    `CHROME_BINARY` points at a specific browser; otherwise the usual binary
+    names are tried. None disables the version check rather than failing.
+    """
+    candidates = [os.getenv("CHROME_BINARY")] if os.getenv("CHROME_BINARY") else CHROME_BINARIES
+    for binary in candidates:
+        major = _major(_run_version(binary))
+        if major:
+            return major
+    return None
+
+def _read_manifest(cache_dir):
+    manifest_path = Path(cache_dir) / MANIFEST_NAME
+    if not manifest_path.is_file():
+        return {}
+    try:
+        return json.loads(manifest_path.read_text())
+    except ValueError:
+        return {}
+
+def _major(version):
+    match = re.search(r"(\d+)\.\d+", version or "")
+    return match.group(1) if match else None
+
+def _run_version(binary):
+    try:
+        return subprocess.run([str(binary), "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def seed_cache(cache_dir, source_binary):
+    """Copy a resolved driver binary into `cache_dir` and write its manifest; return the cached path.
+
+    Runs under `cache_lock`, and both files are written to temporary names
+    and renamed into place, so concurrent workers never open a binary that
+    another one is executing for writing (ETXTBSY) or read a half-written
+    manifest.
+    """
+    with cache_lock(cache_dir):
+        return _seed(cache_dir, source_binary)
+
+@contextlib.contextmanager
+def cache_lock(cache_dir):
+    """Hold an exclusive lock on `cache_dir` for the duration of the block (blocks until it is free)."""
+
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(cache_dir / LOCK_NAME, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ten seconds; keep waiting like flock does
+                    continue
+        yield  # closing the file releases the lock
+
+def _seed(cache_dir, source_binary):
+    cache_dir = Path(cache_dir)
+    binary = cache_dir / Path(source_binary).name
+
+    def copy_binary(tmp):
+        shutil.copy2(source_binary, tmp)
+        tmp.chmod(tmp.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+    _replace(binary, copy_binary)
+    manifest = {
+        "version": _driver_version(binary),
+        "path": binary.name,
+        "sha256": _sha256(binary),
+    }
+    _replace(cache_dir / MANIFEST_NAME, lambda tmp: tmp.write_text(json.dumps(manifest, indent=2)))
+    return str(binary)
+
+def _replace(target, write):
+    """Have `write` fill a temporary file next to `target`, then rename it over `target` in one step."""
+
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    os.close(fd)
+    tmp = Path(tmp)
+    try:
+        write(tmp)
+        os.replace(tmp, target)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+        raise
+
+def _driver_version(binary):
+    parts = (_run_version(binary) or "").split()
+    return parts[1] if len(parts) > 1 else None
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
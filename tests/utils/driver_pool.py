@@ -0,0 +1,109 @@
+import contextlib
+from urllib.parse import urlsplit
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+class DriverPool:
+    """Keep browsers alive for the whole session and hand them out one test at a time.
+
+    Rationale: Launching Chrome dominates per-test wall-clock time. A pooled
+    browser is reset between tests (cookies, storage, alerts, extra windows)
+    instead of being quit, and is replaced if its session has crashed.
+    """
+
+    def __init__(self, create_driver, base_url=None):
+        self._create_driver = create_driver
+        self._base_url = base_url
+        self._idle = []
+        self._owned = []
+
+    def acquire(self):
+        """Return a healthy idle browser, launching a new one if none is available."""
+
+        while self._idle:
+            driver = self._idle.pop()
+            if is_healthy(driver):
+                return driver
+            self._discard(driver)
+
+        driver = self._create_driver()
+        self._owned.append(driver)
+        return driver
+
+    def release(self, driver):
+        """Reset the browser and return it to the pool; drop it if the reset fails."""
+
+        if not is_healthy(driver):
+            self._discard(driver)
+            return
+        try:
+            reset_driver(driver, self._base_url)
+        except WebDriverException:
+            self._discard(driver)
+            return
+        self._idle.append(driver)
+
+    def close(self):
+        """Quit every browser the pool has launched."""
+
+        for driver in list(self._owned):
+            self._discard(driver)
+        self._idle.clear()
+
+    def _discard(self, driver):
+        with contextlib.suppress(Exception):
+            driver.quit()
+        if driver in self._owned:
+            self._owned.remove(driver)
+
+def is_healthy(driver):
+    """Return True if the browser session still answers WebDriver commands."""
+
+    try:
+        driver.window_handles
+        return True
+    except WebDriverException:
+        return False
+
+def reset_driver(driver, base_url=None):
+    """Bring a used browser back to a clean state: no alerts, one blank tab, no cookies or storage."""
+
+    _dismiss_alerts(driver)
+
+    # Storage of the page currently loaded can be cleared directly.
+    with contextlib.suppress(WebDriverException):
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    with contextlib.suppress(WebDriverException):
+        driver.delete_all_cookies()
+
+    # A fresh tab drops sessionStorage and any window state left by the test.
+    old_handles = driver.window_handles
+    driver.switch_to.new_window("tab")
+    fresh_handle = driver.current_window_handle
+    for handle in old_handles:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(fresh_handle)
+
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        if base_url:
+            parts = urlsplit(base_url)
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": f"{parts.scheme}://{parts.netloc}",
+                "storageTypes": "local_storage,indexeddb,cache_storage,service_workers",
+            })
+    elif base_url:
+        driver.get(base_url)
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.delete_all_cookies()
+
+    driver.implicitly_wait(0)
+
+def _dismiss_alerts(driver, limit=5):
+    for _ in range(limit):
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            return
+        except WebDriverException:
+            return
@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+from tests.utils import http_client
+from tests.utils.polling import poll_until
+
+TOGGLE_WORKERS = 8
+
+def get_favorite_word_ids(base_url, cookies):
+    response = http_client.get(
+        f"{base_url}/api/favorites",
+        cookies=cookies,
+        timeout=5,
+    )
+    response.raise_for_status()
+    return [int(word["id"]) for word in response.json()]
+
+def toggle_favorite(base_url, cookies, word_id):
+    response = http_client.post(
+        f"{base_url}/api/favorites",
+        json={"wordId": word_id},
+        cookies=cookies,
+        timeout=5,
+    )
+    response.raise_for_status()
+
+def set_favorites(base_url, cookies, word_ids, max_workers=TOGGLE_WORKERS):
+    """Make the user's favorites exactly `word_ids` and return them as a set.
+
+    Rationale: `/api/favorites` only toggles one word per POST, so clearing an
+    account with hundreds of stars took hundreds of sequential round trips.
+    The diff against the current set is computed once, the toggles run on up
+    to `max_workers` threads (each touches a different word, so order does not
+    matter), and a single read confirms the result.
+    """
+    target = {int(word_id) for word_id in word_ids}
+    current = set(get_favorite_word_ids(base_url, cookies))
+    to_toggle = sorted(current ^ target)
+    if not to_toggle:
+        return target
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_toggle)))) as pool:
+        list(pool.map(lambda word_id: toggle_favorite(base_url, cookies, word_id), to_toggle))
+
+    actual = set(get_favorite_word_ids(base_url, cookies))
+    assert actual == target, (
+        f"Favorites not in target state: missing={sorted(target - actual)}, extra={sorted(actual - target)}"
+    )
+    return actual
+
+def clear_favorites(base_url, cookies):
+    set_favorites(base_url, cookies, ())
+
+def wait_for_favorite_state(base_url, cookies, word_id, expected, timeout=10):
+    """Wait until the word's favorite state in the DB matches `expected` (e.g. after a UI click); return the ids."""
+
+    ids = poll_until(
+        lambda: get_favorite_word_ids(base_url, cookies),
+        lambda ids: (word_id in ids) == expected,
+        timeout=timeout,
+    )
+    return ids if ids is not None else get_favorite_word_ids(base_url, cookies)
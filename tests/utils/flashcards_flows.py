@@ -1,80 +1,61 @@
 import time
-import requests
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.action_chains import ActionChains
+from tests.utils import http_client
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from tests.utils.auth_flows import get_auth_cookies, login
+from tests.pages.flashcards import O_BTN, VOCAB, FlashcardsPage
+from tests.utils.auth_flows import get_auth_cookies, sign_in
 from tests.utils.db_client import get_study_progress
+from tests.utils.dom_snapshot import wait_disabled_until_advance
+from tests.utils.mutation_wait import wait_for_word_change
+from tests.utils.navigation import open_study_page
+from tests.utils.network_observer import WRITE_WAIT_SHARE, wait_for_progress_write
+from tests.utils.perf_trace import traced
+from tests.utils.polling import poll_until
+from tests.utils import study_state
+from tests.utils.step_timing import step, time_first_render
 
-STUDY_BTN = (By.CSS_SELECTOR, "[data-testid='study-btn']")
-FC_BTN = (By.CSS_SELECTOR, "[data-testid='flashcards-btn']")
-O_BTN = (By.CSS_SELECTOR, "[data-testid='o-btn']")
-X_BTN = (By.CSS_SELECTOR, "[data-testid='x-btn']")
 SUBJECT = "NORI Email Verification"
-VOCAB = (By.CSS_SELECTOR, "[data-testid='vocabulary']")
 
-def _open_flashcards_level(driver, level):
-    """Hover the Study menu and open the requested flashcards level with retries."""
+def _open_flashcards_level(driver, base_url, level):
+    """Open the flashcards page for the level by its route."""
     
-    study_btn = WebDriverWait(driver, 5).until(
-        EC.presence_of_element_located(STUDY_BTN),
-        "Study button is not found"
-    )
-    
-    flashcards_btn = None
-    for attempt in range(3):
-        ActionChains(driver).move_to_element(study_btn).pause(0.2).perform()
-        try:
-            flashcards_btn = WebDriverWait(driver, 2).until(
-                EC.element_to_be_clickable(FC_BTN),
-                "Flashcards button is not clickable"
-            )
-            flashcards_btn.click()
-            break
-        except TimeoutException as exc:
-            if attempt == 2:
-                raise TimeoutException("Flashcards button is not clickable after retries") from exc
-    
-    if flashcards_btn is None:
-        raise TimeoutException("Flashcards button was never located")
-    
-    level_btn = WebDriverWait(driver, 5).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, f"[data-testid='level-btn-{level.lower()}']")),
-        f"{level.upper()} button is not clickable"
-    )
-    level_btn.click()
+    open_study_page(driver, base_url, "flashcards", level)
+    time_first_render(driver, VOCAB)
 
 def login_and_open_flashcards_page(driver, base_url, email, password, level):
     """Log in and navigate to the flashcards page for the given level."""
     
-    login(driver, base_url, email, password)
+    sign_in(driver, base_url, email, password)
     WebDriverWait(driver, 5).until(
         EC.url_to_be(f"{base_url}/"),
         "Did not navigate to main page"
     )
 
-    _open_flashcards_level(driver, level)
+    study_state.mark_dirty(email, password, "flashcards", level, driver)
+    _open_flashcards_level(driver, base_url, level)
     
 def login_and_open_flashcards_page_with_level_reset(driver, base_url, email, password, level):
     """Log in, reset flashcard progress for the level, and open the flashcards page."""
     
-    login(driver, base_url, email, password)
+    sign_in(driver, base_url, email, password)
     
     WebDriverWait(driver, 5).until(
         EC.url_to_be(f"{base_url}/"),
         "Did not navigate to main page"
     )
     
-    reset_flashcards_level_progress(driver, base_url, level)
+    if not study_state.ensure_clean(email, password, "flashcards", level, driver):
+        reset_flashcards_level_progress(driver, base_url, level)
+    study_state.mark_dirty(email, password, "flashcards", level, driver)
     
-    _open_flashcards_level(driver, level)
+    _open_flashcards_level(driver, base_url, level)
     
+@step("reset")
 def reset_flashcards_level_progress(driver, base_url, level):
     
     cookies = get_auth_cookies(driver)
-    r = requests.post(
+    r = http_client.post(
         f"{base_url}/api/study-progress/reset",
         params={"type": "flashcards", "level": level},
         cookies=cookies,
@@ -91,62 +72,53 @@ def wait_for_transform_change(driver, element, old_val, timeout=1.0, poll_interv
     )
 
 def wait_stays_disabled_until_advance(driver, old_word_id, btn_locator, timeout=3):
-    """Wait until flashcard advances, asserting button stays disabled until that point."""
-    
-    start = time.time()
-    while time.time() - start < timeout:
-        current_id = driver.find_element(*VOCAB).get_attribute("data-word-id")
-        is_disabled = driver.find_element(*btn_locator).get_attribute("disabled") is not None
-        if current_id != old_word_id:
-            return  # advanced successfully
-        if not is_disabled:
-            try:
-                WebDriverWait(driver, 0.3).until(
-                    lambda d: d.find_element(*btn_locator).get_attribute("disabled") is not None
-                )
-                continue
-            except TimeoutException:
-                raise AssertionError("Button re-enabled before next flashcard appeared")
-        time.sleep(0.05)
-    raise TimeoutException("Flashcard did not advance")
+    """Wait until flashcard advances, asserting button stays disabled until that point (re-enabling for under 0.3 s is tolerated)."""
+    
+    wait_disabled_until_advance(
+        driver, VOCAB, old_word_id, btn_locator, timeout, flicker_s=0.3,
+        what="Flashcard", re_enabled_message="Button re-enabled before next flashcard appeared",
+    )
+
+def wait_for_completion_state(base_url, word_id, cookies, expected: bool, level: str, timeout=5, driver=None):
+    """Poll study progress until the word's completed flag matches expected; return record or None.
 
-def wait_for_completion_state(base_url, word_id, cookies, expected: bool, level: str, timeout=5):
-    """Poll study progress until the word's completed flag matches expected; return record or None."""
+    With `driver` and --network-observer, the browser's own write is awaited
+    for up to `WRITE_WAIT_SHARE` of the timeout and then confirmed with one
+    read; polling gets whatever time is left.
+    """
     
-    end_time = time.time() + timeout
-    while time.time() < end_time:
-        progress = get_study_progress(base_url, cookies, "flashcards", level, word_id)
+    def read_progress():
+        return get_study_progress(base_url, cookies, "flashcards", level, word_id)
+
+    deadline = time.monotonic() + timeout
+    if wait_for_progress_write(driver, "flashcards", level, word_id, timeout * WRITE_WAIT_SHARE):
+        # The write finished; read back what the backend stored once before falling back to polling
+        progress = read_progress()
         if progress.get("completed") == expected:
             return progress
-        time.sleep(0.5)
-    return None
+    return poll_until(
+        read_progress,
+        lambda progress: progress.get("completed") == expected,
+        timeout=max(deadline - time.monotonic(), 0),
+    )
 
 
 def wait_for_flashcard_advance(driver, old_word_id, timeout=5):
     """Wait for the flashcard to advance by checking that the word ID has changed."""
     
-    def word_id_changed(driver):
-        vocab = driver.find_element(*VOCAB)
-        return vocab.get_attribute("data-word-id") != old_word_id
-    WebDriverWait(driver, timeout).until(
-        word_id_changed,
-        "Flashcard did not advance"
-    )
+    return wait_for_word_change(driver, VOCAB, old_word_id, timeout, "Flashcard did not advance")
 
+@step("enter review mode")
+@traced("review-mode entry")
 def enter_review_mode(driver, num_of_completed, num_of_incomplete):
     """Complete the requested mix of cards so the session enters review mode. (Available in TEST set only)"""
     
+    page = FlashcardsPage.on(driver)
     for _ in range(num_of_completed):
-        o_btn = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(O_BTN))
-        vocab = WebDriverWait(driver, 5).until(EC.presence_of_element_located(VOCAB))
-        current_word_id = vocab.get_attribute("data-word-id")
-        o_btn.click()
+        current_word_id = page.mark(correct=True)
         wait_for_flashcard_advance(driver, current_word_id)
     for _ in range(num_of_incomplete):
-        x_btn = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(X_BTN))
-        vocab = WebDriverWait(driver, 5).until(EC.presence_of_element_located(VOCAB))
-        current_word_id = vocab.get_attribute("data-word-id")
-        x_btn.click()
+        current_word_id = page.mark(correct=False)
         try:
             alert = WebDriverWait(driver, 1).until(EC.alert_is_present())
             alert.accept()
@@ -158,10 +130,10 @@ def enter_review_mode(driver, num_of_completed, num_of_incomplete):
 def mark_all_flashcards_O_and_accept_alert(driver):
     """Mark all flashcards as correct (O) until completion alert appears, then accept it."""
     
+    page = FlashcardsPage.on(driver)
     modal_msg = None
     while True:
-        o_btn = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(O_BTN))
-        o_btn.click()
+        page.click(O_BTN)
         
         try:
             alert = WebDriverWait(driver, 1).until(EC.alert_is_present())
@@ -176,15 +148,10 @@ def mark_all_flashcards_O_and_accept_alert(driver):
 def study_flashcards(driver, num_of_completed, num_of_incomplete):
     """Study flashcards by marking the specified number as completed (O) and incomplete (X)."""
     
+    page = FlashcardsPage.on(driver)
     for _ in range(num_of_completed):
-        o_btn = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(O_BTN))
-        vocab = WebDriverWait(driver, 5).until(EC.presence_of_element_located(VOCAB))
-        current_word_id = vocab.get_attribute("data-word-id")
-        o_btn.click()
+        current_word_id = page.mark(correct=True)
         wait_for_flashcard_advance(driver, current_word_id)
     for _ in range(num_of_incomplete):
-        x_btn = WebDriverWait(driver, 5).until(EC.element_to_be_clickable(X_BTN))
-        vocab = WebDriverWait(driver, 5).until(EC.presence_of_element_located(VOCAB))
-        current_word_id = vocab.get_attribute("data-word-id")
-        x_btn.click()
+        current_word_id = page.mark(correct=False)
         wait_for_flashcard_advance(driver, current_word_id)
@@ -0,0 +1,106 @@
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tests.utils.perf_stats import percentile
+
+POOL_SIZE = int(os.getenv("NORI_HTTP_POOL_SIZE", "10"))
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.2
+RETRY_STATUSES = (502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+_latencies = defaultdict(list)
+_stats_lock = threading.Lock()
+
+def get_session():
+    """Return the process-wide keep-alive session shared by all API helpers.
+
+    Rationale: Bare `requests.get` opens a new TCP connection per call, which
+    adds up across thousands of progress polls. The shared session keeps up to
+    POOL_SIZE connections per host alive and retries idempotent calls (GET,
+    PUT, DELETE, ...) with exponential backoff on connection errors and 5xx
+    gateway responses. Cookies set by responses are never stored, so every
+    call stays authenticated only by the cookies it passes explicitly.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = new_session()
+        return _session
+
+def new_session(pool_size=POOL_SIZE, max_retries=MAX_RETRIES, store_cookies=False):
+    """Build a session configured like the shared one (used directly by load-test virtual users)."""
+
+    session = requests.Session()
+    if not store_cookies:
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def request(method, url, **kwargs):
+    """Send a request through the shared session and record its latency."""
+
+    start = time.perf_counter()
+    try:
+        return get_session().request(method, url, **kwargs)
+    finally:
+        record_latency(method, url, time.perf_counter() - start)
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
+
+def delete(url, **kwargs):
+    return request("DELETE", url, **kwargs)
+
+def record_latency(method, url, seconds):
+    with _stats_lock:
+        _latencies[endpoint_key(method, url)].append(seconds)
+
+def endpoint_key(method, url):
+    """Group calls by method and path, with numeric ids collapsed (GET /api/words/{id})."""
+
+    path = re.sub(r"/\d+(?=/|$)", "/{id}", urlsplit(url).path)
+    return f"{method.upper()} {path}"
+
+def latency_summary():
+    """Return {endpoint: {count, total_s, mean_ms, p50_ms, p95_ms, max_ms}} for all calls so far."""
+
+    with _stats_lock:
+        snapshot = {key: list(values) for key, values in _latencies.items()}
+
+    summary = {}
+    for key, values in snapshot.items():
+        summary[key] = {
+            "count": len(values),
+            "total_s": round(sum(values), 3),
+            "mean_ms": round(sum(values) / len(values) * 1000, 1),
+            "p50_ms": round(percentile(values, 50) * 1000, 1),
+            "p95_ms": round(percentile(values, 95) * 1000, 1),
+            "max_ms": round(max(values) * 1000, 1),
+        }
+    return summary
+
+def reset_latency_stats():
+    with _stats_lock:
+        _latencies.clear()
@@ -0,0 +1,225 @@
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+from dotenv import load_dotenv
+from tests.utils import http_client
+from tests.utils.auth_flows import LOGIN_API_PATH
+from tests.utils.perf_stats import summarize
+
+# Assumed to be the route the study pages write to after an O/X answer (not confirmed against
+# the production backend); override if it differs
+PROGRESS_API_PATH = os.getenv("NORI_PROGRESS_API_PATH", "/api/study-progress")
+STUDY_TYPES = ("flashcards", "quiz-kanji-to-furigana", "quiz-furigana-to-kanji", "fill")
+
+class LoadStats:
+    """Thread-safe per-operation latencies and error counts for one load run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latencies = defaultdict(list)
+        self._errors = defaultdict(int)
+        self._error_samples = []
+        self.started = None
+        self.finished = None
+
+    def record(self, op, seconds, error=None):
+        with self._lock:
+            self._latencies[op].append(seconds * 1000)
+            if error is not None:
+                self._errors[op] += 1
+                if len(self._error_samples) < 20:
+                    self._error_samples.append(f"{op}: {error}")
+
+    def summary(self):
+        """Return throughput, error rate and latency percentiles (ms) per operation and overall."""
+
+        with self._lock:
+            latencies = {op: list(values) for op, values in self._latencies.items()}
+            errors = dict(self._errors)
+            samples = list(self._error_samples)
+
+        elapsed = max((self.finished or time.monotonic()) - (self.started or time.monotonic()), 1e-9)
+        operations = {}
+        for op, values in latencies.items():
+            operations[op] = {
+                "requests": len(values),
+                "errors": errors.get(op, 0),
+                "error_rate": round(errors.get(op, 0) / len(values), 4),
+                "throughput_rps": round(len(values) / elapsed, 2),
+                "latency_ms": summarize(values),
+            }
+
+        total_requests = sum(len(values) for values in latencies.values())
+        total_errors = sum(errors.values())
+        return {
+            "duration_s": round(elapsed, 1),
+            "requests": total_requests,
+            "errors": total_errors,
+            "error_rate": round(total_errors / total_requests, 4) if total_requests else 0.0,
+            "throughput_rps": round(total_requests / elapsed, 2),
+            "operations": operations,
+            "error_samples": samples,
+        }
+
+class VirtualUser(threading.Thread):
+    """One simulated learner replaying the study flows' API traffic until `stop` is set.
+
+    Each cycle mirrors a browser session of `study_flashcards` / `solve_quizzes`
+    / `answer_problems`: fetch the level's words, mark `cards_per_cycle` of them
+    (mostly correct), read progress back, then reset the level like the
+    `*_with_level_reset` helpers do before the next cycle.
+    """
+
+    def __init__(self, index, base_url, account, stats, level="TEST", study_type="flashcards",
+                 cards_per_cycle=5, think_time_s=0.5):
+        super().__init__(name=f"vu-{index}", daemon=True)
+        self.base_url = base_url
+        self.email, self.password = account
+        self.stats = stats
+        self.stop = threading.Event()
+        self.level = level
+        self.study_type = study_type
+        self.cards_per_cycle = cards_per_cycle
+        self.think_time_s = think_time_s
+        self.session = http_client.new_session(pool_size=2, max_retries=0, store_cookies=True)
+        self.cycles = 0
+
+    def run(self):
+        if not self._call("login", "POST", LOGIN_API_PATH, json={"email": self.email, "password": self.password}):
+            return
+        while not self.stop.is_set():
+            self.cycle()
+            self.cycles += 1
+
+    def cycle(self):
+        r = self._call("fetch words", "GET", "/api/words", params={"level": self.level})
+        if r is None:
+            self._think()
+            return
+        payload = r.json()
+        words = payload.get("words", []) if isinstance(payload, dict) else payload
+        word_ids = [w["id"] for w in words if isinstance(w, dict) and "id" in w]
+
+        for word_id in random.sample(word_ids, min(self.cards_per_cycle, len(word_ids))):
+            if self.stop.is_set():
+                return
+            self._think()
+            self._call("mark progress", "POST", PROGRESS_API_PATH, json={
+                "wordId": word_id,
+                "type": self.study_type,
+                "level": self.level,
+                "completed": random.random() < 0.8,
+            })
+
+        self._call("read progress", "GET", "/api/study-progress", params={"type": self.study_type, "level": self.level})
+        self._call("reset", "POST", "/api/study-progress/reset", params={"type": self.study_type, "level": self.level})
+
+    def _call(self, op, method, path, **kwargs):
+        start = time.perf_counter()
+        try:
+            r = self.session.request(method, f"{self.base_url}{path}", timeout=10, **kwargs)
+        except Exception as exc:
+            self.stats.record(op, time.perf_counter() - start, error=type(exc).__name__)
+            return None
+        error = f"HTTP {r.status_code}" if r.status_code >= 400 else None
+        self.stats.record(op, time.perf_counter() - start, error=error)
+        return r if error is None else None
+
+    def _think(self):
+        if self.think_time_s:
+            self.stop.wait(random.uniform(0.5, 1.5) * self.think_time_s)
+
+def parse_stages(spec):
+    """Parse a ramp schedule like '10:30,50:60' into [(target_users, ramp_seconds), ...]."""
+
+    stages = []
+    for part in spec.split(","):
+        users, _, seconds = part.strip().partition(":")
+        stages.append((int(users), float(seconds or 0)))
+    return stages
+
+def load_accounts():
+    """Accounts for virtual users from LOAD_ACCOUNTS='a@x.com:pw,b@y.com:pw'; empty when unset.
+
+    There is deliberately no fallback to the admin account: every cycle resets
+    the account's progress, which would break functional tests sharing it.
+    """
+    spec = os.getenv("LOAD_ACCOUNTS", "")
+    return [tuple(item.strip().split(":", 1)) for item in spec.split(",") if item.strip()]
+
+def run_load(base_url, accounts, stages, hold_s=30, **user_kwargs):
+    """Ramp virtual users through `stages`, hold the last stage for `hold_s`, then stop them all.
+
+    Within each stage users start (or, when the target is below the current
+    count, stop) evenly spaced over its ramp seconds, so '20:30,5:30' ramps up
+    and back down. Virtual users are assigned accounts round-robin. Returns
+    the `LoadStats.summary()` with the peak user count and completed cycles.
+    """
+    if not accounts:
+        raise ValueError("No load accounts; set LOAD_ACCOUNTS='email:password,...'")
+
+    stats = LoadStats()
+    active, started = [], []
+    stats.started = time.monotonic()
+
+    try:
+        for target, ramp_s in stages:
+            delta = target - len(active)
+            interval = ramp_s / abs(delta) if delta else ramp_s
+            for _ in range(abs(delta)):
+                if delta > 0:
+                    user = VirtualUser(len(started), base_url, accounts[len(started) % len(accounts)], stats, **user_kwargs)
+                    user.start()
+                    active.append(user)
+                    started.append(user)
+                else:
+                    active.pop().stop.set()
+                time.sleep(interval)
+            if not delta:
+                time.sleep(ramp_s)
+        time.sleep(hold_s)
+    finally:
+        for user in started:
+            user.stop.set()
+        for user in started:
+            user.join(timeout=15)
+        stats.finished = time.monotonic()
+
+    summary = stats.summary()
+    summary["peak_users"] = max((target for target, _ in stages), default=0)
+    summary["cycles"] = sum(user.cycles for user in started)
+    return summary
+
+def main(argv=None):
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Replay NORI study traffic with concurrent virtual users.")
+    parser.add_argument("--base-url", default=os.getenv("NORI_BASE_URL"))
+    parser.add_argument("--stages", default="10:30", help="Ramp schedule target_users:ramp_seconds,... (default 10:30)")
+    parser.add_argument("--hold", type=float, default=60, help="Seconds to hold the last stage")
+    parser.add_argument("--level", default="TEST")
+    parser.add_argument("--type", dest="study_type", default="flashcards", choices=STUDY_TYPES)
+    parser.add_argument("--cards-per-cycle", type=int, default=5)
+    parser.add_argument("--think-time", type=float, default=0.5, help="Mean seconds between answers")
+    parser.add_argument("--report", help="Write the JSON summary to this file as well")
+    args = parser.parse_args(argv)
+    accounts = load_accounts()
+    if not accounts:
+        parser.error("set LOAD_ACCOUNTS='email:password,...' to dedicated load-test accounts")
+
+    summary = run_load(
+        args.base_url, accounts, parse_stages(args.stages), args.hold,
+        level=args.level, study_type=args.study_type,
+        cards_per_cycle=args.cards_per_cycle, think_time_s=args.think_time,
+    )
+    output = json.dumps(summary, indent=2)
+    print(output)
+    if args.report:
+        with open(args.report, "w") as f:
+            f.write(output)
+
+if __name__ == "__main__":
+    main()
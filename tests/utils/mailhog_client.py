@@ -1,5 +1,10 @@
+import collections
 import datetime
+import os
+import threading
 import time, re, requests, base64
+from tests.utils import http_client
+from tests.utils.mailhog_stream import active_feed
 
 # Prefer dateutil for robust ISO8601 parsing; fallback to stdlib if unavailable
 try:
@@ -7,7 +12,20 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     _isoparse = None
 
-MAILHOG_API = "http://localhost:8025/api/v2"
+MAILHOG_API = os.getenv("MAILHOG_API", "http://localhost:8025/api/v2")
+
+CREATED_CACHE_SIZE = 512
+
+# Parsed Created times by message ID, least recently used first
+_created_cache = collections.OrderedDict()
+_created_cache_lock = threading.Lock()
+
+def set_mailhog_api(api_base):
+    """Point the helpers at another MailHog API base, e.g. the in-process stand-in."""
+    global MAILHOG_API
+    MAILHOG_API = api_base.rstrip("/")
+    with _created_cache_lock:
+        _created_cache.clear()
 
 def wait_for_email(
     to_addr: str,
@@ -17,50 +35,86 @@ def wait_for_email(
     since: datetime.datetime | None = None,
 ) -> dict | None:
     """
-    Poll MailHog for the most recent message TO `to_addr` containing `subject`.
+    Wait for the most recent message TO `to_addr` containing `subject`.
     If `since` is provided (UTC datetime), only return messages created after that.
+    With the live feed running (see mailhog_stream), the message is returned as
+    soon as MailHog stores it; otherwise the search endpoint is polled every `poll_s`.
     """
     deadline = time.time() + timeout_s
 
-    while time.time() < deadline:
-        # Query by recipient
-        try:
-            resp = requests.get(
-                f"{MAILHOG_API}/search",
-                params={"kind": "to", "query": to_addr},
-                timeout=5,
-            )
-        except requests.RequestException:
-            time.sleep(poll_s)
-            continue
-
-        if resp.status_code != 200:
-            time.sleep(poll_s)
-            continue
-
-        data = resp.json()
-        messages = data.get("items") or data.get("messages") or []
-
-        for msg in messages:
-            created_str = msg.get("Created") or msg.get("created")
-            created_dt = (
-                _parse_iso_to_utc(created_str)
-                if created_str
-                else datetime.datetime.now(datetime.timezone.utc)
-            )
-
-            if since and created_dt < since:
-                continue
-
-            hdrs = msg.get("Content", {}).get("Headers", {})
-            subj_val = hdrs.get("Subject", [""])[0]
-            if subject in subj_val:
-                return msg
+    def match(msg):
+        return _matches(msg, to_addr, subject, since)
+
+    feed = active_feed()
+    if feed is not None:
+        # The feed only sees messages stored after it connected
+        msg = _search_once(to_addr, match)
+        if msg:
+            return msg
+        msg = feed.wait_for(match, deadline - time.time())
+        if msg:
+            return msg
+        # Feed dropped mid-wait: keep searching for the rest of the timeout
 
+    while time.time() < deadline:
+        msg = _search_once(to_addr, match)
+        if msg:
+            return msg
         time.sleep(poll_s)
 
     return None
 
+def _search_once(to_addr, match):
+    """Query MailHog by recipient and return the first message satisfying `match`, or None."""
+    try:
+        resp = http_client.get(
+            f"{MAILHOG_API}/search",
+            params={"kind": "to", "query": to_addr},
+            timeout=5,
+        )
+    except requests.RequestException:
+        return None
+
+    if resp.status_code != 200:
+        return None
+
+    data = resp.json()
+    messages = data.get("items") or data.get("messages") or []
+    return next((msg for msg in messages if match(msg)), None)
+
+def _matches(msg, to_addr, subject, since):
+    if since and _message_created(msg) < since:
+        return False
+
+    hdrs = msg.get("Content", {}).get("Headers", {})
+    recipients = " ".join(hdrs.get("To", []))
+    recipients += " " + " ".join(f"{r.get('Mailbox')}@{r.get('Domain')}" for r in msg.get("To") or [])
+    if to_addr.lower() not in recipients.lower():
+        return False
+
+    subj_val = hdrs.get("Subject", [""])[0]
+    return subject in subj_val
+
+def _message_created(msg) -> datetime.datetime:
+    """Return the message's Created time in UTC, parsed once per message ID (last CREATED_CACHE_SIZE kept)."""
+    msg_id = msg.get("ID")
+    with _created_cache_lock:
+        if msg_id in _created_cache:
+            _created_cache.move_to_end(msg_id)
+            return _created_cache[msg_id]
+
+    created_str = msg.get("Created") or msg.get("created")
+    if not created_str:
+        return datetime.datetime.now(datetime.timezone.utc)
+
+    created_dt = _parse_iso_to_utc(created_str)
+    if msg_id:
+        with _created_cache_lock:
+            _created_cache[msg_id] = created_dt
+            if len(_created_cache) > CREATED_CACHE_SIZE:
+                _created_cache.popitem(last=False)
+    return created_dt
+
 def _parse_iso_to_utc(s: str) -> datetime.datetime:
     if _isoparse:
         dt = _isoparse(s)
@@ -105,4 +159,4 @@ def find_verify_link(body: str) -> str | None:
     return match.group(1) if match else None
 
 def clear_inbox():
-    requests.delete(f"{MAILHOG_API}/messages")
\ No newline at end of file
+    http_client.delete(f"{MAILHOG_API}/messages")
\ No newline at end of file
@@ -0,0 +1,144 @@
+import collections
+import json
+import threading
+import time
+
+FEED_BUFFER_SIZE = 500
+CONNECT_TIMEOUT_S = 3
+
+_feed = None
+
+class MailFeed:
+    """Messages pushed by MailHog's live websocket, with blocking waiters.
+
+    Rationale: Polling `/api/v2/search` once per second loses up to a second
+    per email. MailHog broadcasts every stored message on
+    `/api/v2/websocket`; a background thread appends each one to a bounded
+    buffer and wakes all waiters, which re-check the buffer for their
+    recipient and subject. Messages stored before the feed connected are not
+    replayed, so callers still run one search before waiting.
+
+    Without `ws_url` the feed is in-process: it counts as connected once
+    started and only receives what is handed to `publish` (the local MailHog
+    stand-in does that for every message it stores).
+    """
+
+    def __init__(self, ws_url=None):
+        self.ws_url = ws_url
+        self._messages = collections.deque(maxlen=FEED_BUFFER_SIZE)
+        self._cond = threading.Condition()
+        self._connected = threading.Event()
+        self._app = None
+        self._thread = None
+
+    @property
+    def connected(self):
+        return self._connected.is_set()
+
+    def start(self, timeout=CONNECT_TIMEOUT_S):
+        """Connect in a background thread; return True once the websocket is open."""
+
+        if self.ws_url is None:
+            self._connected.set()
+            return True
+
+        import websocket
+
+        self._app = websocket.WebSocketApp(
+            self.ws_url,
+            on_open=lambda ws: self._connected.set(),
+            on_message=lambda ws, raw: self._on_raw(raw),
+            on_close=lambda ws, *args: self._on_disconnect(),
+            on_error=lambda ws, err: self._on_disconnect(),
+        )
+        self._thread = threading.Thread(
+            target=self._app.run_forever,
+            kwargs={"ping_interval": 30, "reconnect": 1},
+            name="mailhog-feed",
+            daemon=True,
+        )
+        self._thread.start()
+        return self._connected.wait(timeout)
+
+    def stop(self):
+        if self._app is not None:
+            self._app.close()
+        self._on_disconnect()
+
+    def publish(self, msg):
+        """Add a message to the feed and wake every waiter."""
+
+        with self._cond:
+            self._messages.append(msg)
+            self._cond.notify_all()
+
+    def wait_for(self, match, timeout):
+        """Block until a buffered or newly delivered message satisfies `match`; return it or None.
+
+        Returns early with None if the feed disconnects, so the caller can fall
+        back to searching for the remaining time.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                for msg in reversed(self._messages):
+                    if match(msg):
+                        return msg
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.connected:
+                    return None
+                self._cond.wait(remaining)
+
+    def _on_raw(self, raw):
+        try:
+            msg = json.loads(raw)
+        except ValueError:
+            return
+        if isinstance(msg, dict):
+            self.publish(msg)
+
+    def _on_disconnect(self):
+        self._connected.clear()
+        with self._cond:
+            self._cond.notify_all()
+
+def start_mail_feed(api_base):
+    """Subscribe to MailHog's live feed for `api_base` (e.g. http://localhost:8025/api/v2).
+
+    Returns the feed, or None when websocket-client is missing or MailHog
+    cannot be reached; `wait_for_email` then keeps polling the search endpoint.
+    """
+    global _feed
+
+    ws_url = api_base.replace("https://", "wss://").replace("http://", "ws://").rstrip("/") + "/websocket"
+    feed = MailFeed(ws_url)
+    try:
+        if not feed.start():
+            feed.stop()
+            return None
+    except ImportError:
+        return None
+    _feed = feed
+    return feed
+
+def start_local_feed():
+    """Install an in-process feed, to be filled through `publish`, as the active feed."""
+
+    global _feed
+
+    feed = MailFeed()
+    feed.start()
+    _feed = feed
+    return feed
+
+def stop_mail_feed():
+    global _feed
+
+    if _feed is not None:
+        _feed.stop()
+        _feed = None
+
+def active_feed():
+    """Return the running feed if it is currently connected, else None."""
+
+    return _feed if _feed is not None and _feed.connected else None
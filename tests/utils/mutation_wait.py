@@ -0,0 +1,98 @@
+import collections
+from selenium.common.exceptions import (
+    JavascriptException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from tests.utils.perf_trace import trace_phase
+from tests.utils.step_timing import record_step
+
+FALLBACK_POLL_S = 0.05
+
+_OBSERVE_JS = """
+const [selector, attribute, oldValue, timeoutMs, done] = arguments;
+const start = performance.now();
+const read = () => {
+    const el = document.querySelector(selector);
+    if (!el) return null;
+    return attribute ? el.getAttribute(attribute) : el.textContent;
+};
+let settled = false, timer = null, observer = null;
+const finish = (changed) => {
+    if (settled) return;
+    settled = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    const now = performance.now();
+    done({changed: changed, value: read(), at: performance.timeOrigin + now, elapsed: now - start});
+};
+const check = () => {
+    const value = read();
+    if (value !== null && value !== oldValue) finish(true);
+};
+observer = new MutationObserver(check);
+observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+timer = setTimeout(() => finish(false), timeoutMs);
+check();
+"""
+
+Change = collections.namedtuple("Change", "value changed_at_ms elapsed_ms")
+
+def wait_for_change(driver, locator, old_value, attribute=None, timeout=5, message=None):
+    """Block until the element's `attribute` (or its text) differs from `old_value`; return a Change.
+
+    Rationale: WebDriverWait polls every 0.5 s by default, so every advance
+    waited up to half a second longer than the UI took, and the measured time
+    was only as precise as the poll. A MutationObserver installed with
+    `execute_async_script` resolves on the first DOM mutation that produces
+    the new value. `changed_at_ms` is the page's epoch timestamp of that
+    mutation, and `elapsed_ms` is the time since the observer was installed.
+
+    If the script cannot run (non-CSS locator, or the page navigated away
+    mid-wait), it falls back to polling every `FALLBACK_POLL_S`.
+    """
+    by, selector = locator
+    message = message or f"Element {selector} did not change"
+    if by == By.CSS_SELECTOR:
+        _ensure_script_timeout(driver, timeout)
+        try:
+            result = driver.execute_async_script(_OBSERVE_JS, selector, attribute, old_value, int(timeout * 1000))
+        except JavascriptException:
+            result = None
+        if result is not None:
+            if not result["changed"]:
+                raise TimeoutException(message)
+            return Change(result["value"], result["at"], result["elapsed"])
+
+    def changed(d):
+        try:
+            element = d.find_element(*locator)
+            value = element.get_attribute(attribute) if attribute else element.text
+        except (NoSuchElementException, StaleElementReferenceException):
+            return False
+        return value if value != old_value else False
+
+    value = WebDriverWait(driver, timeout, FALLBACK_POLL_S).until(changed, message)
+    return Change(value, None, None)
+
+def wait_for_word_change(driver, word_locator, old_word_id, timeout=5, message=None, step_name="advance"):
+    """Wait until the page shows a word other than `old_word_id`; record the in-page latency as a step."""
+
+    with trace_phase(driver, "card advance"):
+        change = wait_for_change(driver, word_locator, old_word_id, "data-word-id", timeout, message)
+    if change.elapsed_ms is not None:
+        record_step(step_name, change.elapsed_ms / 1000)
+    return change
+
+def _ensure_script_timeout(driver, timeout):
+    """Make sure the driver's async script timeout outlasts the observer's own timeout."""
+
+    try:
+        current = driver.timeouts.script
+    except (AttributeError, TypeError):
+        return
+    if current is not None and current < timeout + 1:
+        driver.set_script_timeout(timeout + 1)
@@ -0,0 +1,103 @@
+import warnings
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from tests.utils.perf_trace import trace_phase
+from tests.utils.step_timing import step
+
+JLPT_LEVELS = ("N5", "N4", "N3", "N2", "N1")
+TEST_LEVEL = "TEST"
+# Route segment per section. These routes are assumed, not read from the app's router: they are the URLs the
+# Study menu ends on (TC-LEVEL-003 checks that for N5) and that the tests already `driver.get`. Whether the app
+# renders them when loaded directly is not guaranteed, so `open_study_page` falls back to the menu.
+STUDY_SECTIONS = {"flashcards": "flashcards", "quiz": "quiz", "fill": "fill-in-the-blank"}
+DEEP_LINK_TIMEOUT_S = 5
+
+STUDY_BTN = (By.CSS_SELECTOR, "[data-testid='study-btn']")
+LEVEL_BTNS = (By.CSS_SELECTOR, "[data-testid^='level-btn-']")
+
+_menu_only = set()   # sections whose deep links did not render this session
+
+def level_segment(level):
+    """Return the route segment for a level: 'n2' for JLPT levels, 'TEST' for the test set, anything else as given."""
+
+    if level.upper() in JLPT_LEVELS:
+        return level.lower()
+    if level.upper() == TEST_LEVEL:
+        return TEST_LEVEL
+    return level
+
+def study_path(section, level=None, quiz_type=None):
+    """Return the route of a study page, e.g. study_path("quiz", "N2", "kanji-to-furigana") -> '/study/quiz/n2/kanji-to-furigana'.
+
+    `section` is 'flashcards', 'quiz' or 'fill'. Without a level this is the
+    level selection page; a quiz level without a type is the type selection page.
+    """
+    path = f"/study/{STUDY_SECTIONS[section]}"
+    if level is not None:
+        path += f"/{level_segment(level)}"
+    if quiz_type is not None:
+        path += f"/{quiz_type.lower()}"
+    return path
+
+def open_study_page(driver, base_url, section, level=None, quiz_type=None):
+    """Load a study page by its route instead of walking the Study menu (covered by TC-LEVEL-003).
+
+    If the page's root element does not appear within `DEEP_LINK_TIMEOUT_S`,
+    warns once per section, walks the Study menu instead and keeps using the
+    menu for that section for the rest of the session.
+    """
+    root = _root_locator(section, level, quiz_type)
+    with step("navigate"), trace_phase(driver, "level selection"):
+        if section not in _menu_only:
+            path = study_path(section, level, quiz_type)
+            driver.get(f"{base_url}{path}")
+            try:
+                WebDriverWait(driver, DEEP_LINK_TIMEOUT_S).until(EC.presence_of_element_located(root))
+                return
+            except TimeoutException:
+                warnings.warn(f"Deep link {path} did not render the {section} page; walking the Study menu instead")
+                _menu_only.add(section)
+        _walk_study_menu(driver, base_url, section, level, quiz_type)
+        WebDriverWait(driver, 5).until(
+            EC.presence_of_element_located(root),
+            f"The Study menu did not open the {section} page either"
+        )
+
+def _root_locator(section, level, quiz_type):
+    """The element that shows the requested page has rendered."""
+
+    from tests.pages.fill import FILL_BOX
+    from tests.pages.flashcards import VOCAB
+    from tests.pages.quiz import K_TO_F_BTN, QUIZ
+
+    if level is None:
+        return LEVEL_BTNS
+    if section == "quiz":
+        return QUIZ if quiz_type is not None else K_TO_F_BTN
+    return {"flashcards": VOCAB, "fill": FILL_BOX}[section]
+
+def _walk_study_menu(driver, base_url, section, level, quiz_type):
+    """Home page -> Study menu -> section -> level -> quiz type, the path TC-LEVEL-003 takes."""
+
+    driver.get(f"{base_url}/")
+    study_btn = WebDriverWait(driver, 5).until(EC.presence_of_element_located(STUDY_BTN), "Study button is not found")
+    menu_item = (By.CSS_SELECTOR, f"[data-testid='{section}-btn']")
+    for attempt in range(3):
+        # The menu opens on hover and can close again before the click lands
+        ActionChains(driver).move_to_element(study_btn).pause(0.2).perform()
+        try:
+            WebDriverWait(driver, 2).until(EC.element_to_be_clickable(menu_item), f"{section} menu item is not clickable").click()
+            break
+        except TimeoutException:
+            if attempt == 2:
+                raise
+    if level is None:
+        return
+    level_btn = (By.CSS_SELECTOR, f"[data-testid='level-btn-{level_segment(level)}']")
+    WebDriverWait(driver, 5).until(EC.element_to_be_clickable(level_btn), f"{level} button is not clickable").click()
+    if quiz_type is not None:
+        type_btn = (By.CSS_SELECTOR, f"[data-testid='{quiz_type.lower()}-btn']")
+        WebDriverWait(driver, 5).until(EC.element_to_be_clickable(type_btn), f"{quiz_type} button is not clickable").click()
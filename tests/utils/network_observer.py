@@ -0,0 +1,194 @@
+import collections
+import json
+import os
+import time
+import weakref
+from selenium.common.exceptions import WebDriverException
+from tests.utils.step_timing import record_step
+
+PROGRESS_PATH = os.getenv("NORI_PROGRESS_API_PATH", "/api/study-progress")
+POLL_INTERVAL_S = 0.05
+# Share of a completion wait spent on the browser's write; polling keeps the rest so a missed write still gets real retries
+WRITE_WAIT_SHARE = 0.5
+
+_enabled = False
+_observers = weakref.WeakKeyDictionary()
+
+Exchange = collections.namedtuple("Exchange", "method url request_json status response_json latency_ms")
+
+def enable_network_observer(enabled=True):
+    """Wait on the browser's own progress writes instead of polling the API (see `wait_for_progress_write`)."""
+
+    global _enabled
+    _enabled = bool(enabled)
+
+def network_observer_enabled():
+    return _enabled
+
+def add_performance_logging(options):
+    """Ask chromedriver to keep DevTools Network events in the `performance` log."""
+
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+class NetworkObserver:
+    """Finished browser requests to `path`, read from Chrome's `performance` log.
+
+    The log is drained on every read, so there is one observer per driver (see
+    `observer_for`), and other readers of the log hand their entries to `feed`.
+    Requests are kept by DevTools request id until `Network.loadingFinished`
+    (or `loadingFailed`) arrives; only then does the exchange become visible
+    to `wait_for`.
+    """
+
+    def __init__(self, driver, path=PROGRESS_PATH):
+        self.driver = driver
+        self.path = path
+        self._pending = {}
+        self._finished = []
+        self.trace_entries = []
+
+    def clear(self):
+        """Forget everything seen so far, e.g. when a pooled browser moves on to the next test."""
+
+        self._drain()
+        self._pending.clear()
+        self._finished.clear()
+        self.trace_entries.clear()
+
+    def wait_for(self, match, timeout=5):
+        """Return the first unclaimed finished Exchange for which `match(exchange)` is true, or None on timeout.
+
+        A returned exchange is claimed, so the same write never satisfies two waits.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            self._drain()
+            for i, exchange in enumerate(self._finished):
+                if match(exchange):
+                    return self._finished.pop(i)
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(POLL_INTERVAL_S)
+
+    def feed(self, entries):
+        """Process `performance` log entries that someone else drained (e.g. the trace recorder).
+
+        Trace events are kept in `trace_entries` for the trace recorder to collect.
+        """
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            if message["method"] == "Tracing.dataCollected":
+                self.trace_entries.append(entry)
+                continue
+            handler = getattr(self, "_on_" + message["method"].replace(".", "_"), None)
+            if handler:
+                handler(message["params"])
+
+    def _drain(self):
+        try:
+            self.feed(self.driver.get_log("performance"))
+        except WebDriverException:
+            return
+
+    def _on_Network_requestWillBeSent(self, params):
+        request = params["request"]
+        if self.path not in request["url"]:
+            return
+        self._pending[params["requestId"]] = {
+            "method": request["method"],
+            "url": request["url"],
+            "post_data": request.get("postData"),
+            "has_post_data": request.get("hasPostData", False),
+            "sent_at": params["timestamp"],
+            "status": None,
+        }
+
+    def _on_Network_responseReceived(self, params):
+        pending = self._pending.get(params["requestId"])
+        if pending is not None:
+            pending["status"] = params["response"]["status"]
+
+    def _on_Network_loadingFinished(self, params):
+        pending = self._pending.pop(params["requestId"], None)
+        if pending is None:
+            return
+        post_data = pending["post_data"]
+        if post_data is None and pending["has_post_data"]:
+            post_data = self._cdp("Network.getRequestPostData", params["requestId"], "postData")
+        body = self._cdp("Network.getResponseBody", params["requestId"], "body")
+        self._finished.append(Exchange(
+            pending["method"],
+            pending["url"],
+            _json_or_none(post_data),
+            pending["status"],
+            _json_or_none(body),
+            (params["timestamp"] - pending["sent_at"]) * 1000,
+        ))
+
+    def _on_Network_loadingFailed(self, params):
+        self._pending.pop(params["requestId"], None)
+
+    def _cdp(self, command, request_id, key):
+        """Fetch a request or response body; None once Chrome has evicted it."""
+
+        try:
+            return self.driver.execute_cdp_cmd(command, {"requestId": request_id}).get(key)
+        except WebDriverException:
+            return None
+
+def _json_or_none(text):
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+def observer_for(driver):
+    """The driver's NetworkObserver, created on first use."""
+
+    observer = _observers.get(driver)
+    if observer is None:
+        observer = _observers[driver] = NetworkObserver(driver)
+    return observer
+
+def reset_observer(driver):
+    """Drop network events left over from a previous test on this driver; no-op when disabled."""
+
+    if _enabled:
+        observer_for(driver).clear()
+
+def wait_for_progress_write(driver, type, level, word_id, timeout=5):
+    """Wait for the page's own `POST` to `PROGRESS_PATH` for `word_id` to finish with a 2xx status.
+
+    Rationale: Polling `GET /api/study-progress` after every answer added
+    several API calls per click and only learned about the write on the next
+    poll. The browser already sends the write, so its completion is the
+    moment to read the stored state once. The write is only a wake-up signal:
+    the request body is what the page sent, not what the backend persisted,
+    so callers still confirm with a GET. The request's duration is recorded
+    as the "progress write" step.
+
+    Returns the Exchange, or None when no successful write finished within
+    `timeout` or the observer is disabled; callers then poll for the rest of
+    their timeout.
+    """
+    if not _enabled or driver is None:
+        return None
+
+    def matches(exchange):
+        payload = exchange.request_json or {}
+        return (
+            exchange.method == "POST"
+            and str(payload.get("wordId")) == str(word_id)
+            and str(payload.get("type", type)).lower() == type.lower()
+            and str(payload.get("level", level)).lower() == str(level).lower()
+        )
+
+    exchange = observer_for(driver).wait_for(matches, timeout)
+    if exchange is None:
+        return None
+    ok = exchange.status is not None and 200 <= exchange.status < 300
+    record_step("progress write", exchange.latency_ms / 1000, ok)
+    return exchange if ok else None
@@ -0,0 +1,38 @@
+from selenium.webdriver.support.ui import WebDriverWait
+
+METRICS = ("ttfb", "dom_content_loaded", "load", "first_paint", "first_contentful_paint")
+
+# All values are milliseconds since the navigation started
+PAGE_TIMING_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+if (!nav || nav.loadEventEnd <= 0) { return null; }
+const paint = {};
+for (const entry of performance.getEntriesByType('paint')) { paint[entry.name] = entry.startTime; }
+return {
+    ttfb: nav.responseStart - nav.startTime,
+    dom_content_loaded: nav.domContentLoadedEventEnd - nav.startTime,
+    load: nav.loadEventEnd - nav.startTime,
+    first_paint: paint['first-paint'] ?? null,
+    first_contentful_paint: paint['first-contentful-paint'] ?? null,
+};
+"""
+
+def collect_page_timing(driver, timeout=15):
+    """Return Navigation and Paint Timing for the current document once its load event has finished."""
+
+    return WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script(PAGE_TIMING_JS),
+        "Navigation timing was not available before the load event finished"
+    )
+
+def measure_page_load(driver, url, runs):
+    """Load `url` `runs` times and return {metric: [ms, ...]}; metrics the browser did not report are skipped."""
+
+    samples = {metric: [] for metric in METRICS}
+    for _ in range(runs):
+        driver.get(url)
+        timing = collect_page_timing(driver)
+        for metric in METRICS:
+            if timing.get(metric) is not None:
+                samples[metric].append(timing[metric])
+    return samples
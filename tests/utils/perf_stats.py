@@ -0,0 +1,24 @@
+import math
+
+def percentile(values, p):
+    """Return the p-th percentile (0-100) of `values` with linear interpolation between ranks."""
+
+    if not values:
+        raise ValueError("percentile() of empty data")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+def summarize(values, digits=1):
+    """Return count/min/mean/p50/p95/p99/max for a list of samples."""
+
+    return {
+        "count": len(values),
+        "min": round(min(values), digits),
+        "mean": round(sum(values) / len(values), digits),
+        "p50": round(percentile(values, 50), digits),
+        "p95": round(percentile(values, 95), digits),
+        "p99": round(percentile(values, 99), digits),
+        "max": round(max(values), digits),
+    }
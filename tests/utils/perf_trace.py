@@ -0,0 +1,170 @@
+import contextlib
+import functools
+import json
+import re
+import time
+import weakref
+from pathlib import Path
+from selenium.common.exceptions import WebDriverException
+from tests.utils import network_observer
+from tests.utils.step_timing import current_test
+
+TRACE_CATEGORIES = "devtools.timeline,disabled-by-default-devtools.timeline,v8.execute,blink.user_timing,loading"
+
+# Trace event names counted in each summary bucket (complete "X" events, durations in µs)
+SCRIPTING_EVENTS = {
+    "EvaluateScript", "FunctionCall", "TimerFire", "EventDispatch", "FireAnimationFrame",
+    "RunMicrotasks", "v8.compile", "V8.Execute", "XHRReadyStateChange", "XHRLoad",
+}
+RENDERING_EVENTS = {
+    "UpdateLayoutTree", "Layout", "RecalculateStyles", "PrePaint", "Paint", "Layerize",
+    "UpdateLayer", "UpdateLayerTree", "CompositeLayers", "HitTest",
+}
+
+_trace_dir = None
+_active = weakref.WeakSet()
+_phase_counts = {}
+
+def enable_tracing(trace_dir):
+    """Write a Chrome trace per marked phase under `trace_dir`; None turns tracing off."""
+
+    global _trace_dir
+    _trace_dir = Path(trace_dir) if trace_dir else None
+
+def tracing_enabled():
+    return _trace_dir is not None
+
+def add_trace_logging(options):
+    """Ask chromedriver to record DevTools trace events into the `performance` log."""
+
+    network_observer.add_performance_logging(options)
+    options.add_experimental_option("perfLoggingPrefs", {"traceCategories": TRACE_CATEGORIES})
+    return options
+
+@contextlib.contextmanager
+def trace_phase(driver, phase):
+    """Save a Chrome performance trace of the wrapped block as `<trace dir>/<tcid>/<phase>-<n>.json`.
+
+    Rationale: A slow transition used to leave nothing but a failed
+    `WebDriverWait`. chromedriver keeps tracing for the whole session and
+    hands over the events collected so far whenever the `performance` log is
+    read, so draining the log before and after the block yields the trace of
+    the block alone. The file loads in the DevTools Performance panel and
+    carries a scripting / rendering / network summary under `metadata`.
+
+    The trace is written even if the block fails. Phases nested in a traced
+    phase are part of the outer trace. No-op when tracing is off.
+    """
+    if _trace_dir is None or driver in _active or not hasattr(driver, "execute_cdp_cmd"):
+        yield
+        return
+
+    _active.add(driver)
+    _drain(driver)
+    start = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        wall_ms = (time.perf_counter() - start) * 1000
+        _active.discard(driver)
+        events = _drain(driver)
+        _write_trace(phase, events, summarize(events, wall_ms, ok))
+
+def traced(phase):
+    """Decorator form of `trace_phase` for flow helpers whose first argument is the driver."""
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(driver, *args, **kwargs):
+            with trace_phase(driver, phase):
+                return func(driver, *args, **kwargs)
+        return wrapper
+    return decorate
+
+def _drain(driver):
+    """Read the performance log; return its trace events and pass Network events on to the network observer."""
+
+    observer = network_observer.observer_for(driver) if network_observer.network_observer_enabled() else None
+    entries = []
+    if observer is not None:
+        # Trace events the observer read while waiting on a progress write
+        entries, observer.trace_entries = observer.trace_entries, []
+    try:
+        entries += driver.get_log("performance")
+    except WebDriverException:
+        pass
+    events, others = [], []
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        if message["method"] != "Tracing.dataCollected":
+            others.append(entry)
+            continue
+        params = message["params"]
+        events.extend(params["value"] if "value" in params else [params])
+    if observer is not None:
+        observer.feed(others)
+    return events
+
+def summarize(events, wall_ms=None, ok=True):
+    """Scripting, rendering and network time of a trace, in milliseconds.
+
+    Nested events are not counted twice: each bucket is the union of its
+    events' time ranges per thread. Network time is the union of the time
+    from each request being sent to its last byte arriving.
+    """
+    scripting, rendering, requests = {}, {}, {}
+    for event in events:
+        name = event.get("name")
+        if event.get("ph") == "X" and "dur" in event:
+            span = (event["ts"], event["ts"] + event["dur"])
+            thread = (event.get("pid"), event.get("tid"))
+            if name in SCRIPTING_EVENTS:
+                scripting.setdefault(thread, []).append(span)
+            elif name in RENDERING_EVENTS:
+                rendering.setdefault(thread, []).append(span)
+        elif name in ("ResourceSendRequest", "ResourceFinish"):
+            request_id = event.get("args", {}).get("data", {}).get("requestId")
+            if request_id:
+                requests.setdefault(request_id, {})[name] = event["ts"]
+
+    network = [(r["ResourceSendRequest"], r["ResourceFinish"]) for r in requests.values() if len(r) == 2]
+    return {
+        "ok": ok,
+        "wall_ms": round(wall_ms, 1) if wall_ms is not None else None,
+        "scripting_ms": round(sum(_union_us(spans) for spans in scripting.values()) / 1000, 1),
+        "rendering_ms": round(sum(_union_us(spans) for spans in rendering.values()) / 1000, 1),
+        "network_ms": round(_union_us(network) / 1000, 1),
+        "requests": len(requests),
+        "events": len(events),
+    }
+
+def _union_us(spans):
+    total, end = 0, None
+    for span_start, span_end in sorted(spans):
+        if end is None or span_start > end:
+            total += span_end - span_start
+            end = span_end
+        elif span_end > end:
+            total += span_end - end
+            end = span_end
+    return total
+
+def _slug(text):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "-", text).strip("-") or "unnamed"
+
+def _write_trace(phase, events, summary):
+    nodeid, tcid = current_test()
+    test_dir = _trace_dir / _slug(tcid or nodeid or "session")
+    key = (test_dir, phase)
+    _phase_counts[key] = _phase_counts.get(key, 0) + 1
+    name = f"{_slug(phase)}-{_phase_counts[key]}"
+
+    test_dir.mkdir(parents=True, exist_ok=True)
+    metadata = {"phase": phase, "nodeid": nodeid, "tcid": tcid, "summary": summary}
+    (test_dir / f"{name}.json").write_text(json.dumps({"traceEvents": events, "metadata": metadata}))
+
+    # One line per phase so the summaries of a test can be compared without opening the traces
+    with open(test_dir / "summary.jsonl", "a", encoding="utf-8") as f:
+        f.write(json.dumps({"trace": f"{name}.json", **metadata}) + "\n")
@@ -0,0 +1,77 @@
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+
+INITIAL_INTERVAL = 0.05
+BACKOFF_FACTOR = 2.0
+MAX_INTERVAL = 0.5
+JITTER = 0.2
+
+_metrics = defaultdict(list)
+_metrics_lock = threading.Lock()
+
+def poll_until(fn, predicate=bool, timeout=5, initial=INITIAL_INTERVAL, factor=BACKOFF_FACTOR,
+               max_interval=MAX_INTERVAL, jitter=JITTER, name=None):
+    """Call `fn()` until `predicate(result)` holds; return that result, or None on timeout.
+
+    Rationale: A fixed 0.5 s sleep wastes up to half a second per assertion when
+    the backend is already consistent. Polling starts after `initial` seconds
+    and backs off by `factor` up to `max_interval`, with +/- `jitter` so
+    parallel workers do not poll in lockstep. Sleeps never overrun the deadline,
+    and the last attempt happens at the deadline itself. Attempt counts and time
+    to success are recorded per call site (`name`, default: the calling function).
+    """
+    name = name or _call_site()
+    start = time.monotonic()
+    deadline = start + timeout
+    interval = initial
+    attempts = 0
+
+    while True:
+        attempts += 1
+        result = fn()
+        if predicate(result):
+            _record(name, attempts, time.monotonic() - start, True)
+            return result
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            _record(name, attempts, time.monotonic() - start, False)
+            return None
+
+        time.sleep(min(interval * random.uniform(1 - jitter, 1 + jitter), remaining))
+        interval = min(interval * factor, max_interval)
+
+def polling_summary():
+    """Return {call_site: {calls, timeouts, mean_attempts, max_attempts, mean_ms, max_ms}}."""
+
+    with _metrics_lock:
+        snapshot = {name: list(samples) for name, samples in _metrics.items()}
+
+    summary = {}
+    for name, samples in snapshot.items():
+        succeeded = [elapsed for _, elapsed, ok in samples if ok]
+        summary[name] = {
+            "calls": len(samples),
+            "timeouts": len(samples) - len(succeeded),
+            "mean_attempts": round(sum(a for a, _, _ in samples) / len(samples), 1),
+            "max_attempts": max(a for a, _, _ in samples),
+            "mean_ms": round(sum(succeeded) / len(succeeded) * 1000, 1) if succeeded else None,
+            "max_ms": round(max(succeeded) * 1000, 1) if succeeded else None,
+        }
+    return summary
+
+def reset_polling_stats():
+    with _metrics_lock:
+        _metrics.clear()
+
+def _record(name, attempts, elapsed, ok):
+    with _metrics_lock:
+        _metrics[name].append((attempts, elapsed, ok))
+
+def _call_site():
+    frame = sys._getframe(2)
+    module = frame.f_globals.get("__name__", "?").rsplit(".", 1)[-1]
+    return f"{module}.{frame.f_code.co_name}"
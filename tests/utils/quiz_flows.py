@@ -1,131 +1,78 @@
 import time
-import requests
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.action_chains import ActionChains
+from tests.utils import http_client
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from tests.utils.auth_flows import get_auth_cookies, login
-from tests.utils.db_client import get_study_progress, get_word_from_word_id
+from tests.pages.quiz import QUIZ, QuizPage
+from tests.utils.auth_flows import get_auth_cookies, sign_in
+from tests.utils.db_client import get_study_progress
+from tests.utils.dom_snapshot import wait_disabled_until_advance
+from tests.utils.mutation_wait import wait_for_word_change
+from tests.utils.navigation import open_study_page
+from tests.utils.network_observer import WRITE_WAIT_SHARE, wait_for_progress_write
+from tests.utils.perf_trace import traced
+from tests.utils.polling import poll_until
+from tests.utils import study_state
+from tests.utils.step_timing import step, time_first_render
+from tests.utils.word_catalog import answer_for_current_word
 
-STUDY_BTN = (By.CSS_SELECTOR, "[data-testid='study-btn']")
-QZ_BTN = (By.CSS_SELECTOR, "[data-testid='quiz-btn']")
-QUIZ = (By.CSS_SELECTOR, "[data-testid='question-box']")
-PROG_CNT = (By.CSS_SELECTOR, "[data-testid='progress-counter']")
+
+def _open_quiz_level(driver, base_url, level, type=None):
+    """Open the quiz page for the level and type by its route, or the type selection page without a type."""
+    
+    open_study_page(driver, base_url, "quiz", level, type)
+    if type is not None:
+        time_first_render(driver, QUIZ)
 
 def login_and_open_quiz_page(driver, base_url, email, password, level, type):
     """Log in and open the quiz page."""
     
-    login(driver, base_url, email, password)
+    sign_in(driver, base_url, email, password)
     WebDriverWait(driver, 5).until(
         EC.url_to_be(f"{base_url}/"),
         "Did not navigate to main page"
     )
 
-    study_btn = WebDriverWait(driver, 5).until(
-        EC.presence_of_element_located(STUDY_BTN),
-        "Study button is not found"
-    )
-    ActionChains(driver).move_to_element(study_btn).perform()
-    quiz_btn = WebDriverWait(driver, 5).until(
-        EC.element_to_be_clickable(QZ_BTN),
-        "Quiz button is not clickable"
-    )
-    quiz_btn.click()
-    level_btn = WebDriverWait(driver, 5).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, f"[data-testid='level-btn-{level.lower()}']")),
-        f"{level.upper()} button is not clickable"
-    )
-    level_btn.click()
-    
-    type_btn = WebDriverWait(driver, 5).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, f"[data-testid='{type.lower()}-btn']")),
-        f"{level.upper()} button is not clickable"
-    )
-    type_btn.click()
+    study_state.mark_dirty(email, password, f"quiz-{type}", level, driver)
+    _open_quiz_level(driver, base_url, level, type)
     
 def login_and_open_quiz_page_with_level_reset(driver, base_url, email, password, level, type):
     """Log in, reset quiz progress for the given level/type, and open the quiz page."""
     
-    login(driver, base_url, email, password)
+    sign_in(driver, base_url, email, password)
     WebDriverWait(driver, 5).until(
         EC.url_to_be(f"{base_url}/"),
         "Did not navigate to main page"
     )
     
-    # Reset progress
-    cookies = get_auth_cookies(driver)
-    reset_url = f"{base_url}/api/study-progress/reset"
-    r = requests.post(
-        reset_url,
-        params={"type": f"quiz-{type}", "level": level},
-        cookies=cookies,
-        timeout=5,
-    )
-    r.raise_for_status()
-
-    study_btn = WebDriverWait(driver, 5).until(
-        EC.presence_of_element_located(STUDY_BTN),
-        "Study button is not found"
-    )
-    ActionChains(driver).move_to_element(study_btn).perform()
-    quiz_btn = WebDriverWait(driver, 5).until(
-        EC.element_to_be_clickable(QZ_BTN),
-        "Quiz button is not clickable"
-    )
-    quiz_btn.click()
-    level_btn = WebDriverWait(driver, 5).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, f"[data-testid='level-btn-{level.lower()}']")),
-        f"{level.upper()} button is not clickable"
-    )
-    level_btn.click()
+    if not study_state.ensure_clean(email, password, f"quiz-{type}", level, driver):
+        reset_quiz_level_progress(driver, base_url, level, type)
+    study_state.mark_dirty(email, password, f"quiz-{type}", level, driver)
     
-    type_btn = WebDriverWait(driver, 5).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, f"[data-testid='{type.lower()}-btn']")),
-        f"{level.upper()} button is not clickable"
-    )
-    type_btn.click()
+    _open_quiz_level(driver, base_url, level, type)
     
 def login_and_open_quiz_type_selection_page(driver, base_url, email, password, level):
     
     
-    login(driver, base_url, email, password)
+    sign_in(driver, base_url, email, password)
     WebDriverWait(driver, 5).until(EC.url_to_be(f"{base_url}/"))
     
-    study_btn = WebDriverWait(driver, 5).until(
-        EC.presence_of_element_located(STUDY_BTN),
-        "Study button is not found"
-    )
-    ActionChains(driver).move_to_element(study_btn).perform()
-    quiz_btn = WebDriverWait(driver, 5).until(
-        EC.element_to_be_clickable(QZ_BTN),
-        "Quiz button is not clickable"
-    )
-    quiz_btn.click()
-    level_btn = WebDriverWait(driver, 5).until(
-        EC.element_to_be_clickable((By.CSS_SELECTOR, f"[data-testid='level-btn-{level.lower()}']")),
-        f"{level.upper()} button is not clickable"
-    )
-    level_btn.click()
+    _open_quiz_level(driver, base_url, level)
     
 def get_correct_quiz_answer_element(driver, base_url, type):
     """Get the correct quiz answer element."""
     
+    page = QuizPage.on(driver)
     for _ in range(3):
-        question_element = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located(QUIZ)
-        )
-        word_id = question_element.get_attribute("data-word-id")
-        word = get_word_from_word_id(base_url, word_id)
-        correct_ans = word["furigana"] if type == "kanji-to-furigana" else word["kanji"]
+        word_id = page.word_id()
+        field = "furigana" if type == "kanji-to-furigana" else "kanji"
+        correct_ans = answer_for_current_word(driver, base_url, word_id, field)
 
-        buttons = WebDriverWait(driver, 5).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "[data-testid^='answer-']"))
-        )
+        buttons = page.answer_buttons()
         if any(not b.text.strip() for b in buttons):
             time.sleep(0.2)
             continue
-        if question_element.get_attribute("data-word-id") != word_id:
+        if page.word_id() != word_id:
             time.sleep(0.2)
             continue
 
@@ -146,78 +93,66 @@ def click_correct_quiz_answer(driver, base_url, type):
 def click_incorrect_quiz_answer(driver, base_url, type):
     """Click an incorrect quiz answer (one that does not match the expected value)."""
     
-    question_element = WebDriverWait(driver, 5).until(
-        EC.presence_of_element_located(QUIZ)
-    )
-    word_id = question_element.get_attribute("data-word-id")
-    word = get_word_from_word_id(base_url, word_id)
-    correct_ans = word['furigana'] if type == "kanji-to-furigana" else word['kanji']    
+    page = QuizPage.on(driver)
+    word_id = page.word_id()
+    field = "furigana" if type == "kanji-to-furigana" else "kanji"
+    correct_ans = answer_for_current_word(driver, base_url, word_id, field)
     
-    buttons = WebDriverWait(driver, 5).until(
-        EC.presence_of_all_elements_located((By.CSS_SELECTOR, "[data-testid^='answer-']"))
-    )
-    for b in buttons:
-        if b.text[3:] != correct_ans:
+    for b in page.answer_buttons():
+        if b.text[3:].strip() != correct_ans:
             b.click()
             return b
     raise AssertionError("Incorrect answer not found among quiz options")
     
-def wait_for_completion_state(base_url, word_id, cookies, expected, level, type, timeout=5):
-    """Poll the study progress API until the word's completion state matches the expected value."""
+def wait_for_completion_state(base_url, word_id, cookies, expected, level, type, timeout=5, driver=None):
+    """Poll the study progress API until the word's completion state matches the expected value.
+
+    With `driver` and --network-observer, the browser's own write is awaited
+    for up to `WRITE_WAIT_SHARE` of the timeout and then confirmed with one
+    read; polling gets whatever time is left.
+    """
     
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        progress = get_study_progress(base_url, cookies, f"quiz-{type}", level, word_id)
+    def read_progress():
+        return get_study_progress(base_url, cookies, f"quiz-{type}", level, word_id)
+
+    deadline = time.monotonic() + timeout
+    if wait_for_progress_write(driver, f"quiz-{type}", level, word_id, timeout * WRITE_WAIT_SHARE):
+        # The write finished; read back what the backend stored once before falling back to polling
+        progress = read_progress()
         if progress.get("completed") == expected:
             return progress
-        time.sleep(0.5)
-    return None
+    return poll_until(
+        read_progress,
+        lambda progress: progress.get("completed") == expected,
+        timeout=max(deadline - time.monotonic(), 0),
+    )
 
 def wait_stays_disabled_until_advance(driver, old_word_id, btn_locator, timeout=3):
     """Wait until quiz advances, asserting button stays disabled until that point."""
     
-    start = time.time()
-    while time.time() - start < timeout:
-        current_id = driver.find_element(*QUIZ).get_attribute("data-word-id")
-        is_disabled = driver.find_element(*btn_locator).get_attribute("disabled") is not None
-        if current_id != old_word_id:
-            return  # advanced successfully
-        # tolerate short flickers (<100ms)
-        if not is_disabled:
-            time.sleep(0.1)
-            # re-check after brief delay in case it's transient
-            if driver.find_element(*btn_locator).get_attribute("disabled") is None:
-                raise AssertionError("Button re-enabled before next quiz appeared")
-        time.sleep(0.05)
-    raise TimeoutException("Quiz did not advance")
+    # tolerate short flickers (<100ms)
+    wait_disabled_until_advance(
+        driver, QUIZ, old_word_id, btn_locator, timeout, flicker_s=0.1,
+        what="Quiz", re_enabled_message="Button re-enabled before next quiz appeared",
+    )
 
 def wait_for_quiz_advance(driver, old_word_id, timeout=5):
     """Wait for the quiz to advance by checking that the word ID has changed."""
     
-    def word_id_changed(driver):
-        quiz = driver.find_element(*QUIZ)
-        return quiz.get_attribute("data-word-id") != old_word_id
-    WebDriverWait(driver, timeout).until(
-        word_id_changed,
-        "Quiz did not advance"
-    )
+    return wait_for_word_change(driver, QUIZ, old_word_id, timeout, "Quiz did not advance")
 
+@step("enter review mode")
+@traced("review-mode entry")
 def enter_review_mode(driver, base_url, type, num_of_correct, num_of_incorrect):
     """Complete the requested mix of quizzes so the session enters review mode."""
     
     alert_poll_seconds = 1
     for _ in range(num_of_correct):
-        question = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located(QUIZ)
-        )
-        current_word_id = question.get_attribute("data-word-id")
+        current_word_id = QuizPage.on(driver).word_id()
         click_correct_quiz_answer(driver, base_url, type)
         wait_for_quiz_advance(driver, current_word_id)
     for _ in range(num_of_incorrect):
-        question = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located(QUIZ)
-        )
-        current_word_id = question.get_attribute("data-word-id")
+        current_word_id = QuizPage.on(driver).word_id()
         click_incorrect_quiz_answer(driver, base_url, type)
         try:
             alert = WebDriverWait(driver, alert_poll_seconds).until(EC.alert_is_present())
@@ -232,17 +167,11 @@ def dismiss_review_mode_modal(driver, base_url, type, num_of_correct, num_of_inc
     
     alert_poll_seconds = 1
     for _ in range(num_of_correct):
-        question = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located(QUIZ)
-        )
-        current_word_id = question.get_attribute("data-word-id")
+        current_word_id = QuizPage.on(driver).word_id()
         click_correct_quiz_answer(driver, base_url, type)
         wait_for_quiz_advance(driver, current_word_id)
     for _ in range(num_of_incorrect):
-        question = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located(QUIZ)
-        )
-        current_word_id = question.get_attribute("data-word-id")
+        current_word_id = QuizPage.on(driver).word_id()
         click_incorrect_quiz_answer(driver, base_url, type)
         try:
             alert = WebDriverWait(driver, alert_poll_seconds).until(EC.alert_is_present())
@@ -257,10 +186,7 @@ def answer_all_quizzes_correctly_and_accept_alert(driver, base_url, type):
     
     modal_msg = None
     while True:
-        question = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located(QUIZ)
-        )
-        current_word_id = question.get_attribute("data-word-id")
+        current_word_id = QuizPage.on(driver).word_id()
         click_correct_quiz_answer(driver, base_url, type)
         
         try:
@@ -276,24 +202,19 @@ def answer_all_quizzes_correctly_and_accept_alert(driver, base_url, type):
 def solve_quizzes(driver, base_url, num_of_correct, num_of_incorrect):
     
     for _ in range(num_of_correct):
-        question = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located(QUIZ)
-        )
-        current_word_id = question.get_attribute("data-word-id")
+        current_word_id = QuizPage.on(driver).word_id()
         click_correct_quiz_answer(driver, base_url, type)
         wait_for_quiz_advance(driver, current_word_id)
     for _ in range(num_of_incorrect):
-        question = WebDriverWait(driver, 5).until(
-            EC.presence_of_element_located(QUIZ)
-        )
-        current_word_id = question.get_attribute("data-word-id")
+        current_word_id = QuizPage.on(driver).word_id()
         click_incorrect_quiz_answer(driver, base_url, type)
         wait_for_quiz_advance(driver, current_word_id)
 
+@step("reset")
 def reset_quiz_level_progress(driver, base_url, level, type):
     
     cookies = get_auth_cookies(driver)
-    r = requests.post(
+    r = http_client.post(
         f"{base_url}/api/study-progress/reset",
         params={"type": f"quiz-{type}", "level": level},
         cookies=cookies,
@@ -0,0 +1,74 @@
+import collections
+import pytest
+
+FEATURE_MARKERS = ("flashcards", "quiz", "fill", "dashboard")
+
+StateFootprint = collections.namedtuple("StateFootprint", "account study_type level fresh_account")
+
+def state_footprint(item):
+    """Return the backend state a test works in: account, study type, level, and whether it signs up a fresh account.
+
+    Declared with `@pytest.mark.state(account=..., study_type=..., level=..., fresh_account=...)`
+    (closer marks override fields of module-level ones); anything not declared
+    comes from the test's fixtures, parameters and feature marker. Unknown
+    fields are None.
+    """
+    fixtures = getattr(item, "fixturenames", ())
+    params = getattr(getattr(item, "callspec", None), "params", {})
+
+    declared = {}
+    for marker in reversed(list(item.iter_markers("state"))):
+        declared.update(marker.kwargs)
+
+    study_type = next((name for name in FEATURE_MARKERS if item.get_closest_marker(name)), None)
+    quiz_type = params.get("type") or params.get("quiz_type")
+    if study_type == "quiz" and quiz_type:
+        study_type = f"quiz-{quiz_type}"
+    level = params.get("level")
+
+    footprint = StateFootprint(
+        account="admin" if "admin_email" in fixtures else None,
+        study_type=study_type,
+        level=level.upper() if isinstance(level, str) else level,
+        # test1_email is a new plus-address per test, signed up by the test itself
+        fresh_account="test1_email" in fixtures,
+    )._replace(**declared)
+    if isinstance(footprint.level, str):
+        footprint = footprint._replace(level=footprint.level.upper())
+    return footprint
+
+def shares_progress(footprint):
+    """True when the footprint names one progress scope: an existing account, a study type (quiz per quiz type) and a level."""
+
+    if footprint.fresh_account or None in footprint[:3]:
+        return False
+    return footprint.study_type in ("flashcards", "fill") or footprint.study_type.startswith("quiz-")
+
+def group_name(footprint):
+    if footprint.fresh_account:
+        return "fresh-account"
+    return ":".join(str(part) for part in footprint[:3] if part is not None) or "stateless"
+
+def group_by_state(items, xdist_groups=False):
+    """Reorder `items` in place so tests sharing a footprint run back to back.
+
+    Rationale: File order alternates between flashcards n2, quiz n2, fill n2
+    and so on, so the level's words, the login token and the browser's HTTP
+    cache go cold between neighbours. Groups keep the position of their first
+    test and tests keep their file order within a group; every test still
+    logs in and resets for itself, so tests stay independent. With
+    `xdist_groups`, only groups that write one progress scope (see
+    `shares_progress`) are marked `xdist_group`, so `--dist loadgroup` keeps
+    each on one worker, where the study-state tracker knows whether the scope
+    is clean. Coarser groups (e.g. every admin test without a study page) are
+    left free to spread over workers.
+    """
+    groups = {}
+    for item in items:
+        footprint = state_footprint(item)
+        name = group_name(footprint)
+        groups.setdefault(name, []).append(item)
+        if xdist_groups and shares_progress(footprint):
+            item.add_marker(pytest.mark.xdist_group(name))
+    items[:] = [item for group in groups.values() for item in group]
+    return groups
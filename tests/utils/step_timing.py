@@ -0,0 +1,101 @@
+import contextlib
+import json
+import time
+from pathlib import Path
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+_enabled = False
+_current_test = {"nodeid": None, "tcid": None}
+_records = []
+
+def enable_step_timing(enabled=True):
+    global _enabled
+    _enabled = enabled
+
+def step_timing_enabled():
+    return _enabled
+
+def current_test():
+    """Return (nodeid, tcid) of the running test."""
+
+    return _current_test["nodeid"], _current_test["tcid"]
+
+def set_current_test(nodeid, tcid=None):
+    """Attribute the steps recorded from now on to this test."""
+
+    _current_test["nodeid"] = nodeid
+    _current_test["tcid"] = tcid
+
+@contextlib.contextmanager
+def step(name):
+    """Record how long the wrapped block takes, tagged with the running test; no-op when disabled.
+
+    Also usable as a decorator (`@step("enter review mode")`).
+    """
+    if not _enabled:
+        yield
+        return
+
+    start = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        record_step(name, time.perf_counter() - start, ok)
+
+def record_step(name, duration_s, ok=True):
+    """Record a duration measured elsewhere (e.g. in the page) as a step of the running test; no-op when disabled."""
+
+    if not _enabled:
+        return
+    _records.append({
+        "nodeid": _current_test["nodeid"],
+        "tcid": _current_test["tcid"],
+        "step": name,
+        "duration_s": round(duration_s, 4),
+        "ok": ok,
+    })
+
+def time_first_render(driver, locator, name="first card render", timeout=5):
+    """Record how long `locator` takes to appear after a navigation; never fails the test."""
+
+    if not _enabled:
+        return
+    with step(name), contextlib.suppress(TimeoutException):
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
+
+def recorded_steps():
+    return list(_records)
+
+def rank_steps(records, limit=20):
+    """Aggregate records by step name, slowest total time first."""
+
+    by_step = {}
+    for r in records:
+        agg = by_step.setdefault(r["step"], {"step": r["step"], "count": 0, "total_s": 0.0, "max_s": 0.0, "slowest_test": None})
+        agg["count"] += 1
+        agg["total_s"] += r["duration_s"]
+        if r["duration_s"] >= agg["max_s"]:
+            agg["max_s"] = r["duration_s"]
+            agg["slowest_test"] = r["tcid"] or r["nodeid"]
+
+    ranking = sorted(by_step.values(), key=lambda agg: -agg["total_s"])[:limit]
+    for agg in ranking:
+        agg["mean_s"] = round(agg["total_s"] / agg["count"], 4)
+        agg["total_s"] = round(agg["total_s"], 3)
+    return ranking
+
+def write_report(path, records):
+    """Write every recorded step plus the per-step ranking to a JSON file."""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "slowest_steps": rank_steps(records),
+        "slowest_single": sorted(records, key=lambda r: -r["duration_s"])[:20],
+        "steps": records,
+    }
+    path.write_text(json.dumps(report, indent=2, ensure_ascii=False))
@@ -0,0 +1,198 @@
+import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from selenium.common.exceptions import WebDriverException
+from tests.utils import http_client
+from tests.utils.auth_flows import LoginApiUnavailable, fetch_auth_cookie, get_auth_token
+
+RESET_WORKERS = 8
+
+logger = logging.getLogger(__name__)
+
+_active_tracker = None
+
+class StudyStateTracker:
+    """Which (user, study type, level) scopes tests have touched, so only those get reset.
+
+    Rationale: The `_with_level_reset` flows reset their level before every
+    test, even when the previous test left it clean. With tracking on, the
+    flows mark a scope dirty when they open it. Teardown resets all dirty
+    scopes in one concurrent batch, and the next test that needs the scope
+    clean skips its reset. Scopes the tracker has not seen yet count as dirty.
+    Tests also change state outside the flow helpers (plain `driver.get`,
+    direct resets), so a skip is only taken after the backend confirms the
+    scope has no progress rows.
+
+    The tracker talks to the API with the user's token from the login API.
+    Where that route is unusable it borrows the `token` cookie of the last
+    browser that opened one of the user's scopes.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self._lock = threading.Lock()
+        self._credentials = {}   # email -> password
+        self._drivers = weakref.WeakValueDictionary()   # email -> driver
+        self._login_api = True
+        self._dirty = set()      # (email, type, LEVEL)
+        self._clean = set()
+
+    def _scope(self, email, password, type, level, driver=None):
+        key = (email.lower(), type, level.upper())
+        with self._lock:
+            self._credentials[key[0]] = password
+            if driver is not None:
+                self._drivers[key[0]] = driver
+        return key
+
+    def mark_dirty(self, email, password, type, level, driver=None):
+        key = self._scope(email, password, type, level, driver)
+        with self._lock:
+            self._clean.discard(key)
+            self._dirty.add(key)
+
+    def is_clean(self, email, type, level):
+        with self._lock:
+            return (email.lower(), type, level.upper()) in self._clean
+
+    def ensure_clean(self, email, password, type, level, driver=None):
+        """Reset the scope unless it is known to be clean and still empty; returns True if a reset was sent."""
+
+        key = self._scope(email, password, type, level, driver)
+        with self._lock:
+            known_clean = key in self._clean
+        if known_clean and self._still_empty(key):
+            return False
+        self._reset(key)
+        return True
+
+    def reset_dirty(self):
+        """Reset every dirty scope in one concurrent batch; returns how many were reset."""
+
+        with self._lock:
+            scopes, self._dirty = list(self._dirty), set()
+        if not scopes:
+            return 0
+        with ThreadPoolExecutor(max_workers=min(RESET_WORKERS, len(scopes))) as pool:
+            results = list(pool.map(self._reset_quietly, scopes))
+        return sum(results)
+
+    def snapshot(self, email, password, type, level):
+        """Return the scope's progress rows as the API reports them."""
+
+        self._scope(email, password, type, level)
+        r = http_client.get(
+            f"{self.base_url}/api/study-progress",
+            params={"type": type, "level": level},
+            cookies=self._cookies(email),
+            timeout=5,
+        )
+        r.raise_for_status()
+        return r.json()
+
+    def restore(self, email, password, type, level, rows):
+        """Replace the scope's progress with `rows` from `snapshot` (or written by hand).
+
+        Lets a test start mid-cycle without clicking through the earlier
+        words. The scope is marked dirty, so it is reset at teardown.
+        """
+        key = self._scope(email, password, type, level)
+        self._reset(key)
+        self.mark_dirty(email, password, type, level)
+        cookies = self._cookies(email)
+
+        def write(row):
+            r = http_client.post(
+                f"{self.base_url}/api/study-progress",
+                json={"wordId": row["wordId"], "type": type, "level": level, "completed": bool(row.get("completed"))},
+                cookies=cookies,
+                timeout=5,
+            )
+            r.raise_for_status()
+
+        if rows:
+            with ThreadPoolExecutor(max_workers=min(RESET_WORKERS, len(rows))) as pool:
+                list(pool.map(write, rows))
+
+    def _cookies(self, email):
+        """Auth cookies for `email`: the login API's token, else the token of a browser the user is logged in on."""
+
+        if self._login_api:
+            try:
+                cookie = fetch_auth_cookie(self.base_url, email, self._credentials[email.lower()])
+                return {cookie["name"]: cookie["value"]}
+            except LoginApiUnavailable:
+                # The route will not appear mid-session; skip the failing POST from now on
+                self._login_api = False
+        driver = self._drivers.get(email.lower())
+        token = get_auth_token(driver, timeout=0) if driver is not None else None
+        if not token:
+            raise LoginApiUnavailable(f"No login API and no logged-in browser to borrow a token for {email} from")
+        return {"token": token}
+
+    def _still_empty(self, key):
+        """Confirm with one cheap read that the scope has no progress rows."""
+
+        email, type, level = key
+        try:
+            r = http_client.get(
+                f"{self.base_url}/api/study-progress",
+                params={"type": type, "level": level},
+                cookies=self._cookies(email),
+                timeout=5,
+            )
+            r.raise_for_status()
+            return not r.json()
+        except (requests.RequestException, LoginApiUnavailable, WebDriverException, ValueError):
+            return False
+
+    def _reset(self, key):
+        email, type, level = key
+        r = http_client.post(
+            f"{self.base_url}/api/study-progress/reset",
+            params={"type": type, "level": level},
+            cookies=self._cookies(email),
+            timeout=5,
+        )
+        r.raise_for_status()
+        with self._lock:
+            self._dirty.discard(key)
+            self._clean.add(key)
+
+    def _reset_quietly(self, key):
+        """Teardown variant of `_reset`: a failure (e.g. the account was deleted) is logged, not raised."""
+
+        try:
+            self._reset(key)
+            return 1
+        except (requests.RequestException, LoginApiUnavailable, WebDriverException) as exc:
+            logger.warning("Could not reset study progress for %s: %s", key, exc)
+            return 0
+
+def set_active_tracker(tracker):
+    """Install the tracker the flow helpers consult (None turns tracking off)."""
+
+    global _active_tracker
+    _active_tracker = tracker
+
+def active_tracker():
+    return _active_tracker
+
+def mark_dirty(email, password, type, level, driver=None):
+    """Record that a test is working in this scope; no-op unless tracking is on.
+
+    Pass the `driver` the user is logged in on so the tracker can borrow its
+    token when the login API is unusable.
+    """
+    if _active_tracker is not None:
+        _active_tracker.mark_dirty(email, password, type, level, driver)
+
+def ensure_clean(email, password, type, level, driver=None):
+    """Make the scope clean through the tracker; returns False when tracking is off so the caller resets itself."""
+
+    if _active_tracker is None:
+        return False
+    _active_tracker.ensure_clean(email, password, type, level, driver)
+    return True
@@ -0,0 +1,109 @@
+import re
+import threading
+from collections import namedtuple
+from tests.utils import http_client
+
+Word = namedtuple("Word", ["id", "level", "kanji", "furigana", "answer_in_example"])
+
+ANSWER_FIELDS = ("kanji", "furigana", "answer_in_example")
+STUDY_URL_LEVEL = re.compile(r"/study/[^/]+/([^/?#]+)")
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+class WordCatalog:
+    """Session-wide word lookup that loads each level with one bulk request.
+
+    Rationale: The quiz and fill helpers used to call `/api/words/{id}` for
+    every question and again on every retry. The catalog fetches a whole level
+    once (`/api/words?level=N2`), keeps only the fields the tests answer with
+    and indexes them by id, so looking up an answer is a dict access. Words
+    whose level is unknown, or whose level cannot be bulk-loaded, are fetched
+    one by one and cached the same way.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self._words = {}
+        self._loaded_levels = set()
+        self._lock = threading.Lock()
+
+    def get(self, word_id, level=None):
+        """Return the `Word` for `word_id`, loading its level on first use."""
+
+        word_id = str(word_id)
+        word = self._words.get(word_id)
+        if word is not None:
+            return word
+
+        if level is not None:
+            self.load_level(level)
+            word = self._words.get(word_id)
+            if word is not None:
+                return word
+
+        r = http_client.get(f"{self.base_url}/api/words/{word_id}", timeout=5)
+        r.raise_for_status()
+        return self._store(r.json(), level)
+
+    def answer(self, word_id, field, level=None):
+        """Return the precomputed answer key (`kanji`, `furigana` or `answer_in_example`) for a word."""
+
+        if field not in ANSWER_FIELDS:
+            raise ValueError(f"Unsupported answer field: {field}")
+        return getattr(self.get(word_id, level), field)
+
+    def word_ids(self, level):
+        """Return the ids of every word loaded for `level`."""
+
+        self.load_level(level)
+        return [word.id for word in self._words.values() if word.level == level.upper()]
+
+    def load_level(self, level):
+        """Bulk-load every word of `level` once; later calls are no-ops."""
+
+        level = level.upper()
+        with self._lock:
+            if level in self._loaded_levels:
+                return
+            # Marked even on failure so a level without bulk support is not re-requested per question
+            self._loaded_levels.add(level)
+
+            r = http_client.get(f"{self.base_url}/api/words", params={"level": level}, timeout=10)
+            if r.status_code != 200:
+                return
+            payload = r.json()
+            words = payload.get("words", []) if isinstance(payload, dict) else payload
+            for item in words:
+                if isinstance(item, dict) and "id" in item:
+                    self._store(item, level)
+
+    def _store(self, item, level=None):
+        word = Word(
+            id=str(item["id"]),
+            level=(item.get("level") or level or "").upper(),
+            kanji=(item.get("kanji") or "").strip(),
+            furigana=(item.get("furigana") or "").strip(),
+            answer_in_example=(item.get("answer_in_example") or "").strip(),
+        )
+        self._words[word.id] = word
+        return word
+
+def catalog_for(base_url):
+    """Return the shared catalog for `base_url`."""
+
+    with _catalogs_lock:
+        if base_url not in _catalogs:
+            _catalogs[base_url] = WordCatalog(base_url)
+        return _catalogs[base_url]
+
+def level_from_url(url):
+    """Extract the level from a study page URL (e.g. '/study/quiz/n2/kanji-to-furigana' -> 'n2')."""
+
+    match = STUDY_URL_LEVEL.search(url or "")
+    return match.group(1) if match else None
+
+def answer_for_current_word(driver, base_url, word_id, field):
+    """Return the answer key for the word shown on the current study page."""
+
+    return catalog_for(base_url).answer(word_id, field, level_from_url(driver.current_url))
@@ -0,0 +1,72 @@
+import contextlib
+import datetime
+import os
+from tests.utils import http_client
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from tests.utils.auth_flows import fill_and_submit_signup, login, make_unique_username
+from tests.utils.email_verification import fetch_verify_url_from_mailhog
+from tests.pages.auth import RESEND_BTN, VERIFIED_MSG
+
+SUBJECT = "NORI Email Verification"
+
+def current_worker_id():
+    """Return the pytest-xdist worker id (e.g. 'gw0'), or 'master' when not running in parallel."""
+
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+def worker_credentials(worker_id):
+    """Return (email, password, needs_provisioning) for the account reserved for `worker_id`.
+
+    The serial run keeps using ADMIN_EMAIL/ADMIN_PASSWORD. Each xdist worker
+    gets its own account: ADMIN_EMAIL_<WORKER>/ADMIN_PASSWORD_<WORKER> when
+    set (e.g. ADMIN_EMAIL_GW0), otherwise a plus-addressed TEST1_EMAIL account
+    that is signed up and verified on first use.
+    """
+    if worker_id == "master":
+        return os.getenv("ADMIN_EMAIL"), os.getenv("ADMIN_PASSWORD"), False
+
+    suffix = worker_id.upper()
+    email = os.getenv(f"ADMIN_EMAIL_{suffix}")
+    password = os.getenv(f"ADMIN_PASSWORD_{suffix}")
+    if email and password:
+        return email, password, False
+
+    base = os.getenv("TEST1_EMAIL")
+    return f"{base}+{worker_id}@gmail.com", os.getenv("TEST1_PASSWORD"), True
+
+def is_verified(base_url, email):
+    """Return True/False for an existing account's verification state, or None if the account is unknown."""
+
+    r = http_client.get(f"{base_url}/api/auth/verify", params={"email": email}, timeout=5)
+    if r.status_code != 200:
+        return None
+    return r.json().get("isVerified")
+
+def ensure_verified_account(driver, base_url, email, password):
+    """Sign up and verify `email` unless it already exists as a verified account."""
+
+    state = is_verified(base_url, email)
+    if state is True:
+        return
+
+    since = datetime.datetime.now(datetime.timezone.utc)
+    if state is None:
+        fill_and_submit_signup(driver, base_url, make_unique_username("Worker"), email, password)
+    else:
+        # Left unverified by an interrupted run - ask for a fresh link instead of signing up again
+        login(driver, base_url, email, password)
+        WebDriverWait(driver, 5).until(EC.element_to_be_clickable(RESEND_BTN)).click()
+    _accept_alert_if_present(driver)
+
+    verify_url = fetch_verify_url_from_mailhog(email, SUBJECT, timeout_s=30, since=since)
+    driver.get(verify_url)
+    WebDriverWait(driver, 5).until(
+        EC.presence_of_element_located(VERIFIED_MSG),
+        f"Worker account {email} could not be verified"
+    )
+
+def _accept_alert_if_present(driver, timeout=3):
+    with contextlib.suppress(Exception):
+        WebDriverWait(driver, timeout).until(EC.alert_is_present())
+        driver.switch_to.alert.accept()